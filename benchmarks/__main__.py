@@ -0,0 +1,46 @@
+"""
+Run micro-benchmarks of mops against mocked drivers and write results into the JSON file.
+
+Usage:
+    python -m benchmarks
+    python -m benchmarks --driver selenium --benchmark page --output results.json
+    python -m benchmarks --compare previous_results.json
+"""
+import argparse
+import sys
+
+from benchmarks.harness import DEFAULT_REPEAT, DEFAULT_THRESHOLD, MOCKED_DRIVERS, compare, load, print_results, run, save
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Micro-benchmarks of mops overhead')
+    parser.add_argument('--driver', action='append', choices=list(MOCKED_DRIVERS), help='mocked driver; all by default')
+    parser.add_argument('--benchmark', '-k', default='', help='run benchmarks, which names contain given substring')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='count of measurements')
+    parser.add_argument('--output', '-o', default='benchmark_results.json', help='path of the JSON results file')
+    parser.add_argument('--compare', help='path of previous JSON results to compare with; exits with 1 on regression')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='allowed slowdown ratio')
+    args = parser.parse_args()
+
+    import benchmarks.suite  # noqa: registers benchmarks
+    from benchmarks.harness import BENCHMARKS
+
+    names = [name for name in BENCHMARKS if args.benchmark in name]
+    results = run(drivers=args.driver or list(MOCKED_DRIVERS), names=names, repeat=args.repeat)
+    save(results, args.output)
+    print_results(results)
+    print(f'\nResults are saved into {args.output}')
+
+    if args.compare:
+        regressions = compare(results, load(args.compare), threshold=args.threshold)
+
+        for regression in regressions:
+            print(f'Regression: {regression}')
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+Harness of micro-benchmarks, that measure the pure-Python overhead of mops against mocked drivers.
+
+Each benchmark is a context manager registered by :func:`benchmark`. It receives the mocked
+driver wrapper and yields the callable to measure. Benchmarks of each driver are executed within
+a separate process, because statics of mops objects are shared between driver wrappers of the process.
+"""
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from multiprocessing import get_context
+from typing import Callable, ContextManager, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import mops
+
+from tests.static_tests.mocked_drivers import (
+    android_capabilities,
+    get_mocked_appium_driver,
+    get_mocked_play_driver,
+    get_mocked_selenium_driver,
+    ios_capabilities,
+    reset_sessions,
+)
+
+
+MOCKED_DRIVERS = {
+    'selenium': get_mocked_selenium_driver,
+    'playwright': get_mocked_play_driver,
+    'ios': lambda: get_mocked_appium_driver(ios_capabilities),
+    'android': lambda: get_mocked_appium_driver(android_capabilities),
+}
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.1
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable[..., ContextManager[Callable]]
+    drivers: Tuple[str, ...]
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, drivers: Iterable[str] = tuple(MOCKED_DRIVERS)) -> Callable:
+    """
+    Register the benchmark
+
+    :param name: unique name of the benchmark
+    :param drivers: names of mocked drivers to run the benchmark with
+    :return: decorator of the generator function, that receives driver wrapper and yields the callable to measure
+    """
+    def decorator(setup: Callable) -> Callable:
+        BENCHMARKS[name] = Benchmark(name, contextmanager(setup), tuple(drivers))
+        return setup
+
+    return decorator
+
+
+def measure(func: Callable, repeat: int = DEFAULT_REPEAT, number: Optional[int] = None) -> dict:
+    """
+    Measure the duration of the callable
+
+    :param func: callable to measure
+    :param repeat: count of measurements
+    :param number: count of calls within one measurement. Detected automatically by default
+    :return: dict with count of calls and min/median/mean duration of one call in microseconds
+    """
+    timer = timeit.Timer(func)
+    number = number or timer.autorange()[0]
+    timings = [timing / number * 1e6 for timing in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'number': number,
+        'repeat': repeat,
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.mean(timings),
+    }
+
+
+def run_driver_benchmarks(driver_name: str, names: Iterable[str], repeat: int = DEFAULT_REPEAT) -> Dict[str, dict]:
+    """
+    Run benchmarks with given mocked driver within the current process
+
+    :param driver_name: name of the mocked driver
+    :param names: names of benchmarks to run
+    :param repeat: count of measurements
+    :return: dict, where key is the benchmark name and value is the measurement
+    """
+    import benchmarks.suite  # noqa: registers benchmarks
+
+    driver_wrapper = MOCKED_DRIVERS[driver_name]()
+    results = {}
+
+    try:
+        for name in names:
+            case = BENCHMARKS[name]
+
+            if driver_name in case.drivers:
+                with case.setup(driver_wrapper) as func:
+                    results[name] = measure(func, repeat=repeat)
+    finally:
+        reset_sessions()
+
+    return results
+
+
+def run(
+        drivers: Iterable[str] = tuple(MOCKED_DRIVERS),
+        names: Optional[Iterable[str]] = None,
+        repeat: int = DEFAULT_REPEAT,
+) -> dict:
+    """
+    Run benchmarks for each driver within a separate process
+
+    :param drivers: names of mocked drivers
+    :param names: names of benchmarks to run. All benchmarks by default
+    :param repeat: count of measurements
+    :return: dict with the environment info and results per driver
+    """
+    import benchmarks.suite  # noqa: registers benchmarks
+
+    names = list(names or BENCHMARKS)
+    results = {}
+
+    for driver_name in drivers:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+            results[driver_name] = executor.submit(run_driver_benchmarks, driver_name, names, repeat).result()
+
+    return {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'commit': get_commit(),
+            'mops': mops.__version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+
+
+def compare(current: dict, previous: dict, threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    Find benchmarks, that are slower than the previous results
+
+    :param current: current results of :func:`run`
+    :param previous: previous results of :func:`run`
+    :param threshold: allowed ratio of slowdown of the median duration
+    :return: list of regression descriptions
+    """
+    regressions = []
+
+    for driver_name, results in current['results'].items():
+        previous_results = previous['results'].get(driver_name, {})
+
+        for name, result in results.items():
+            if name not in previous_results:
+                continue
+
+            previous_median, median = previous_results[name]['median'], result['median']
+
+            if median > previous_median * (1 + threshold):
+                regressions.append(
+                    f'{driver_name}: {name} {previous_median:.2f} us -> {median:.2f} us '
+                    f'(+{(median / previous_median - 1) * 100:.0f}%)'
+                )
+
+    return regressions
+
+
+def save(results: dict, path: str) -> None:
+    """
+    Write results of :func:`run` into the JSON file
+
+    :param results: results of :func:`run`
+    :param path: path of the file
+    """
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2)
+
+
+def load(path: str) -> dict:
+    """
+    Read results of :func:`run` from the JSON file
+
+    :param path: path of the file
+    :return: results of :func:`run`
+    """
+    with open(path) as file:
+        return json.load(file)
+
+
+def get_commit() -> Optional[str]:
+    """
+    Get hash of the current git commit
+
+    :return: commit hash or None, if it is not available
+    """
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: dict, file=sys.stdout) -> None:
+    """
+    Print results of :func:`run` as a table
+
+    :param results: results of :func:`run`
+    :param file: stream to print into
+    """
+    for driver_name, driver_results in results['results'].items():
+        print(f'\n{driver_name}:', file=file)
+
+        for name, result in driver_results.items():
+            print(f'  {name:<40} {result["median"]:>10.2f} us  (min {result["min"]:.2f} us)', file=file)
@@ -0,0 +1,260 @@
+"""
+Micro-benchmarks of mops overhead. Registered by importing of the module.
+"""
+import logging
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy
+
+from mops.base.element import Element
+from mops.base.group import Group
+from mops.base.page import Page
+from mops.exceptions import NotInitializedException, TimeoutException
+from mops.mixins.objects.comparison_engine import PerceptualHashEngine, PixelDiffEngine, SSIMEngine
+from mops.mixins.objects.polling_strategy import FixedPolling
+from mops.mixins.objects.wait_result import Result
+from mops.utils import logs
+from mops.utils.internal_utils import safe_getattribute, wait_condition
+from mops.utils.selector_synchronizer import APPIUM_ENGINE, PLAYWRIGHT_ENGINE, SELENIUM_ENGINE, compile_locator
+
+from benchmarks.harness import benchmark
+
+
+ELEMENTS_COUNT = 50
+WAIT_ITERATIONS = 10
+SCREENSHOT_SIZE = (800, 1280)
+COMPARISON_ENGINES = {
+    'ssim': SSIMEngine(),
+    'pixel_diff': PixelDiffEngine(),
+    'phash': PerceptualHashEngine(),
+}
+
+
+class BenchGroup(Group):
+    def __init__(self):
+        super().__init__('.group', name='bench group')
+
+    title = Element('.title', name='title')
+    description = Element('.description', name='description')
+    submit = Element('//button[@type="submit"]', name='submit')
+    cancel = Element('text=Cancel', name='cancel')
+
+
+class BenchPage(Page):
+    def __init__(self):
+        super().__init__('.page', name='bench page')
+
+    header = Element('.header', name='header', wait=True)
+    logo = Element('.logo', name='logo', parent=header)
+    search = Element('#search', name='search')
+    menu = Element('.menu', name='menu')
+    footer = Element('.footer', name='footer')
+    first_group = BenchGroup()
+    second_group = BenchGroup()
+
+
+class LazyBenchPage(BenchPage):
+    lazy_children = True
+
+
+class GuardedElement(Element):
+    """ Element with the initialization check for each attribute access, as before 3.2.0 """
+
+    def __getattribute__(self, item):
+        if 'element' in item and not safe_getattribute(self, '_initialized'):
+            raise NotInitializedException(f'{repr(self)} object is not initialized')
+
+        return safe_getattribute(self, item)
+
+
+class WaitObject:
+    """ Object with the condition, that is satisfied after given count of checks """
+
+    def __init__(self, iterations: int):
+        self.iterations = iterations
+        self.checks = 0
+        self.driver_wrapper = SimpleNamespace(is_appium=False, polling_strategy=None, browser_side_waits=False)
+        self.polling_strategy = FixedPolling(delay=0)
+
+    def log(self, *args, **kwargs):
+        pass
+
+    @wait_condition
+    def wait_checks(self, *, timeout: int = 1, silent: bool = False):  # noqa
+        self.checks += 1
+        return Result(  # noqa
+            execution_result=self.checks % self.iterations == 0,
+            log='Wait checks',
+            exc=TimeoutException('Checks are not finished'),
+        )
+
+
+@benchmark('page.construction')
+def page_construction(driver_wrapper):
+    yield BenchPage
+
+
+@benchmark('page.lazy_construction')
+def lazy_page_construction(driver_wrapper):
+    yield LazyBenchPage
+
+
+@benchmark('group.construction')
+def group_construction(driver_wrapper):
+    yield BenchGroup
+
+
+@benchmark('element.construction')
+def element_construction(driver_wrapper):
+    yield lambda: Element('.element', name='element')
+
+
+@benchmark('locator.compilation')
+def locator_compilation(driver_wrapper):
+    engine = _get_engine(driver_wrapper)
+    yield lambda: compile_locator.__wrapped__('//div[@class="item"]', engine)
+
+
+@benchmark('locator.compilation_cached')
+def cached_locator_compilation(driver_wrapper):
+    engine = _get_engine(driver_wrapper)
+    yield lambda: compile_locator('//div[@class="item"]', engine)
+
+
+@benchmark('element.attribute_access')
+def element_attribute_access(driver_wrapper):
+    element = Element('.element', name='element')
+
+    def access():
+        return element.name, element.locator, element.driver_wrapper, element.parent, element.log
+
+    yield access
+
+
+@benchmark('element.attribute_access_guarded')
+def guarded_element_attribute_access(driver_wrapper):
+    element = GuardedElement('.element', name='element')
+
+    def access():
+        return element.name, element.locator, element.driver_wrapper, element.parent, element.log
+
+    yield access
+
+
+@benchmark('element.all_elements_wrapping')
+def all_elements_wrapping(driver_wrapper):
+    element = Element('.element', name='element')
+
+    if driver_wrapper.is_playwright:
+        locator = MagicMock()
+        locator.count.return_value = ELEMENTS_COUNT
+        element.element = locator
+    else:
+        sources = [MagicMock() for _ in range(ELEMENTS_COUNT)]
+        element._find_elements = lambda: sources
+
+    yield lambda: list(element.all_elements)
+
+
+@benchmark('logging.disabled')
+def logging_disabled(driver_wrapper):
+    element = Element('.element', name='element')
+
+    with _logger_level(logging.WARNING):
+        yield lambda: element.log('Click into "%s"', element.name)
+
+
+@benchmark('logging.enabled')
+def logging_enabled(driver_wrapper):
+    element = Element('.element', name='element')
+
+    with _logger_level(logging.INFO):
+        yield lambda: element.log('Click into "%s"', element.name)
+
+
+@benchmark('logging.enabled_without_code_info')
+def logging_enabled_without_code_info(driver_wrapper):
+    element = Element('.element', name='element')
+    logs.set_code_info_capture(False)
+
+    try:
+        with _logger_level(logging.INFO):
+            yield lambda: element.log('Click into "%s"', element.name)
+    finally:
+        logs.set_code_info_capture(True)
+
+
+@benchmark('wait_condition.instant')
+def wait_condition_instant(driver_wrapper):
+    wait_object = WaitObject(iterations=1)
+    yield lambda: wait_object.wait_checks(silent=True)
+
+
+@benchmark(f'wait_condition.{WAIT_ITERATIONS}_iterations')
+def wait_condition_iterations(driver_wrapper):
+    wait_object = WaitObject(iterations=WAIT_ITERATIONS)
+    yield lambda: wait_object.wait_checks(silent=True)
+
+
+@benchmark('element.wait_visibility_instant', drivers=('selenium', 'ios', 'android'))
+def element_wait_visibility(driver_wrapper):
+    element = Element('.element', name='element')
+    element.is_displayed = lambda **kwargs: True
+    yield lambda: element.wait_visibility(silent=True)
+
+
+def _register_comparison_benchmarks():
+    """ Register benchmarks of each comparison engine with identical, slightly and heavily changed screenshots """
+    reference = _get_flat_screenshot()
+    changed_button = reference.copy()
+    changed_button[600:640, 100:260] = (40, 160, 40)
+    shifted_content = numpy.roll(reference, 1, axis=0)
+    cases = {'identical': reference.copy(), 'changed_button': changed_button, 'shifted_content': shifted_content}
+
+    for engine_name, engine in COMPARISON_ENGINES.items():
+        for case_name, actual in cases.items():
+
+            @benchmark(f'comparison.{engine_name}.{case_name}', drivers=('selenium',))
+            def compare(driver_wrapper, engine=engine, actual=actual):
+                yield lambda: engine.get_difference(reference, actual, 0, (0, 255, 0))
+
+
+def _get_flat_screenshot():
+    """ Get the BGR image, that looks like a flat UI screenshot: solid background, header, cards and text lines """
+    image = numpy.full((*SCREENSHOT_SIZE, 3), 250, dtype='uint8')
+    image[:64] = (60, 40, 30)
+    for left in range(40, SCREENSHOT_SIZE[1] - 300, 320):
+        image[120:560, left:left + 280] = 255
+        for top in range(150, 520, 24):
+            image[top:top + 8, left + 20:left + 240] = 70
+    image[600:640, 100:260] = (200, 120, 30)
+    return image
+
+
+_register_comparison_benchmarks()
+
+
+def _get_engine(driver_wrapper) -> str:
+    if driver_wrapper.is_playwright:
+        return PLAYWRIGHT_ENGINE
+
+    return APPIUM_ENGINE if driver_wrapper.is_appium else SELENIUM_ENGINE
+
+
+@contextmanager
+def _logger_level(level: int):
+    """ Set level of mops logger with a handler, that drops the records """
+    handler = logging.NullHandler()
+    previous_level, previous_propagate = logs.logger.level, logs.logger.propagate
+    logs.logger.setLevel(level)
+    logs.logger.propagate = False
+    logs.logger.addHandler(handler)
+
+    try:
+        yield
+    finally:
+        logs.logger.removeHandler(handler)
+        logs.logger.setLevel(previous_level)
+        logs.logger.propagate = previous_propagate
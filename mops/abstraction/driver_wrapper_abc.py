@@ -7,18 +7,19 @@ from typing import List, Union, Any, Tuple, TYPE_CHECKING
 from playwright.sync_api import Page as PlaywrightPage
 
 from mops.mixins.objects.box import Box
+from mops.mixins.objects.comparison_engine import ComparisonEngine
 from selenium.webdriver.common.alert import Alert
 from PIL import Image
 
 from mops.mixins.objects.size import Size
-from mops.utils.internal_utils import WAIT_EL, WAIT_UNIT
+from mops.utils.internal_utils import WAIT_EL, WAIT_UNIT, CachedAttributesMeta
 
 if TYPE_CHECKING:
     from mops.base.driver_wrapper import DriverWrapper, DriverWrapperSessions
     from mops.base.element import Element
 
 
-class DriverWrapperABC(ABC):
+class DriverWrapperABC(ABC, metaclass=CachedAttributesMeta):
     session: Union[DriverWrapperSessions, None] = None
     label: Union[str, None] = None
     original_tab: Union[str, PlaywrightPage, None] = None
@@ -257,6 +258,17 @@ class DriverWrapperABC(ABC):
         """
         raise NotImplementedError()
 
+    def set_script_timeout(self, timeout: Union[int, float] = 30) -> DriverWrapper:
+        """
+        Set the maximum time to wait for an asynchronous script to finish execution before throwing an error.
+        Selenium/Appium only.
+
+        :param timeout: The timeout duration to set, in seconds.
+        :type timeout: typing.Union[int, float]
+        :return: :obj:`.DriverWrapper` - The current instance of the driver wrapper.
+        """
+        raise NotImplementedError()
+
     def set_window_size(self, size: Size) -> DriverWrapper:
         """
         Set the inner window size (viewport) of the current browser context.
@@ -317,6 +329,7 @@ class DriverWrapperABC(ABC):
             remove: Union[Element, List[Element]] = None,
             cut_box: Box = None,
             hide: Union[Element, List[Element]] = None,
+            engine: ComparisonEngine = None,
     ) -> None:
         """
         Asserts that the given screenshot matches the currently taken screenshot.
@@ -334,7 +347,7 @@ class DriverWrapperABC(ABC):
           If :obj:`None` - takes default threshold or calculate its automatically based on screenshot size.
         :type threshold: typing.Optional[int or float]
         :param delay: The delay in seconds before taking the screenshot.
-          If :obj:`None` - takes default delay.
+          If :obj:`None` - takes default delay, or no delay if `VisualComparison.stable_screenshot` is enabled.
         :type delay: typing.Optional[int or float]
         :param remove: :class:`Element` to remove from the screenshot.
           Can be a single element or a list of elements.
@@ -345,6 +358,9 @@ class DriverWrapperABC(ABC):
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
         :type hide: typing.Optional[Element or typing.List[Element]]
+        :param engine: The engine to calculate the difference between screenshots.
+          If :obj:`None` - takes `VisualComparison.comparison_engine`.
+        :type engine: typing.Optional[ComparisonEngine]
         :return: :obj:`None`
         """
         raise NotImplementedError()
@@ -359,6 +375,7 @@ class DriverWrapperABC(ABC):
             remove: Union[Element, List[Element]] = None,
             cut_box: Box = None,
             hide: Union[Element, List[Element]] = None,
+            engine: ComparisonEngine = None,
     ) -> Tuple[bool, str]:
         """
         Compares the currently taken screenshot to the expected screenshot and returns a result.
@@ -376,7 +393,7 @@ class DriverWrapperABC(ABC):
           If :obj:`None` - takes default threshold or calculate its automatically based on screenshot size.
         :type threshold: typing.Optional[int or float]
         :param delay: The delay in seconds before taking the screenshot.
-          If :obj:`None` - takes default delay.
+          If :obj:`None` - takes default delay, or no delay if `VisualComparison.stable_screenshot` is enabled.
         :type delay: typing.Optional[int or float]
         :param remove: :class:`Element` to remove from the screenshot.
         :type remove: typing.Optional[Element or typing.List[Element]]
@@ -385,6 +402,9 @@ class DriverWrapperABC(ABC):
         :type cut_box: typing.Optional[Box]
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
+        :param engine: The engine to calculate the difference between screenshots.
+          If :obj:`None` - takes `VisualComparison.comparison_engine`.
+        :type engine: typing.Optional[ComparisonEngine]
         :return: :class:`typing.Tuple` (:class:`bool`, :class:`str`) - result state and result message
         """
         raise NotImplementedError()
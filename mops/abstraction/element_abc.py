@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Union, Any, List, Tuple, Optional, TYPE_CHECKING
+from typing import Union, Any, List, Tuple, Optional, Iterable, TYPE_CHECKING
 
 from PIL.Image import Image
 from appium.webdriver.extensions.location import Location
 
 from mops.mixins.objects.box import Box
+from mops.mixins.objects.comparison_engine import ComparisonEngine
+from mops.mixins.objects.elements_sequence import ElementsSequence
+from mops.mixins.objects.polling_strategy import PollingStrategy
 from mops.mixins.objects.scrolls import ScrollTo, ScrollTypes
 from selenium.webdriver.remote.webelement import WebElement as SeleniumWebElement
 from appium.webdriver.webelement import WebElement as AppiumWebElement
@@ -15,6 +18,7 @@ from playwright.sync_api import Locator as PlayWebElement
 from mops.abstraction.mixin_abc import MixinABC
 from mops.keyboard_keys import KeyboardKeys
 from mops.mixins.objects.size import Size
+from mops.mixins.objects.snapshot import ElementSnapshot
 from mops.utils.internal_utils import WAIT_EL, QUARTER_WAIT_EL
 
 if TYPE_CHECKING:
@@ -52,11 +56,24 @@ class ElementABC(MixinABC, ABC):
         raise NotImplementedError()
 
     @property
-    def all_elements(self) -> Union[List[Element], List[Any]]:
+    def all_elements(self) -> ElementsSequence:
         """
-        Returns a list of all matching elements.
+        Returns a lazy sequence of all matching elements.
 
-        :return: A list of wrapped :class:`Element` objects.
+        Matching elements are wrapped into :class:`Element` objects on access.
+        The sequence supports :func:`len`, indexing, slicing, iteration
+        and the `nth(index)`, `first` and `last` shortcuts.
+
+        **Selenium/Appium:**
+
+        - All matching elements are found within a single call.
+
+        **Playwright:**
+
+        - Indexing is mapped to `locator.nth()`, so matching elements are not fetched in advance.
+          The index is validated by a single `locator.count()` call per sequence.
+
+        :return: A lazy sequence of wrapped :class:`Element` objects.
         """
         raise NotImplementedError()
 
@@ -70,6 +87,7 @@ class ElementABC(MixinABC, ABC):
         **Selenium/Appium:**
 
         Selenium Safari using js click instead.
+        Not interactable, intercepted or stale clicks are retried according to the :class:`.RetryPolicy`.
 
         :param kwargs: compatibility arg for playwright
 
@@ -131,6 +149,10 @@ class ElementABC(MixinABC, ABC):
         """
         Checks the checkbox element.
 
+        **Selenium/Appium:**
+
+        - Not interactable, intercepted or stale clicks are retried according to the :class:`.RetryPolicy`.
+
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -139,11 +161,21 @@ class ElementABC(MixinABC, ABC):
         """
         Unchecks the checkbox element.
 
+        **Selenium/Appium:**
+
+        - Not interactable, intercepted or stale clicks are retried according to the :class:`.RetryPolicy`.
+
         :return: :class:`Element`
         """
         raise NotImplementedError()
 
-    def wait_visibility(self, *, timeout: int = WAIT_EL, silent: bool = False) -> Element:
+    def wait_visibility(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> Element:
         """
         Waits until the element becomes visible.
         **Note:** The method requires the use of named arguments.
@@ -163,11 +195,20 @@ class ElementABC(MixinABC, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+          Not used by Playwright, that awaits the state of the element within the browser.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         raise NotImplementedError()
 
-    def wait_hidden(self, *, timeout: int = WAIT_EL, silent: bool = False) -> Element:
+    def wait_hidden(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> Element:
         """
         Waits until the element becomes hidden.
         **Note:** The method requires the use of named arguments.
@@ -187,11 +228,20 @@ class ElementABC(MixinABC, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+          Not used by Playwright, that awaits the state of the element within the browser.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         raise NotImplementedError()
 
-    def wait_availability(self, *, timeout: int = WAIT_EL, silent: bool = False) -> Element:
+    def wait_availability(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> Element:
         """
         Waits until the element becomes available in DOM tree. \n
         **Note:** The method requires the use of named arguments.
@@ -211,6 +261,9 @@ class ElementABC(MixinABC, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+          Not used by Playwright, that awaits the state of the element within the browser.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -370,6 +423,30 @@ class ElementABC(MixinABC, ABC):
         """
         raise NotImplementedError()
 
+    def snapshot(
+            self,
+            fields: Optional[Iterable[str]] = None,
+            attributes: Iterable[str] = (),
+            silent: bool = False,
+    ) -> ElementSnapshot:
+        """
+        Collect the state of the element within a single call to the browser.
+
+        **Appium:**
+
+        - The state is collected with a separate command for each field in the native context.
+
+        :param fields: The fields to collect: 'text', 'value', 'rect', 'displayed', 'enabled', 'checked'.
+          If :obj:`None` - all fields will be collected.
+        :type fields: typing.Optional[typing.Iterable[str]]
+        :param attributes: The names of attributes to collect, such as 'class', 'href', etc.
+        :type attributes: typing.Iterable[str]
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :return: A frozen snapshot object with the collected state of the element.
+        """
+        raise NotImplementedError()
+
     @property
     def size(self) -> Size:
         """
@@ -476,7 +553,8 @@ class ElementABC(MixinABC, ABC):
             expected_count: int,
             *,
             timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
     ) -> Element:
         """
         Wait until the number of matching elements equals the expected count.
@@ -500,6 +578,8 @@ class ElementABC(MixinABC, ABC):
         :type timeout: typing.Union[int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -509,7 +589,8 @@ class ElementABC(MixinABC, ABC):
             expected_text: Optional[str] = None,
             *,
             timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
     ) -> Element:
         """
         Wait for the presence of a specific text in the current element, or for any non-empty text.
@@ -533,6 +614,8 @@ class ElementABC(MixinABC, ABC):
         :type timeout: typing.Union[int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -542,7 +625,8 @@ class ElementABC(MixinABC, ABC):
             expected_value: Optional[str] = None,
             *,
             timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
     ) -> Element:
         """
         Wait for a specific value in the current element, or for any non-empty value.
@@ -566,6 +650,8 @@ class ElementABC(MixinABC, ABC):
         :type timeout: typing.Union[int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -630,7 +716,13 @@ class ElementABC(MixinABC, ABC):
         """
         raise NotImplementedError()
 
-    def wait_enabled(self, *, timeout: Union[int, float] = WAIT_EL, silent: bool = False) -> Element:
+    def wait_enabled(
+            self,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> Element:
         """
         Wait for the element to become enabled and/or clickable.
 
@@ -651,11 +743,19 @@ class ElementABC(MixinABC, ABC):
         :type timeout: typing.Union[int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         raise NotImplementedError()
 
-    def wait_disabled(self, *, timeout: Union[int, float] = WAIT_EL, silent: bool = False) -> Element:
+    def wait_disabled(
+            self,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> Element:
         """
         Wait for the element to become disabled.
 
@@ -676,6 +776,8 @@ class ElementABC(MixinABC, ABC):
         :type timeout: [int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -685,7 +787,8 @@ class ElementABC(MixinABC, ABC):
             expected_size: Size,
             *,
             timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
     ) -> Element:
         """
         Wait until element size will be equal to given :class:`.Size` object
@@ -709,6 +812,8 @@ class ElementABC(MixinABC, ABC):
         :type timeout: typing.Union[int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -717,8 +822,10 @@ class ElementABC(MixinABC, ABC):
         """
         Checks is the current element's top-left corner or bottom-right corner is visible on the screen.
 
-        :param check_displaying: If :obj:`True`, the :func:`is_displayed` method will be called to further verify
-          visibility. The check will stop if this method returns :obj:`False`.
+        The displaying state, element rect and viewport size are collected within a single call to the browser.
+
+        :param check_displaying: If :obj:`True`, the displaying state of the element will be verified as well.
+          The check will stop if the element is not displayed.
         :type check_displaying: bool
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
@@ -730,8 +837,10 @@ class ElementABC(MixinABC, ABC):
         """
         Check is current element top left corner and bottom right corner visible on current screen
 
-        :param check_displaying: If :obj:`True`, the :func:`is_displayed` method will be called to further verify
-          visibility. The check will stop if this method returns :obj:`False`.
+        The displaying state, element rect and viewport size are collected within a single call to the browser.
+
+        :param check_displaying: If :obj:`True`, the displaying state of the element will be verified as well.
+          The check will stop if the element is not displayed.
         :type check_displaying: bool
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
@@ -739,6 +848,18 @@ class ElementABC(MixinABC, ABC):
         """
         raise NotImplementedError()
 
+    def visibility_ratio(self, silent: bool = False) -> float:
+        """
+        Get the ratio of the element area, that is visible within the current viewport.
+
+        The displaying state, element rect and viewport size are collected within a single call to the browser.
+
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :return: :class:`float` - The ratio from `0` (hidden or out of the viewport) to `1` (fully visible).
+        """
+        raise NotImplementedError()
+
     def scroll_into_view(
             self,
             block: ScrollTo = ScrollTo.CENTER,
@@ -773,6 +894,7 @@ class ElementABC(MixinABC, ABC):
             fill_background: Union[str, bool] = False,
             cut_box: Box = None,
             hide: Union[Element, List[Element]] = None,
+            engine: ComparisonEngine = None,
     ) -> None:
         """
         Asserts that the given screenshot matches the currently taken screenshot.
@@ -790,7 +912,7 @@ class ElementABC(MixinABC, ABC):
           If :obj:`None` - takes default threshold or calculate its automatically based on screenshot size.
         :type threshold: typing.Optional[int, float]
         :param delay: The delay in seconds before taking the screenshot.
-          If :obj:`None` - takes default delay.
+          If :obj:`None` - takes default delay, or no delay if `VisualComparison.stable_screenshot` is enabled.
         :type delay: typing.Optional[int, float]
         :param scroll: Whether to scroll to the element before taking the screenshot.
         :type scroll: bool
@@ -806,6 +928,9 @@ class ElementABC(MixinABC, ABC):
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
         :type hide: typing.Optional[Element or typing.List[Element]]
+        :param engine: The engine to calculate the difference between screenshots.
+          If :obj:`None` - takes `VisualComparison.comparison_engine`.
+        :type engine: typing.Optional[ComparisonEngine]
         :return: :obj:`None`
         """
         raise NotImplementedError()
@@ -822,6 +947,7 @@ class ElementABC(MixinABC, ABC):
             fill_background: Union[str, bool] = False,
             cut_box: Box = None,
             hide: Union[Element, List[Element]] = None,
+            engine: ComparisonEngine = None,
     ) -> Tuple[bool, str]:
         """
         Compares the currently taken screenshot to the expected screenshot and returns a result.
@@ -839,7 +965,7 @@ class ElementABC(MixinABC, ABC):
           If :obj:`None` - takes default threshold or calculate its automatically based on screenshot size.
         :type threshold: typing.Optional[int, float]
         :param delay: The delay in seconds before taking the screenshot.
-          If :obj:`None` - takes default delay.
+          If :obj:`None` - takes default delay, or no delay if `VisualComparison.stable_screenshot` is enabled.
         :type delay: typing.Optional[int, float]
         :param scroll: Whether to scroll to the element before taking the screenshot.
         :type scroll: bool
@@ -853,6 +979,9 @@ class ElementABC(MixinABC, ABC):
         :type cut_box: typing.Optional[Box]
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
+        :param engine: The engine to calculate the difference between screenshots.
+          If :obj:`None` - takes `VisualComparison.comparison_engine`.
+        :type engine: typing.Optional[ComparisonEngine]
         :return: :class:`typing.Tuple` (:class:`bool`, :class:`str`) - result state and result message
         """
         raise NotImplementedError()
@@ -868,12 +997,20 @@ class ElementABC(MixinABC, ABC):
         """
         raise NotImplementedError()
 
-    def _get_all_elements(self, sources: Union[tuple, list]) -> List[Element]:
+    def _get_visibility_data(self) -> Optional[dict]:
+        """
+        Collects the displaying state, rect, viewport size and visibility ratio of the element.
+
+        :return: A dictionary {'displayed', 'rect', 'viewport', 'ratio'} or :obj:`None` if element is not available.
+        """
+        raise NotImplementedError()
+
+    def _wrap_element(self, source: Any) -> Element:
         """
-        Retrieves all wrapped elements from the given sources.
+        Wraps the given source object into a copy of the current element.
 
-        :param sources: A list or tuple of source objects
-        :type sources: tuple or list
-        :return: A list of wrapped :class:`Element` objects.
+        :param source: A source object of the driver
+        :type source: typing.Any
+        :return: A wrapped :class:`Element` object.
         """
         raise NotImplementedError()
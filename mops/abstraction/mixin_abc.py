@@ -1,15 +1,16 @@
 from abc import ABC
-from typing import Union, Any
+from typing import Union, Any, Callable
 
 from appium.webdriver.webdriver import WebDriver as AppiumWebDriver
 from mops.utils.logs import LogLevel
+from mops.utils.internal_utils import CachedAttributesMeta
 from playwright.sync_api import Page as PlaywrightSourcePage
 from selenium.webdriver.remote.webdriver import WebDriver as SeleniumWebDriver
 
 from mops.base.driver_wrapper import DriverWrapper
 
 
-class MixinABC(ABC):
+class MixinABC(ABC, metaclass=CachedAttributesMeta):
 
     @property
     def driver(self) -> Union[SeleniumWebDriver, AppiumWebDriver, PlaywrightSourcePage]:
@@ -43,7 +44,12 @@ class MixinABC(ABC):
         """
         raise NotImplementedError()
 
-    def log(self: Any, message: str, level: str = LogLevel.INFO) -> None:
+    def log(
+            self: Any,
+            message: Union[str, Callable[[], str]],
+            *args: Any,
+            level: str = LogLevel.INFO,
+    ) -> None:
         """
         Logs a message with detailed context in the following format:
 
@@ -54,8 +60,13 @@ class MixinABC(ABC):
            # Example
            [Aug 14][16:04:22.767][I][2_driver][play_element.py][is_displayed:328] Check visibility of "Mouse page"
 
-        :param message: The log message to record.
-        :type message: str
+        The message is formatted only if the given level is enabled for the logger.
+
+        :param message: The log message to record. Might be a `%`-style format string with `args`
+          or a callable, that returns the message.
+        :type message: typing.Union[str, typing.Callable[[], str]]
+        :param args: The arguments for `%`-style formatting of the message.
+        :type args: typing.Any
         :param level: The logging level, which should be one of the values from :class:`LogLevel`
         :type level: str
         :return: :obj:`None`
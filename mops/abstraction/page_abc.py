@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Union, TYPE_CHECKING
+from typing import Union, Optional, Iterable, Dict, TYPE_CHECKING
 
 from mops.abstraction.mixin_abc import MixinABC
 from mops.base.element import Element
+from mops.mixins.objects.snapshot import ElementSnapshot
 from mops.utils.internal_utils import WAIT_PAGE
 
 if TYPE_CHECKING:
@@ -43,6 +44,11 @@ class PageABC(MixinABC, ABC):
         Waits for the anchor element to become visible, and depending on the configuration of each page element,
         it waits for either their visibility or to be hidden.
 
+        All expectations are checked together within a single call to the browser per iteration,
+        under one shared timeout. Elements, that can't be resolved within the browser
+        (e.g. Playwright-only selectors), are checked element by element.
+        The raised exception lists all elements in unexpected state.
+
         :param silent: If :obj:`True`, suppresses logging during the waiting process. Defaults to :obj:`False`.
         :type silent: bool
         :param timeout: The maximum time (in seconds) to wait for the page or elements to load. Defaults to `WAIT_PAGE`.
@@ -55,6 +61,11 @@ class PageABC(MixinABC, ABC):
         """
         Check whether the current page is opened.
 
+        The anchor, the page elements with `wait=True` and the URL are checked together
+        within a single call to the browser. The URL is read from the top-level page.
+        Elements, that can't be resolved within the browser (e.g. Playwright-only selectors),
+        are checked element by element.
+
         :param with_elements: If `True`, verify the page is opened by checking specific elements.
         :type with_elements: bool
         :param with_url: If `True`, verify the page is opened by checking the URL.
@@ -63,6 +74,33 @@ class PageABC(MixinABC, ABC):
         """
         raise NotImplementedError()
 
+    def snapshot(
+            self,
+            fields: Optional[Iterable[str]] = None,
+            attributes: Iterable[str] = (),
+            silent: bool = False,
+    ) -> Dict[str, ElementSnapshot]:
+        """
+        Collect the state of all page elements within a single call to the browser.
+
+        Every element is located within the browser, so absent elements are reported
+        with `present=False` instead of raising an exception.
+
+        **Appium:**
+
+        - The state is collected element by element in the native context.
+
+        :param fields: The fields to collect: `text`, `value`, `rect`, `displayed`, `enabled`, `checked`.
+          All fields are collected if :obj:`None` given.
+        :type fields: typing.Optional[typing.Iterable[str]]
+        :param attributes: The names of attributes to collect for each element.
+        :type attributes: typing.Iterable[str]
+        :param silent: If :obj:`True`, suppresses the log message. Defaults to :obj:`False`.
+        :type silent: bool
+        :return: :obj:`dict` - The snapshots of page elements, keyed by attribute name.
+        """
+        raise NotImplementedError()
+
     def swipe(
             self,
             start_x: int,
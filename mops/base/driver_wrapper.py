@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Union, Type, List, Tuple, TYPE_CHECKING
+from typing import Union, Type, List, Tuple, Optional, TYPE_CHECKING
 
 from PIL import Image
 from appium.webdriver.webdriver import WebDriver as AppiumDriver
@@ -12,7 +12,11 @@ from playwright.sync_api import (
 )
 
 from mops.mixins.objects.box import Box
+from mops.mixins.objects.comparison_engine import ComparisonEngine
 from mops.mixins.objects.driver import Driver
+from mops.mixins.objects.elements_sequence import ElementsSequence
+from mops.mixins.objects.polling_strategy import PollingStrategy
+from mops.mixins.objects.retry_policy import RetryPolicy
 from mops.visual_comparison import VisualComparison
 from mops.abstraction.driver_wrapper_abc import DriverWrapperABC
 from mops.playwright.play_driver import PlayDriver
@@ -22,6 +26,7 @@ from mops.exceptions import DriverWrapperException
 from mops.mixins.internal_mixin import InternalMixin
 from mops.utils.internal_utils import get_attributes_from_object, get_child_elements_with_names
 from mops.utils.logs import Logging, LogLevel
+from mops.utils.metrics import Metrics
 
 
 if TYPE_CHECKING:
@@ -30,6 +35,7 @@ if TYPE_CHECKING:
 
 class DriverWrapperSessions:
     all_sessions: List[DriverWrapper] = []
+    metrics_budgets: int = 0
 
     @classmethod
     def add_session(cls, driver_wrapper: DriverWrapper) -> None:
@@ -123,14 +129,59 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
 
     browser_name: Union[str, None] = None
 
+    cache_parent_elements: bool = False
+    """
+    Selenium/Appium only: If :obj:`True`, resolved parent elements will be cached and reused by nested elements.
+    A stale parent will be re-resolved automatically, starting from the stale level of the chain.
+    """
+
+    browser_side_waits: bool = False
+    """
+    Selenium/Appium web only: If :obj:`True`, element waits will be performed within the browser by a single
+    async script, that checks the condition on DOM mutations and animation frames.
+    Supported for `wait_visibility`, `wait_hidden`, `wait_enabled`, `wait_for_text`, `wait_for_value`
+    and `wait_elements_count` methods. The condition is confirmed by a single regular check afterwards.
+    Polling will be used if async scripts are blocked by the page or the confirmation fails.
+    """
+
+    polling_strategy: Optional[PollingStrategy] = None
+    """
+    The polling strategy for element waits. Default: :class:`.FixedPolling` with 0.1 seconds delay
+    and :class:`.ExponentialPolling` from 0.1 up to 1.6 seconds for Appium.
+    """
+
+    retry_policy: Optional[RetryPolicy] = None
+    """
+    The retry policy for element interactions: click, check, uncheck and hover.
+    Default: :class:`.RetryPolicy` with 5 seconds deadline and exponential backoff from 0.05 up to 0.5 seconds.
+    """
+
+    collect_metrics: bool = False
+    """
+    If :obj:`True`, the count and duration of backend commands are collected into
+    :attr:`metrics` from the initialization of the driver wrapper.
+    The collecting can be also started later by `driver_wrapper.metrics.enable()`.
+    """
+
+    metrics: Metrics
+    """
+    The count and duration of backend commands, attributed to the originating Element, Page and method.
+    Can be saved as JSON by `driver_wrapper.metrics.dump(path)`.
+    """
+
+    _elements_generation: int = 0
+    _script_timeout: Optional[Union[int, float]] = None
+
     def __new__(cls, *args, **kwargs):
         if cls.session.sessions_count() == 0:
             cls = super().__new__(cls)
         else:
             cls = super().__new__(type(f'ShadowDriverWrapper', (cls, ), get_attributes_from_object(cls)))  # noqa
 
+        # Platform flags are detected for each driver, while options are kept as is
         for name, _ in get_child_elements_with_names(cls, bool).items():
-            setattr(cls, name, False)
+            if name.startswith('is_'):
+                setattr(cls, name, False)
 
         return cls
 
@@ -160,6 +211,11 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
         self.session.add_session(self)
         self.label = f'{self.session.all_sessions.index(self) + 1}_driver'
         self.__init_base_class__()
+        self.metrics = Metrics(self)
+
+        if self.collect_metrics or self.session.metrics_budgets:
+            self.metrics.enable()
+
         if driver.is_mobile_resolution:
             self.is_mobile_resolution = True
             self.is_desktop = False
@@ -187,6 +243,7 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
         if not silent:
             self.log('Quit driver instance')
 
+        self.metrics.disable()
         self._base_cls.quit(self, trace_path)
         self.session.remove_session(self)
 
@@ -230,6 +287,7 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
             remove: Union[Element, List[Element]] = None,
             cut_box: Box = None,
             hide: Union[Element, List[Element]] = None,
+            engine: ComparisonEngine = None,
     ) -> None:
         """
         Asserts that the given screenshot matches the currently taken screenshot.
@@ -247,7 +305,7 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
           If :obj:`None` - takes default threshold or calculate its automatically based on screenshot size.
         :type threshold: typing.Optional[int or float]
         :param delay: The delay in seconds before taking the screenshot.
-          If :obj:`None` - takes default delay.
+          If :obj:`None` - takes default delay, or no delay if `VisualComparison.stable_screenshot` is enabled.
         :type delay: typing.Optional[int or float]
         :param remove: :class:`Element` to remove from the screenshot.
           Can be a single element or a list of elements.
@@ -258,20 +316,22 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
         :type hide: typing.Optional[Element or typing.List[Element]]
+        :param engine: The engine to calculate the difference between screenshots.
+          If :obj:`None` - takes `VisualComparison.comparison_engine`.
+        :type engine: typing.Optional[ComparisonEngine]
         :return: :obj:`None`
         """
-        delay = delay or VisualComparison.default_delay
-        remove = [remove] if type(remove) is not list and remove else remove
+        remove = [remove] if not isinstance(remove, (list, ElementsSequence)) and remove else remove
 
         if hide:
-            if not isinstance(hide, list):
+            if not isinstance(hide, (list, ElementsSequence)):
                 hide = [hide]
             for object_to_hide in hide:
                 object_to_hide.hide()
 
         VisualComparison(self).assert_screenshot(
             filename=filename, test_name=test_name, name_suffix=name_suffix, threshold=threshold, delay=delay,
-            scroll=False, remove=remove, fill_background=False, cut_box=cut_box
+            scroll=False, remove=remove, fill_background=False, cut_box=cut_box, engine=engine
         )
 
     def soft_assert_screenshot(
@@ -284,6 +344,7 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
             remove: Union[Element, List[Element]] = None,
             cut_box: Box = None,
             hide: Union[Element, List[Element]] = None,
+            engine: ComparisonEngine = None,
     ) -> Tuple[bool, str]:
         """
         Compares the currently taken screenshot to the expected screenshot and returns a result.
@@ -301,7 +362,7 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
           If :obj:`None` - takes default threshold or calculate its automatically based on screenshot size.
         :type threshold: typing.Optional[int or float]
         :param delay: The delay in seconds before taking the screenshot.
-          If :obj:`None` - takes default delay.
+          If :obj:`None` - takes default delay, or no delay if `VisualComparison.stable_screenshot` is enabled.
         :type delay: typing.Optional[int or float]
         :param remove: :class:`Element` to remove from the screenshot.
         :type remove: typing.Optional[Element or typing.List[Element]]
@@ -310,10 +371,13 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
         :type cut_box: typing.Optional[Box]
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
+        :param engine: The engine to calculate the difference between screenshots.
+          If :obj:`None` - takes `VisualComparison.comparison_engine`.
+        :type engine: typing.Optional[ComparisonEngine]
         :return: :class:`typing.Tuple` (:class:`bool`, :class:`str`) - result state and result message
         """
         try:
-            self.assert_screenshot(filename, test_name, name_suffix, threshold, delay, remove, cut_box, hide)
+            self.assert_screenshot(filename, test_name, name_suffix, threshold, delay, remove, cut_box, hide, engine)
         except AssertionError as exc:
             exc = str(exc)
             self.log(exc, level=LogLevel.ERROR)
@@ -10,6 +10,9 @@ from playwright.sync_api import Page as PlaywrightDriver
 from appium.webdriver.webdriver import WebDriver as AppiumDriver
 from selenium.common import WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver as SeleniumDriver
+from selenium.webdriver.remote.webelement import WebElement as SeleniumWebElement
+from appium.webdriver.webelement import WebElement as AppiumWebElement
+from playwright.sync_api import Locator as PlayWebElement
 
 from mops.abstraction.element_abc import ElementABC
 from mops.base.driver_wrapper import DriverWrapper
@@ -20,7 +23,11 @@ from mops.selenium.elements.web_element import WebElement
 from mops.mixins.driver_mixin import get_driver_wrapper_from_object, DriverMixin
 from mops.mixins.internal_mixin import InternalMixin, get_element_info
 from mops.mixins.objects.box import Box
+from mops.mixins.objects.comparison_engine import ComparisonEngine
+from mops.mixins.objects.elements_sequence import ElementsSequence
 from mops.mixins.objects.locator import Locator
+from mops.mixins.objects.polling_strategy import PollingStrategy
+from mops.mixins.objects.retry_policy import RetryPolicy
 from mops.mixins.objects.size import Size
 from mops.utils.logs import Logging, LogLevel
 from mops.utils.previous_object_driver import PreviousObjectDriver, set_instance_frame
@@ -30,8 +37,9 @@ from mops.utils.internal_utils import (
     WAIT_EL,
     is_target_on_screen,
     initialize_objects,
+    initialize_lazy_object,
+    get_lazy_objects,
     get_child_elements_with_names,
-    safe_getattribute,
     set_parent_for_attr,
     is_page,
     QUARTER_WAIT_EL,
@@ -56,6 +64,17 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
     _base_cls: Type[PlayElement, MobileElement, WebElement]
     driver_wrapper: DriverWrapper
 
+    polling_strategy: Optional[PollingStrategy] = None
+    """ The polling strategy for waits of the element. The strategy of driver wrapper is used if not set. """
+
+    retry_policy: Optional[RetryPolicy] = None
+    """ The retry policy for interactions with the element. The policy of driver wrapper is used if not set. """
+
+    last_wait_iterations: int = 0
+    """ The count of condition checks, that were performed during the last wait of the element. """
+
+    _initialized: bool = False
+
     def __new__(cls, *args, **kwargs):
         instance = super(Element, cls).__new__(cls)
         set_instance_frame(instance)
@@ -68,14 +87,14 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         self.__full_init__(driver_wrapper=get_driver_wrapper_from_object(driver_wrapper))
         return self
 
-    def __getattribute__(self, item):
-        if 'element' in item and not safe_getattribute(self, '_initialized'):
-            raise NotInitializedException(
-                f'{repr(self)} object is not initialized. '
-                'Try to initialize base object first or call it directly as a method'
-            )
+    def __get__(self, instance: Any, owner: type) -> Element:
+        if instance is not None:
+            name = get_lazy_objects(instance).get(id(self))
 
-        return safe_getattribute(self, item)
+            if name:
+                return initialize_lazy_object(instance, name, self, Element)
+
+        return self
 
     def __init__(
             self,
@@ -170,7 +189,7 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :return: :class:`Element`
         """
         if not silent:
-            self.log(f'Set text in "{self.name}"')
+            self.log('Set text in "%s"', self.name)
 
         self.clear_text(silent=True).type_text(text, silent=True)
         return self
@@ -217,13 +236,13 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :return: :class:`Element`
         """
         if not silent:
-            self.log(f'Wait until "{self.name}" becomes visible without error exception')
+            self.log('Wait until "%s" becomes visible without error exception', self.name)
 
         try:
             self.wait_visibility(timeout=timeout, silent=True)
         except (TimeoutException, WebDriverException) as exception:
             if not silent:
-                self.log(f'Ignored exception: "{exception.msg}"')
+                self.log('Ignored exception: "%s"', exception.msg)
         return self
 
     def wait_hidden_without_error(
@@ -255,13 +274,13 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :return: :class:`Element`
         """
         if not silent:
-            self.log(f'Wait until "{self.name}" becomes hidden without error exception')
+            self.log('Wait until "%s" becomes hidden without error exception', self.name)
 
         try:
             self.wait_hidden(timeout=timeout, silent=True)
         except (TimeoutException, WebDriverException) as exception:
             if not silent:
-                self.log(f'Ignored exception: "{exception.msg}"')
+                self.log('Ignored exception: "%s"', exception.msg)
         return self
 
     @wait_condition
@@ -270,7 +289,8 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
             expected_text: Optional[str] = None,
             *,
             timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
     ) -> Element:
         """
         Wait for the presence of a specific text in the current element, or for any non-empty text.
@@ -294,6 +314,8 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :type timeout: typing.Union[int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         actual_text = self.text
@@ -301,13 +323,13 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         if expected_text is not None:
             result = actual_text == expected_text
             error = f'Not expected text for "{self.name}"'
-            log_msg = f'Wait until text of "{self.name}" will be equal to "{expected_text}"'
+            log_msg, log_args = 'Wait until text of "%s" will be equal to "%s"', (self.name, expected_text)
         else:
             result = actual_text
             error = f'Text of "{self.name}" is empty'
-            log_msg = f'Wait for any text of "{self.name}"'
+            log_msg, log_args = 'Wait for any text of "%s"', (self.name,)
 
-        return Result(result, log_msg, UnexpectedTextException(error, actual_text, expected_text))  # noqa
+        return Result(result, log_msg, UnexpectedTextException(error, actual_text, expected_text), log_args)  # noqa
 
     @wait_condition
     def wait_for_value(
@@ -315,7 +337,8 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
             expected_value: Optional[str] = None,
             *,
             timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
     ) -> Element:
         """
         Wait for a specific value in the current element, or for any non-empty value.
@@ -339,6 +362,8 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :type timeout: typing.Union[int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         actual_value = self.value
@@ -346,16 +371,22 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         if expected_value is not None:
             result = actual_value == expected_value
             error = f'Not expected value for "{self.name}"'
-            log_msg = f'Wait until value of "{self.name}" will be equal to "{expected_value}"'
+            log_msg, log_args = 'Wait until value of "%s" will be equal to "%s"', (self.name, expected_value)
         else:
             result = actual_value
             error = f'Value of "{self.name}" is empty'
-            log_msg = f'Wait for any value inside "{self.name}"'
+            log_msg, log_args = 'Wait for any value inside "%s"', (self.name,)
 
-        return Result(result, log_msg, UnexpectedValueException(error, actual_value, expected_value))  # noqa
+        return Result(result, log_msg, UnexpectedValueException(error, actual_value, expected_value), log_args)  # noqa
 
     @wait_condition
-    def wait_enabled(self, *, timeout: Union[int, float] = WAIT_EL, silent: bool = False) -> Element:
+    def wait_enabled(
+            self,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> Element:
         """
         Wait for the element to become enabled and/or clickable.
 
@@ -376,16 +407,25 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :type timeout: typing.Union[int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         return Result(  # noqa
             execution_result=self.is_enabled(silent=True),
-            log=f'Wait until "{self.name}" becomes enabled',
+            log='Wait until "%s" becomes enabled',
             exc=TimeoutException(f'"{self.name}" is not enabled', info=self),
+            log_args=(self.name,),
         )
 
     @wait_condition
-    def wait_disabled(self, *, timeout: Union[int, float] = WAIT_EL, silent: bool = False) -> Element:
+    def wait_disabled(
+            self,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> Element:
         """
         Wait for the element to become disabled.
 
@@ -406,12 +446,15 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :type timeout: [int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         return Result(  # noqa
             execution_result=not self.is_enabled(silent=True),
-            log=f'Wait until "{self.name}" becomes disabled',
+            log='Wait until "%s" becomes disabled',
             exc=TimeoutException(f'"{self.name}" is not disabled', info=self),
+            log_args=(self.name,),
         )
 
     @wait_condition
@@ -420,7 +463,8 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
             expected_size: Size,
             *,
             timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
     ) -> Element:
         """
         Wait until element size will be equal to given :class:`.Size` object
@@ -444,6 +488,8 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :type timeout: typing.Union[int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         actual = self.size
@@ -451,8 +497,9 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         is_width_equal = actual.width == expected_size.width if expected_size.width is not None else True
         return Result(  # noqa
             execution_result=is_height_equal and is_width_equal,
-            log=f'Wait until "{self.name}" size will be equal to {expected_size}',
+            log='Wait until "%s" size will be equal to %s',
             exc=UnexpectedElementSizeException(f'Unexpected size for "{self.name}"', actual, expected_size),
+            log_args=(self.name, expected_size),
         )
 
     @wait_condition
@@ -461,7 +508,8 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
             expected_count: int,
             *,
             timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
     ) -> Element:
         """
         Wait until the number of matching elements equals the expected count.
@@ -485,24 +533,66 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :type timeout: typing.Union[int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`Element`
         """
         actual_count = self.get_elements_count(silent=True)
         error_msg = f'Unexpected elements count of "{self.name}"'
         return Result(  # noqa
             execution_result=actual_count == expected_count,
-            log=f'Wait until elements count of "{self.name}" will be equal to "{expected_count}"',
+            log='Wait until elements count of "%s" will be equal to "%s"',
             exc=UnexpectedElementsCountException(error_msg, actual_count, expected_count),
+            log_args=(self.name, expected_count),
         )
 
 
     @property
-    def all_elements(self) -> Union[List[Element], List[Any]]:
+    def element(self) -> Union[SeleniumWebElement, AppiumWebElement, PlayWebElement]:
+        """
+        Returns a source element object, depending on the current driver in use.
+
+        :return: :class:`selenium.webdriver.remote.webelement.WebElement` or\n
+          :class:`appium.webdriver.webelement.WebElement` or\n
+          :class:`playwright.sync_api.Locator`
+        """
+        self._validate_initialized()
+        return self._base_cls.element.fget(self)
+
+    @element.setter
+    def element(self, base_element: Union[SeleniumWebElement, AppiumWebElement, PlayWebElement]):
+        """
+        Sets the source element object.
+
+        :param base_element: :class:`selenium.webdriver.remote.webelement.WebElement` or\n
+          :class:`appium.webdriver.webelement.WebElement` or\n
+          :class:`playwright.sync_api.Locator`
+        """
+        self._validate_initialized()
+        self._base_cls.element.fset(self, base_element)
+
+    @property
+    def all_elements(self) -> ElementsSequence:
         """
-        Returns a list of all matching elements.
+        Returns a lazy sequence of all matching elements.
 
-        :return: A list of wrapped :class:`Element` objects.
+        Matching elements are wrapped into :class:`Element` objects on access.
+        The sequence supports :func:`len`, indexing, slicing, iteration
+        and the `nth(index)`, `first` and `last` shortcuts.
+
+        **Selenium/Appium:**
+
+        - All matching elements are found within a single call.
+
+        **Playwright:**
+
+        - Indexing is mapped to `locator.nth()`, so matching elements are not fetched in advance.
+          The index is validated by a single `locator.count()` call per sequence.
+
+        :return: A lazy sequence of wrapped :class:`Element` objects.
         """
+        self._validate_initialized()
+
         if getattr(self, '_wrapped', None):
             raise RecursionError(f'all_elements property already used for {self.name}')
 
@@ -512,57 +602,57 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         """
         Checks is the current element's top-left corner or bottom-right corner is visible on the screen.
 
-        :param check_displaying: If :obj:`True`, the :func:`is_displayed` method will be called to further verify
-          visibility. The check will stop if this method returns :obj:`False`.
+        The displaying state, element rect and viewport size are collected within a single call to the browser.
+
+        :param check_displaying: If :obj:`True`, the displaying state of the element will be verified as well.
+          The check will stop if the element is not displayed.
         :type check_displaying: bool
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
         :return: :class:`bool`
         """
         if not silent:
-            self.log(f'Check visibility of "{self.name}"')
-
-        is_visible = True
+            self.log('Check visibility of "%s"', self.name)
 
-        if check_displaying:
-            is_visible = self.is_displayed()
-
-        if is_visible:
-            rect, window_size = self.get_rect(), self.driver_wrapper.get_inner_window_size()
-            x_end, y_end = rect['x'] + rect['width'], rect['y'] + rect['height']
-            is_start_visible = is_target_on_screen(x=rect['x'], y=rect['y'], possible_range=window_size)
-            is_end_visible = is_target_on_screen(x=x_end, y=y_end, possible_range=window_size)
-            is_visible = is_start_visible or is_end_visible
-
-        return is_visible
+        return any(self._get_visible_corners(check_displaying))
 
     def is_fully_visible(self, check_displaying: bool = True, silent: bool = False) -> bool:
         """
         Check is current element top left corner and bottom right corner visible on current screen
 
-        :param check_displaying: If :obj:`True`, the :func:`is_displayed` method will be called to further verify
-          visibility. The check will stop if this method returns :obj:`False`.
+        The displaying state, element rect and viewport size are collected within a single call to the browser.
+
+        :param check_displaying: If :obj:`True`, the displaying state of the element will be verified as well.
+          The check will stop if the element is not displayed.
         :type check_displaying: bool
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
         :return: :class:`bool`
         """
         if not silent:
-            self.log(f'Check fully visibility of "{self.name}"')
+            self.log('Check fully visibility of "%s"', self.name)
 
-        is_visible = True
+        return all(self._get_visible_corners(check_displaying))
 
-        if check_displaying:
-            is_visible = self.is_displayed()
+    def visibility_ratio(self, silent: bool = False) -> float:
+        """
+        Get the ratio of the element area, that is visible within the current viewport.
 
-        if is_visible:
-            rect, window_size = self.get_rect(), self.driver_wrapper.get_inner_window_size()
-            x_end, y_end = rect['x'] + rect['width'], rect['y'] + rect['height']
-            is_start_visible = is_target_on_screen(x=rect['x'], y=rect['y'], possible_range=window_size)
-            is_end_visible = is_target_on_screen(x=x_end, y=y_end, possible_range=window_size)
-            is_visible = is_start_visible and is_end_visible
+        The displaying state, element rect and viewport size are collected within a single call to the browser.
 
-        return is_visible
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :return: :class:`float` - The ratio from `0` (hidden or out of the viewport) to `1` (fully visible).
+        """
+        if not silent:
+            self.log('Get visibility ratio of "%s"', self.name)
+
+        visibility_data = self._base_cls._get_visibility_data(self)
+
+        if not visibility_data or not visibility_data['displayed']:
+            return 0
+
+        return visibility_data['ratio']
 
     def save_screenshot(
             self,
@@ -581,7 +671,7 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :type convert_type: str
         :return: :class:`PIL.Image.Image`
         """
-        self.log(f'Save screenshot of {self.name}')
+        self.log('Save screenshot of %s', self.name)
 
         image_object = screenshot_base
         if isinstance(screenshot_base, bytes) or screenshot_base is None:
@@ -627,6 +717,7 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
             fill_background: Union[str, bool] = False,
             cut_box: Box = None,
             hide: Union[Element, List[Element]] = None,
+            engine: ComparisonEngine = None,
     ) -> None:
         """
         Asserts that the given screenshot matches the currently taken screenshot.
@@ -644,7 +735,7 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
           If :obj:`None` - takes default threshold or calculate its automatically based on screenshot size.
         :type threshold: typing.Optional[int, float]
         :param delay: The delay in seconds before taking the screenshot.
-          If :obj:`None` - takes default delay.
+          If :obj:`None` - takes default delay, or no delay if `VisualComparison.stable_screenshot` is enabled.
         :type delay: typing.Optional[int, float]
         :param scroll: Whether to scroll to the element before taking the screenshot.
         :type scroll: bool
@@ -660,20 +751,22 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
         :type hide: typing.Optional[Element or typing.List[Element]]
+        :param engine: The engine to calculate the difference between screenshots.
+          If :obj:`None` - takes `VisualComparison.comparison_engine`.
+        :type engine: typing.Optional[ComparisonEngine]
         :return: :obj:`None`
         """
-        delay = delay or VisualComparison.default_delay
-        remove = [remove] if type(remove) is not list and remove else remove
+        remove = [remove] if not isinstance(remove, (list, ElementsSequence)) and remove else remove
 
         if hide:
-            if not isinstance(hide, list):
+            if not isinstance(hide, (list, ElementsSequence)):
                 hide = [hide]
             for object_to_hide in hide:
                 object_to_hide.hide()
 
         VisualComparison(self.driver_wrapper, self).assert_screenshot(
             filename=filename, test_name=test_name, name_suffix=name_suffix, threshold=threshold, delay=delay,
-            scroll=scroll, remove=remove, fill_background=fill_background, cut_box=cut_box
+            scroll=scroll, remove=remove, fill_background=fill_background, cut_box=cut_box, engine=engine
         )
 
     def soft_assert_screenshot(
@@ -688,6 +781,7 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
             fill_background: Union[str, bool] = False,
             cut_box: Box = None,
             hide: Union[Element, List[Element]] = None,
+            engine: ComparisonEngine = None,
     ) -> Tuple[bool, str]:
         """
         Compares the currently taken screenshot to the expected screenshot and returns a result.
@@ -705,7 +799,7 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
           If :obj:`None` - takes default threshold or calculate its automatically based on screenshot size.
         :type threshold: typing.Optional[int, float]
         :param delay: The delay in seconds before taking the screenshot.
-          If :obj:`None` - takes default delay.
+          If :obj:`None` - takes default delay, or no delay if `VisualComparison.stable_screenshot` is enabled.
         :type delay: typing.Optional[int, float]
         :param scroll: Whether to scroll to the element before taking the screenshot.
         :type scroll: bool
@@ -719,11 +813,15 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :type cut_box: typing.Optional[Box]
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
+        :param engine: The engine to calculate the difference between screenshots.
+          If :obj:`None` - takes `VisualComparison.comparison_engine`.
+        :type engine: typing.Optional[ComparisonEngine]
         :return: :class:`typing.Tuple` (:class:`bool`, :class:`str`) - result state and result message
         """
         try:
             self.assert_screenshot(
-                filename, test_name, name_suffix, threshold, delay, scroll, remove, fill_background, cut_box, hide
+                filename, test_name, name_suffix, threshold, delay, scroll, remove, fill_background, cut_box, hide,
+                engine,
             )
         except AssertionError as exc:
             exc = str(exc)
@@ -744,24 +842,37 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         element = element if element else self
         return get_element_info(element)
 
-    def _get_all_elements(self, sources: Union[tuple, list]) -> List[Any]:
+    def _get_visible_corners(self, check_displaying: bool) -> Tuple[bool, bool]:
         """
-        Retrieves all wrapped elements from the given sources.
+        Check visibility of top-left and bottom-right corners of the element on the screen
 
-        :param sources: A list or tuple of source objects
-        :type sources: tuple or list
-        :return: A list of wrapped :class:`Element` objects.
+        :param check_displaying: return not visible corners, if the element is not displayed
+        :return: visibility of top-left and bottom-right corners
         """
-        wrapped_elements = []
+        visibility_data = self._base_cls._get_visibility_data(self)
+
+        if not visibility_data or (check_displaying and not visibility_data['displayed']):
+            return False, False
 
-        for element in sources:
-            wrapped_object: Any = copy(self)
-            wrapped_object.element = element
-            wrapped_object._wrapped = True
-            set_parent_for_attr(wrapped_object, Element, with_copy=True)
-            wrapped_elements.append(wrapped_object)
+        rect, window_size = visibility_data['rect'], Size(**visibility_data['viewport'])
+        x_end, y_end = rect['x'] + rect['width'], rect['y'] + rect['height']
+        is_start_visible = is_target_on_screen(x=rect['x'], y=rect['y'], possible_range=window_size)
+        is_end_visible = is_target_on_screen(x=x_end, y=y_end, possible_range=window_size)
+        return is_start_visible, is_end_visible
 
-        return wrapped_elements
+    def _wrap_element(self, source: Any) -> Element:
+        """
+        Wraps the given source object into a copy of the current element.
+
+        :param source: A source object of the driver
+        :type source: typing.Any
+        :return: A wrapped :class:`Element` object.
+        """
+        wrapped_object: Any = copy(self)
+        wrapped_object.element = source
+        wrapped_object._wrapped = True
+        set_parent_for_attr(wrapped_object, Element, with_copy=True)
+        return wrapped_object
 
     def _modify_children(self):
         """
@@ -778,6 +889,17 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         if not self._driver_wrapper_given:
             PreviousObjectDriver().set_driver_from_previous_object(self)
 
+    def _validate_initialized(self):
+        """
+        Raise an error if the base class isn't initialized for the element yet.
+        Required for properties, that delegate to the base class.
+        """
+        if not self._initialized:
+            raise NotInitializedException(
+                f'{repr(self)} object is not initialized. '
+                'Try to initialize base object first or call it directly as a method'
+            )
+
     def _validate_inheritance(self):
         cls = self.__class__
         mro = cls.__mro__
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-from typing import Any, Union, List, Optional
+from typing import Any, Union, List, Optional, Iterable, Dict
 
 from mops.base.driver_wrapper import DriverWrapper
 from mops.base.element import Element
 from mops.mixins.objects.locator import Locator
+from mops.mixins.objects.snapshot import ElementSnapshot
+from mops.utils.snapshot_utils import get_children_snapshot
 from mops.utils.internal_utils import (
     set_parent_for_attr,
-    get_child_elements,
     initialize_objects,
-    get_child_elements_with_names
+    initialize_lazy_objects,
+    register_lazy_objects,
+    get_child_elements_sequence,
+    get_child_elements_with_names,
 )
 
 
@@ -30,6 +34,12 @@ class Group(Element):
 
     _object = 'group'
 
+    lazy_children: bool = False
+    """
+    If :obj:`True`, child elements defined within the class are initialized on first access
+    instead of the group initialization. `child_elements` initializes them on access to the item.
+    """
+
     def __repr__(self):
         return self._repr_builder()
 
@@ -77,6 +87,39 @@ class Group(Element):
         Initializing of attributes with type == Group/Element.
         Required for classes with base == Group.
         """
-        initialize_objects(self, get_child_elements_with_names(self, Element), Element)
+        children = get_child_elements_with_names(self, Element)
+        register_lazy_objects(self, children)
+        initialize_objects(self, children, Element)
         set_parent_for_attr(self, Element)
-        self.child_elements: List[Element] = get_child_elements(self, Element)
+        self.child_elements: List[Element] = get_child_elements_sequence(self, Element)
+
+    def snapshot(
+            self,
+            fields: Optional[Iterable[str]] = None,
+            attributes: Iterable[str] = (),
+            silent: bool = False,
+    ) -> Dict[str, ElementSnapshot]:
+        """
+        Collect the state of all child elements of the group within a single call to the browser.
+
+        Every element is located within the browser, so absent elements are reported
+        with `present=False` instead of raising an exception.
+
+        **Appium:**
+
+        - The state is collected element by element in the native context.
+
+        :param fields: The fields to collect: `text`, `value`, `rect`, `displayed`, `enabled`, `checked`.
+          All fields are collected if :obj:`None` given.
+        :type fields: typing.Optional[typing.Iterable[str]]
+        :param attributes: The names of attributes to collect for each element.
+        :type attributes: typing.Iterable[str]
+        :param silent: If :obj:`True`, suppresses the log message. Defaults to :obj:`False`.
+        :type silent: bool
+        :return: :obj:`dict` - The snapshots of child elements, keyed by attribute name.
+        """
+        if not silent:
+            self.log('Get snapshot of "%s" child elements', self.name)
+
+        elements = initialize_lazy_objects(self, get_child_elements_with_names(self, Element), Element)
+        return get_children_snapshot(elements, self.driver_wrapper, fields=fields, attributes=attributes)
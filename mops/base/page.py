@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Union, Any, List, Type
+import time
+from typing import Union, Any, List, Type, Optional, Iterable, Dict
 
 from playwright.sync_api import Page as PlaywrightDriver
 from appium.webdriver.webdriver import WebDriver as AppiumDriver
@@ -12,18 +13,23 @@ from mops.base.element import Element
 from mops.playwright.play_page import PlayPage
 from mops.selenium.pages.mobile_page import MobilePage
 from mops.selenium.pages.web_page import WebPage
-from mops.exceptions import DriverWrapperException
+from mops.exceptions import DriverWrapperException, TimeoutException
 from mops.mixins.driver_mixin import get_driver_wrapper_from_object, DriverMixin
 from mops.mixins.internal_mixin import InternalMixin
 from mops.mixins.objects.locator import Locator
+from mops.mixins.objects.snapshot import ElementSnapshot
 from mops.utils.logs import Logging
+from mops.utils.snapshot_utils import get_children_snapshot, get_page_state
 from mops.utils.previous_object_driver import PreviousObjectDriver, set_instance_frame
 from mops.utils.internal_utils import (
     WAIT_PAGE,
     initialize_objects,
+    initialize_lazy_objects,
+    register_lazy_objects,
     get_child_elements_with_names,
-    get_child_elements,
+    get_child_elements_sequence,
     is_element_instance,
+    get_polling_strategy,
 )
 
 
@@ -45,6 +51,12 @@ class Page(DriverMixin, InternalMixin, Logging, PageABC):
 
     anchor: Element
 
+    lazy_children: bool = False
+    """
+    If :obj:`True`, page elements defined within the class are initialized on first access
+    instead of the page initialization. `page_elements` initializes them on access to the item.
+    """
+
     def __new__(cls, *args, **kwargs):
         instance = super(Page, cls).__new__(cls)
         set_instance_frame(instance)
@@ -87,7 +99,7 @@ class Page(DriverMixin, InternalMixin, Logging, PageABC):
         self._modify_children()
         self._safe_setter('__base_obj_id', id(self))
 
-        self.page_elements: List[Element] = get_child_elements(self, Element)
+        self.page_elements: List[Element] = get_child_elements_sequence(self, Element)
 
         self.__init_base_class__()
 
@@ -120,7 +132,7 @@ class Page(DriverMixin, InternalMixin, Logging, PageABC):
         :type wait_page_load: bool
         :return: :obj:`Page` - The current instance of the page object.
         """
-        self.log(f'Reload "{self.name}" page')
+        self.log('Reload "%s" page', self.name)
         self.driver_wrapper.refresh()
 
         if wait_page_load:
@@ -148,6 +160,11 @@ class Page(DriverMixin, InternalMixin, Logging, PageABC):
         Waits for the anchor element to become visible, and depending on the configuration of each page element,
         it waits for either their visibility or to be hidden.
 
+        All expectations are checked together within a single call to the browser per iteration,
+        under one shared timeout. Elements, that can't be resolved within the browser
+        (e.g. Playwright-only selectors), are checked element by element.
+        The raised exception lists all elements in unexpected state.
+
         :param silent: If :obj:`True`, suppresses logging during the waiting process. Defaults to :obj:`False`.
         :type silent: bool
         :param timeout: The maximum time (in seconds) to wait for the page or elements to load. Defaults to `WAIT_PAGE`.
@@ -155,49 +172,126 @@ class Page(DriverMixin, InternalMixin, Logging, PageABC):
         :return: :obj:`Page` - The current instance of the page object.
         """
         if not silent:
-            self.log(f'Wait until page "{self.name}" loaded')
+            self.log('Wait until page "%s" loaded', self.name)
+
+        elements, expectations = {'anchor': self.anchor}, {'anchor': True}
+
+        for name, element in get_child_elements_with_names(self, Element).items():
+            if isinstance(getattr(element, 'wait'), bool):
+                elements[name], expectations[name] = element, element.wait
+
+        elements = initialize_lazy_objects(self, elements, Element)
 
-        self.anchor.wait_visibility(timeout=timeout, silent=True)
+        polling = get_polling_strategy(self)
+        start_time, iteration = time.time(), 1
+        unsatisfied = self._get_unsatisfied_elements(elements, expectations)
+
+        while unsatisfied and time.time() - start_time < timeout:
+            time.sleep(polling.get_delay(iteration, remaining=timeout - (time.time() - start_time)))
+            unsatisfied = self._get_unsatisfied_elements(elements, expectations)
+            iteration += 1
+
+        if unsatisfied:
+            details = ', '.join(
+                f'"{name}" is {"not visible" if expectations[name] else "still visible"}' for name in unsatisfied
+            )
+            raise TimeoutException(f'Page "{self.name}" is not loaded after {timeout} seconds: {details}')
 
-        for element in self.page_elements:
-            if getattr(element, 'wait') is False:
-                element.wait_hidden(timeout=timeout, silent=True)
-            elif getattr(element, 'wait') is True:
-                element.wait_visibility(timeout=timeout, silent=True)
         return self
 
     def is_page_opened(self, with_elements: bool = False, with_url: bool = False) -> bool:
         """
         Check whether the current page is opened.
 
+        The anchor, the page elements with `wait=True` and the URL are checked together
+        within a single call to the browser. The URL is read from the top-level page.
+        Elements, that can't be resolved within the browser (e.g. Playwright-only selectors),
+        are checked element by element.
+
         :param with_elements: If `True`, verify the page is opened by checking specific elements.
         :type with_elements: bool
         :param with_url: If `True`, verify the page is opened by checking the URL.
         :type with_url: bool
         :return: :obj:`bool` - `True` if the page is opened, otherwise `False`.
         """
-        result = True
+        elements = {'anchor': self.anchor}
 
         if with_elements:
-            for element in self.page_elements:
-                if getattr(element, 'wait'):
-                    result &= element.is_displayed(silent=True)
-                    if not result:
-                        self.log(f'Element "{element.name}" is not displayed', level='debug')
+            elements.update({
+                name: element for name, element in get_child_elements_with_names(self, Element).items()
+                if getattr(element, 'wait')
+            })
+            elements = initialize_lazy_objects(self, elements, Element)
+
+        self.anchor.log('Check displaying of "%s"', self.anchor.name)
+        snapshots, url = get_page_state(elements, self.driver_wrapper, fields=['displayed'])
+        result = True
+
+        for name, snapshot in snapshots.items():
+            is_displayed = bool(snapshot.present and snapshot.displayed)
+            result &= is_displayed
 
-        result &= self.anchor.is_displayed()
+            if not is_displayed and name != 'anchor':
+                self.log('Element "%s" is not displayed', elements[name].name, level='debug')
 
         if self.url and with_url:
-            result &= self.driver_wrapper.current_url == self.url
+            result &= (url or self.driver_wrapper.current_url) == self.url
 
         return result
 
+    def snapshot(
+            self,
+            fields: Optional[Iterable[str]] = None,
+            attributes: Iterable[str] = (),
+            silent: bool = False,
+    ) -> Dict[str, ElementSnapshot]:
+        """
+        Collect the state of all page elements within a single call to the browser.
+
+        Every element is located within the browser, so absent elements are reported
+        with `present=False` instead of raising an exception.
+
+        **Appium:**
+
+        - The state is collected element by element in the native context.
+
+        :param fields: The fields to collect: `text`, `value`, `rect`, `displayed`, `enabled`, `checked`.
+          All fields are collected if :obj:`None` given.
+        :type fields: typing.Optional[typing.Iterable[str]]
+        :param attributes: The names of attributes to collect for each element.
+        :type attributes: typing.Iterable[str]
+        :param silent: If :obj:`True`, suppresses the log message. Defaults to :obj:`False`.
+        :type silent: bool
+        :return: :obj:`dict` - The snapshots of page elements, keyed by attribute name.
+        """
+        if not silent:
+            self.log('Get snapshot of "%s" page elements', self.name)
+
+        elements = initialize_lazy_objects(self, get_child_elements_with_names(self, Element), Element)
+        return get_children_snapshot(elements, self.driver_wrapper, fields=fields, attributes=attributes)
+
+    def _get_unsatisfied_elements(self, elements: Dict[str, Element], expectations: Dict[str, bool]) -> List[str]:
+        """
+        Get names of elements, which visibility is not equal to expected, within a single call to the browser
+
+        :param elements: elements to check, where key is the name of the element
+        :param expectations: expected visibility of elements, where key is the name of the element
+        :return: list of names of unsatisfied elements
+        """
+        snapshots = get_children_snapshot(elements, self.driver_wrapper, fields=['displayed'])
+        return [
+            name for name, is_visible in expectations.items()
+            if bool(snapshots[name].present and snapshots[name].displayed) is not is_visible
+        ]
+
     def _modify_children(self):
         """
         Initializing of attributes with type == Element.
         Required for classes with base == Page.
         """
-        initialize_objects(self, get_child_elements_with_names(self, Element), Element)
+        children = get_child_elements_with_names(self, Element)
+        register_lazy_objects(self, children)
+        initialize_objects(self, children, Element)
 
     def _modify_page_driver_wrapper(self, driver_wrapper: Any):
         """
@@ -131,3 +131,10 @@ class InvalidLocatorException(DriverWrapperException):
     Thrown when locator is invalid
     """
     pass
+
+
+class DriverCallsBudgetException(DriverWrapperException):
+    """
+    Thrown when the count of driver calls exceeds the budget
+    """
+    pass
@@ -32,6 +32,324 @@ function getSize(elem) {
 return getSize(arguments[0])
 """
 
+get_element_snapshot_function_js = """
+function getEffectiveOpacity(elem) {
+  let opacity = 1;
+
+  for (let node = elem; node && opacity > 0; node = node.parentElement || node.getRootNode().host) {
+    opacity *= Number(window.getComputedStyle(node).opacity);
+  }
+
+  return opacity;
+};
+
+function getElementSnapshot(elem, fields, attributes) {
+  let snapshot = {present: true, attributes: {}};
+  let box = elem.getBoundingClientRect();
+  let style = window.getComputedStyle(elem);
+
+  if (fields.includes('text')) {
+    snapshot.text = elem.innerText === undefined ? elem.textContent : elem.innerText;
+  }
+  if (fields.includes('value')) {
+    let value = elem.value === undefined ? elem.getAttribute('value') : elem.value;
+    snapshot.value = value === null || value === undefined ? '' : String(value);
+  }
+  if (fields.includes('rect')) {
+    snapshot.rect = {
+      y: Math.round(box.top),
+      x: Math.round(box.left),
+      width: Math.round(box.width),
+      height: Math.round(box.height)
+    };
+  }
+  if (fields.includes('displayed')) {
+    snapshot.displayed = box.width > 0 && box.height > 0 && elem.getClientRects().length > 0
+      && style.visibility !== 'hidden' && style.visibility !== 'collapse' && getEffectiveOpacity(elem) > 0;
+  }
+  if (fields.includes('enabled')) {
+    snapshot.enabled = !elem.matches(':disabled');
+  }
+  if (fields.includes('checked')) {
+    snapshot.checked = elem.checked === true || elem.selected === true;
+  }
+  for (let i = 0; i < attributes.length; i++) {
+    let name = attributes[i];
+    let property = elem[name];
+
+    if (typeof property === 'boolean') {
+      snapshot.attributes[name] = property ? 'true' : null;
+    } else if (property === undefined || property === null || ['object', 'function'].includes(typeof property)) {
+      snapshot.attributes[name] = elem.getAttribute(name);
+    } else {
+      snapshot.attributes[name] = String(property);
+    }
+  }
+
+  return snapshot;
+};
+"""
+
+get_element_snapshot_js = get_element_snapshot_function_js + """
+return getElementSnapshot(arguments[0], arguments[1], arguments[2]);
+"""
+
+get_element_snapshot_play_js = "(elem, args) => {" + get_element_snapshot_function_js + """
+return getElementSnapshot(elem, args.fields, args.attributes);
+}"""
+
+get_element_visibility_function_js = get_element_snapshot_function_js + """
+function getElementVisibility(elem) {
+  let snapshot = getElementSnapshot(elem, ['displayed', 'rect'], []);
+  let box = elem.getBoundingClientRect();
+  let viewport = {width: window.innerWidth, height: window.innerHeight};
+  let visibleWidth = Math.max(0, Math.min(box.right, viewport.width) - Math.max(box.left, 0));
+  let visibleHeight = Math.max(0, Math.min(box.bottom, viewport.height) - Math.max(box.top, 0));
+  let area = box.width * box.height;
+
+  return {
+    displayed: snapshot.displayed,
+    rect: snapshot.rect,
+    viewport: viewport,
+    ratio: area > 0 ? visibleWidth * visibleHeight / area : 0
+  };
+};
+"""
+
+get_element_visibility_js = get_element_visibility_function_js + """
+return getElementVisibility(arguments[0]);
+"""
+
+get_element_visibility_play_js = "(elems) => {" + get_element_visibility_function_js + """
+return elems.length ? getElementVisibility(elems[0]) : null;
+}"""
+
+find_by_chain_function_js = """
+const notRenderedTextTags = ['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE'];
+
+function getRenderedText(elem) {
+  let text = '';
+  let walker = document.createTreeWalker(elem, NodeFilter.SHOW_TEXT);
+
+  while (walker.nextNode()) {
+    let parent = walker.currentNode.parentElement;
+
+    if (!parent || !notRenderedTextTags.includes(parent.tagName)) {
+      text += walker.currentNode.data;
+    }
+  }
+
+  return text.replace(/\\s+/g, ' ').toLowerCase();
+};
+
+function findAllInScope(scope, locator) {
+  if (locator.type === 'xpath') {
+    let value = locator.relative && scope !== document && locator.value.startsWith('/') ? '.' + locator.value : locator.value;
+    let nodes = document.evaluate(value, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: nodes.snapshotLength}, (_, i) => nodes.snapshotItem(i));
+  }
+  if (locator.type === 'text') {
+    let root = scope === document ? document.body : scope;
+    let text = locator.value.trim().toLowerCase();
+    let matches = (elem) => !notRenderedTextTags.includes(elem.tagName) && getRenderedText(elem).includes(text);
+    return root ? Array.from(root.querySelectorAll('*')).filter(
+      (elem) => matches(elem) && !Array.from(elem.children).some(matches)
+    ) : [];
+  }
+  return Array.from(scope.querySelectorAll(locator.value));
+};
+
+function findByChain(chain) {
+  let scope = document;
+
+  for (let i = 0; i < chain.length && scope; i++) {
+    scope = findAllInScope(scope, chain[i])[0] || null;
+  }
+
+  return scope;
+};
+
+function findAllByChain(chain) {
+  let scope = findByChain(chain.slice(0, -1));
+  return scope ? findAllInScope(scope, chain[chain.length - 1]) : [];
+};
+"""
+
+get_children_snapshot_function_js = get_element_snapshot_function_js + find_by_chain_function_js + """
+function getChildrenSnapshot(chains, fields, attributes) {
+  let result = {};
+
+  for (let name in chains) {
+    let elem = null;
+
+    try {
+      elem = findByChain(chains[name]);
+    } catch (error) {
+      result[name] = {present: false, unresolvable: true};
+      continue;
+    }
+
+    result[name] = elem ? getElementSnapshot(elem, fields, attributes) : {present: false};
+  }
+
+  return result;
+};
+"""
+
+get_children_snapshot_js = get_children_snapshot_function_js + """
+return getChildrenSnapshot(arguments[0], arguments[1], arguments[2]);
+"""
+
+get_children_snapshot_play_js = "(args) => {" + get_children_snapshot_function_js + """
+return getChildrenSnapshot(args.chains, args.fields, args.attributes);
+}"""
+
+get_page_state_function_js = get_children_snapshot_function_js + """
+function getPageState(chains, fields, attributes) {
+  let url = null;
+
+  try {
+    url = window.top.location.href;
+  } catch (error) {
+    url = null;
+  }
+
+  return {snapshots: getChildrenSnapshot(chains, fields, attributes), url: url};
+};
+"""
+
+get_page_state_js = get_page_state_function_js + """
+return getPageState(arguments[0], arguments[1], arguments[2]);
+"""
+
+get_page_state_play_js = "(args) => {" + get_page_state_function_js + """
+return getPageState(args.chains, args.fields, args.attributes);
+}"""
+
+wait_in_browser_js = get_element_snapshot_function_js + find_by_chain_function_js + """
+const chain = arguments[0];
+const predicate = arguments[1];
+const timeout = arguments[2];
+const done = arguments[arguments.length - 1];
+
+function checkPredicate() {
+  if (predicate.type === 'count') {
+    return findAllByChain(chain).length === predicate.expected;
+  }
+
+  let elem = findByChain(chain);
+
+  if (predicate.type === 'hidden') {
+    return !elem || !getElementSnapshot(elem, ['displayed'], []).displayed;
+  }
+  if (!elem) {
+    return false;
+  }
+  if (predicate.type === 'visible') {
+    return getElementSnapshot(elem, ['displayed'], []).displayed;
+  }
+  if (predicate.type === 'enabled') {
+    return getElementSnapshot(elem, ['enabled'], []).enabled;
+  }
+
+  let actual = getElementSnapshot(elem, [predicate.type], [])[predicate.type];
+  actual = actual === null || actual === undefined ? '' : actual;
+  actual = predicate.type === 'text' ? actual.trim() : actual;
+  return predicate.expected === null ? actual !== '' : actual === predicate.expected;
+};
+
+function isPassed() {
+  try {
+    return checkPredicate();
+  } catch (error) {
+    return false;
+  }
+};
+
+if (isPassed()) {
+  done(true);
+} else {
+  let finished = false;
+  let frame = null;
+
+  const finish = (result) => {
+    if (finished) {
+      return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+  };
+  const check = () => {
+    frame = null;
+    if (isPassed()) {
+      finish(true);
+    }
+  };
+  const observer = new MutationObserver(() => {
+    if (frame === null) {
+      frame = requestAnimationFrame(check);
+    }
+  });
+
+  observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+  const interval = setInterval(check, 100);
+  const timer = setTimeout(() => finish(isPassed()), timeout);
+}
+"""
+
+get_all_texts_js = """
+const elements = arguments[0];
+const property = arguments[1];
+
+return elements.map((elem) => {
+  let text = elem[property];
+  return text === null || text === undefined ? '' : String(text);
+});
+"""
+
+wait_animations_finished_function_js = """
+function waitAnimationsFinished(timeout, done) {
+  const afterPaint = (result) => requestAnimationFrame(() => requestAnimationFrame(() => done(result)));
+  let animations = [];
+
+  try {
+    animations = document.getAnimations().filter((animation) => {
+      const timing = animation.effect ? animation.effect.getComputedTiming() : null;
+      return animation.playState === 'running' && timing && isFinite(timing.endTime);
+    });
+  } catch (error) {
+    animations = [];
+  }
+
+  if (!animations.length) {
+    afterPaint(true);
+    return;
+  }
+
+  let finished = false;
+  const finish = (result) => {
+    if (!finished) {
+      finished = true;
+      clearTimeout(timer);
+      afterPaint(result);
+    }
+  };
+  const timer = setTimeout(() => finish(false), timeout);
+  Promise.all(animations.map((animation) => animation.finished.catch(() => null))).then(() => finish(true));
+};
+"""
+
+wait_animations_finished_js = wait_animations_finished_function_js + """
+waitAnimationsFinished(arguments[0], arguments[arguments.length - 1]);
+"""
+
+wait_animations_finished_play_js = "(timeout) => new Promise((resolve) => {" + wait_animations_finished_function_js + """
+waitAnimationsFinished(timeout, resolve);
+})"""
+
 delete_element_over_js = """
 const elements = document.getElementsByClassName("driver-wrapper-visual-comparison-support-element");
 
@@ -8,7 +8,7 @@ from appium.webdriver.common.appiumby import AppiumBy
 from mops.utils.internal_utils import (
     get_child_elements_with_names,
     get_child_elements,
-    get_all_attributes_from_object,
+    get_class_attributes,
 )
 
 
@@ -48,9 +48,10 @@ class InternalMixin:
 
         :return: None
         """
+        class_attributes, instance_attributes = get_class_attributes(self.__class__), self.__dict__
         data = {
             name: value for name, value in get_static(cls)
-            if name not in get_all_attributes_from_object(self).keys()
+            if name not in class_attributes and name not in instance_attributes
         }.items()
 
         for name, item in data:
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class CommandStats:
+    """ Represents aggregated statistics of backend commands, that were sent to the driver. """
+
+    count: int = 0
+    """
+    The number of commands.
+    """
+
+    duration: float = 0
+    """
+    The total duration of commands in seconds.
+    """
+
+    max_duration: float = 0
+    """
+    The duration of the slowest command in seconds.
+    """
+
+    @property
+    def average_duration(self) -> float:
+        """
+        The average duration of commands in seconds.
+        """
+        return self.duration / self.count if self.count else 0
+
+    def add(self, duration: float) -> None:
+        """
+        Add a command with given duration to the statistics.
+
+        :param duration: The duration of the command in seconds.
+        :return: :obj:`None`
+        """
+        self.count += 1
+        self.duration += duration
+        self.max_duration = max(self.max_duration, duration)
+
+    def merge(self, stats: 'CommandStats') -> None:
+        """
+        Add given statistics to the current one.
+
+        :param stats: The statistics to add.
+        :return: :obj:`None`
+        """
+        self.count += stats.count
+        self.duration += stats.duration
+        self.max_duration = max(self.max_duration, stats.max_duration)
@@ -0,0 +1,434 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+try:
+    import cv2.cv2 as cv2  # ~cv2@4.5.5.62 + python@3.8/9/10
+except ImportError:
+    import cv2  # ~cv2@4.10.0.84 + python@3.11/12
+
+import numpy
+from skimage.metrics import structural_similarity
+
+
+SSIM_WINDOW_SIZE = 7  # default window size of structural_similarity
+
+# YIQ color space coefficients of RGB channels, that are used by pixelmatch
+_YIQ_Y = numpy.array([0.29889531, 0.58662247, 0.11448223])
+_YIQ_I = numpy.array([0.59597799, -0.27417610, -0.32180189])
+_YIQ_Q = numpy.array([0.21147017, -0.52261711, 0.31114694])
+_MAX_YIQ_DELTA = 35215
+
+_NEIGHBOURS = numpy.array([(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx])
+
+
+class ComparisonEngine(ABC):
+    """
+    Represents an algorithm of difference calculation between the reference and actual screenshots.
+
+    The engine can be set for the entire :class:`.VisualComparison` via `comparison_engine` attribute
+    or for the specific call of `assert_screenshot` via `engine` argument.
+    Each engine has its own measure of difference in percents, so thresholds aren't interchangeable between engines.
+    """
+
+    @abstractmethod
+    def get_difference(
+            self,
+            reference_img: numpy.ndarray,
+            actual_img: numpy.ndarray,
+            possible_threshold: Union[int, float],
+            diff_color: tuple,
+    ) -> Tuple[numpy.ndarray, float]:
+        """
+        Calculate difference between two images of the same size.
+
+        :param reference_img: The reference BGR image.
+        :param actual_img: The actual BGR image.
+        :param possible_threshold: The possible difference in percents.
+        :param diff_color: The BGR color for highlighting differences on the diff image.
+        :return: (diff image, difference in percents)
+        """
+        raise NotImplementedError()
+
+
+@dataclass
+class SSIMEngine(ComparisonEngine):
+    """
+    Calculates the difference as `100 - SSIM * 100` of grayscale images and highlights
+    the differing regions found by contours of the SSIM map.
+
+    SSIM is calculated tile by tile, and only for tiles with changed pixels.
+    The result is the same as for the whole images, while memory usage is limited by the tile size.
+    """
+
+    tile_size: int = 512
+    """The size of tiles in pixels, by which SSIM is calculated."""
+
+    def get_difference(
+            self,
+            reference_img: numpy.ndarray,
+            actual_img: numpy.ndarray,
+            possible_threshold: Union[int, float],
+            diff_color: tuple,
+    ) -> Tuple[numpy.ndarray, float]:
+        """
+        Calculate difference between two images of the same size.
+
+        SSIM and the diff image are calculated only if cheap checks can't decide:
+          - identical images have no difference
+          - images, whose upper bound of difference is within the threshold, are the same enough
+
+        :param reference_img: The reference BGR image.
+        :param actual_img: The actual BGR image.
+        :param possible_threshold: The possible difference in percents.
+        :param diff_color: The BGR color for highlighting differences on the diff image.
+        :return: (diff image, difference in percents)
+        """
+        if numpy.array_equal(reference_img, actual_img):
+            return actual_img, 0
+
+        # Convert images to grayscale
+        reference_img_gray = cv2.cvtColor(reference_img, cv2.COLOR_BGR2GRAY)
+        actual_img_gray = cv2.cvtColor(actual_img, cv2.COLOR_BGR2GRAY)
+
+        affected_mask = self._get_affected_mask(reference_img_gray, actual_img_gray)
+        difference_bound = self._get_difference_bound(affected_mask)
+        if difference_bound is not None and difference_bound <= possible_threshold:
+            return actual_img, difference_bound
+
+        # Compute SSIM between the two images
+        score, diff = self._get_tiled_ssim(reference_img_gray, actual_img_gray, affected_mask)
+        score *= 100
+
+        # Threshold the difference image, followed by finding contours to
+        # obtain the regions of the two input images that differ
+        thresh = cv2.threshold(diff, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)[1]
+        contours = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        contours = contours[0] if len(contours) == 2 else contours[1]
+
+        filled_after = actual_img.copy()
+        percent_diff = 100 - score
+        is_different_enough = percent_diff > possible_threshold
+
+        for c in contours:
+            if is_different_enough or cv2.contourArea(c) > 40:
+                cv2.drawContours(filled_after, [c], 0, diff_color, -1)
+
+        return filled_after, percent_diff
+
+    def _get_tiled_ssim(
+            self,
+            reference_img_gray: numpy.ndarray,
+            actual_img_gray: numpy.ndarray,
+            affected_mask: numpy.ndarray,
+    ) -> Tuple[float, numpy.ndarray]:
+        """
+        Calculate SSIM tile by tile, same as `structural_similarity` for the whole images.
+        Tiles without affected pixels are similar, so SSIM is calculated only for affected tiles
+        and float maps are allocated only for a single tile at once.
+
+        :param reference_img_gray: grayscale image 1, numpy.ndarray
+        :param actual_img_gray: grayscale image 2, numpy.ndarray
+        :param affected_mask: mask of pixels, whose SSIM window covers a changed pixel
+        :return: (mean SSIM score, SSIM map as 8-bit unsigned integers in the range [0,255])
+        """
+        height, width = reference_img_gray.shape
+        if height < SSIM_WINDOW_SIZE or width < SSIM_WINDOW_SIZE:
+            score, diff = structural_similarity(reference_img_gray, actual_img_gray, full=True)
+            return score, (diff * 255).astype('uint8')
+
+        pad = (SSIM_WINDOW_SIZE - 1) // 2
+        tile_size = max(self.tile_size, SSIM_WINDOW_SIZE)
+        diff = numpy.full((height, width), 255, dtype='uint8')
+        dissimilarity = 0.0
+
+        for top in range(0, height, tile_size):
+            bottom = min(top + tile_size, height)
+
+            for left in range(0, width, tile_size):
+                right = min(left + tile_size, width)
+
+                if not affected_mask[top:bottom, left:right].any():
+                    continue
+
+                # Margins of half window size give the same SSIM of tile pixels as within the whole images
+                region_top = max(0, min(top - pad, height - SSIM_WINDOW_SIZE))
+                region_left = max(0, min(left - pad, width - SSIM_WINDOW_SIZE))
+                region = (slice(region_top, min(bottom + pad, height)), slice(region_left, min(right + pad, width)))
+
+                _, tile = structural_similarity(reference_img_gray[region], actual_img_gray[region], full=True)
+                tile = tile[top - region_top:bottom - region_top, left - region_left:right - region_left]
+
+                # The diff image contains the actual image differences between the two images
+                # and is represented as a floating point data type in the range [0,1]
+                # so we must convert the array to 8-bit unsigned integers in the range
+                # [0,255] before we can use it with OpenCV
+                diff[top:bottom, left:right] = (tile * 255).astype('uint8')
+
+                # structural_similarity averages SSIM excluding the borders of half window size
+                cropped = tile[
+                    max(pad - top, 0):max(height - pad - top, 0),
+                    max(pad - left, 0):max(width - pad - left, 0),
+                ]
+                dissimilarity += float((1 - cropped).sum())
+
+        score = 1 - dissimilarity / ((height - 2 * pad) * (width - 2 * pad))
+        return score, diff
+
+    @staticmethod
+    def _get_affected_mask(reference_img_gray: numpy.ndarray, actual_img_gray: numpy.ndarray) -> numpy.ndarray:
+        """
+        Get the mask of pixels, whose SSIM window covers a changed pixel.
+        SSIM of other pixels is exactly 1, because their windows are the same in both images.
+
+        :param reference_img_gray: grayscale image 1, numpy.ndarray
+        :param actual_img_gray: grayscale image 2, numpy.ndarray
+        :return: mask with 255 for affected pixels and 0 for others
+        """
+        changed = cv2.compare(reference_img_gray, actual_img_gray, cv2.CMP_NE)
+        return cv2.dilate(changed, numpy.ones((SSIM_WINDOW_SIZE, SSIM_WINDOW_SIZE), dtype='uint8'))
+
+    @staticmethod
+    def _get_difference_bound(affected_mask: numpy.ndarray) -> Optional[float]:
+        """
+        Calculate the upper bound of SSIM based difference without calculating SSIM itself.
+        SSIM of an affected pixel can't be below -1, and SSIM of other pixels is 1.
+
+        :param affected_mask: mask of pixels, whose SSIM window covers a changed pixel
+        :return: upper bound of difference in percents or :obj:`None` if images are smaller than SSIM window
+        """
+        pad = (SSIM_WINDOW_SIZE - 1) // 2
+
+        # structural_similarity averages SSIM excluding the borders of half window size
+        affected_mask = affected_mask[pad:-pad, pad:-pad]
+        if not affected_mask.size:
+            return None
+
+        return 200 * cv2.countNonZero(affected_mask) / affected_mask.size
+
+
+@dataclass
+class PixelDiffEngine(ComparisonEngine):
+    """
+    Calculates the difference as the percentage of differing pixels, similar to pixelmatch.
+
+    Pixels are compared by the perceived color difference in YIQ color space.
+    Differing pixels, that look like anti-aliasing of the edges, are ignored.
+    Much cheaper than SSIM for flat UI screenshots, but sensitive to small shifts of the content.
+    """
+
+    threshold: float = 0.1
+    """The matching threshold of a single pixel from 0 to 1. Smaller values make the comparison more sensitive."""
+
+    include_anti_aliasing: bool = False
+    """If set to `True`, anti-aliased pixels are counted as different too."""
+
+    def get_difference(
+            self,
+            reference_img: numpy.ndarray,
+            actual_img: numpy.ndarray,
+            possible_threshold: Union[int, float],
+            diff_color: tuple,
+    ) -> Tuple[numpy.ndarray, float]:
+        """
+        Calculate difference between two images of the same size.
+
+        :param reference_img: The reference BGR image.
+        :param actual_img: The actual BGR image.
+        :param possible_threshold: The possible difference in percents.
+        :param diff_color: The BGR color for highlighting differences on the diff image.
+        :return: (diff image, difference in percents)
+        """
+        if numpy.array_equal(reference_img, actual_img):
+            return actual_img, 0
+
+        xs, ys = cv2.findNonZero(_get_changed_mask(reference_img, actual_img)).reshape(-1, 2).T
+        reference_rgb = reference_img[ys, xs, ::-1].astype('float64')
+        actual_rgb = actual_img[ys, xs, ::-1].astype('float64')
+        delta = self._get_color_delta(reference_rgb, actual_rgb)
+
+        different = delta > _MAX_YIQ_DELTA * self.threshold ** 2
+        ys, xs = ys[different], xs[different]
+
+        if not self.include_anti_aliasing and ys.size:
+            anti_aliased = self._is_anti_aliased(reference_img, actual_img, ys, xs)
+            anti_aliased |= self._is_anti_aliased(actual_img, reference_img, ys, xs)
+            ys, xs = ys[~anti_aliased], xs[~anti_aliased]
+
+        diff_image = actual_img.copy()
+        diff_image[ys, xs] = diff_color
+        return diff_image, ys.size / (reference_img.shape[0] * reference_img.shape[1]) * 100
+
+    @staticmethod
+    def _get_color_delta(rgb_1: numpy.ndarray, rgb_2: numpy.ndarray) -> numpy.ndarray:
+        """
+        Calculate the squared perceived difference of given RGB colors in YIQ color space.
+
+        :param rgb_1: colors 1 with shape (N, 3)
+        :param rgb_2: colors 2 with shape (N, 3)
+        :return: differences with shape (N,)
+        """
+        rgb_delta = rgb_1 - rgb_2
+        y, i, q = rgb_delta @ _YIQ_Y, rgb_delta @ _YIQ_I, rgb_delta @ _YIQ_Q
+        return 0.5053 * y ** 2 + 0.299 * i ** 2 + 0.1957 * q ** 2
+
+    @classmethod
+    def _is_anti_aliased(
+            cls,
+            image: numpy.ndarray,
+            other_image: numpy.ndarray,
+            ys: numpy.ndarray,
+            xs: numpy.ndarray,
+    ) -> numpy.ndarray:
+        """
+        Check whether given pixels of the image look like anti-aliasing, same as pixelmatch does:
+        a pixel is anti-aliased if it has both darker and brighter neighbours, at most two neighbours
+        of the same brightness, and its darkest or brightest neighbour lies on a flat area of both images.
+
+        :param image: BGR image to check the pixels within
+        :param other_image: BGR image to compare with
+        :param ys: row indexes of the pixels
+        :param xs: column indexes of the pixels
+        :return: boolean mask of anti-aliased pixels
+        """
+        neighbours_ys, neighbours_xs, inside = cls._get_neighbours(image, ys, xs)
+
+        brightness = image[ys, xs, ::-1] @ _YIQ_Y
+        neighbours_brightness = image[neighbours_ys, neighbours_xs, ::-1] @ _YIQ_Y
+        delta = numpy.where(inside, brightness[:, None] - neighbours_brightness, numpy.nan)
+        zeroes = (delta == 0).sum(axis=1) + ~inside.all(axis=1)
+
+        result = (zeroes <= 2) & (numpy.nanmin(delta, axis=1) < 0) & (numpy.nanmax(delta, axis=1) > 0)
+
+        # Siblings are checked only for pixels, that may still be anti-aliased
+        candidates = numpy.flatnonzero(result)
+        delta, neighbours_ys, neighbours_xs = delta[candidates], neighbours_ys[candidates], neighbours_xs[candidates]
+        rows = numpy.arange(candidates.size)
+        is_flat = numpy.zeros(candidates.size, dtype=bool)
+
+        for extreme in (numpy.argmin(numpy.nan_to_num(delta, nan=numpy.inf), axis=1),
+                        numpy.argmax(numpy.nan_to_num(delta, nan=-numpy.inf), axis=1)):
+            extreme_ys, extreme_xs = neighbours_ys[rows, extreme], neighbours_xs[rows, extreme]
+            is_flat |= cls._has_many_siblings(image, extreme_ys, extreme_xs) \
+                & cls._has_many_siblings(other_image, extreme_ys, extreme_xs)
+
+        result[candidates] = is_flat
+        return result
+
+    @classmethod
+    def _has_many_siblings(cls, image: numpy.ndarray, ys: numpy.ndarray, xs: numpy.ndarray) -> numpy.ndarray:
+        """
+        Check whether given pixels have at least 3 neighbours of the same color. Image borders count as one.
+
+        :param image: BGR image to check the pixels within
+        :param ys: row indexes of the pixels
+        :param xs: column indexes of the pixels
+        :return: boolean mask of pixels with many siblings
+        """
+        neighbours_ys, neighbours_xs, inside = cls._get_neighbours(image, ys, xs)
+        colors = _pack_colors(image[ys, xs])
+        same = (_pack_colors(image[neighbours_ys, neighbours_xs]) == colors[:, None]) & inside
+        return same.sum(axis=1) + ~inside.all(axis=1) >= 3
+
+    @staticmethod
+    def _get_neighbours(
+            image: numpy.ndarray,
+            ys: numpy.ndarray,
+            xs: numpy.ndarray,
+    ) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Get coordinates of 8 neighbours of given pixels, clipped by the image borders.
+
+        :param image: image to get the neighbours within
+        :param ys: row indexes of the pixels
+        :param xs: column indexes of the pixels
+        :return: (row indexes, column indexes, mask of neighbours inside the image) with shape (N, 8)
+        """
+        height, width = image.shape[0:2]
+        neighbours_ys, neighbours_xs = ys[:, None] + _NEIGHBOURS[:, 0], xs[:, None] + _NEIGHBOURS[:, 1]
+        inside = (neighbours_ys >= 0) & (neighbours_ys < height) & (neighbours_xs >= 0) & (neighbours_xs < width)
+        return neighbours_ys.clip(0, height - 1), neighbours_xs.clip(0, width - 1), inside
+
+
+@dataclass
+class PerceptualHashEngine(ComparisonEngine):
+    """
+    Calculates the difference as the percentage of differing bits of perceptual hashes (pHash) of the images.
+
+    The cheapest engine, that ignores noise and small changes. The hash describes the entire image,
+    so the diff image highlights all changed pixels instead of the differing regions.
+    """
+
+    hash_size: int = 8
+    """The size of the hash side in bits. The hash contains `hash_size ** 2` bits."""
+
+    highfreq_factor: int = 4
+    """The factor of the downscaled image size relative to the hash size."""
+
+    def get_difference(
+            self,
+            reference_img: numpy.ndarray,
+            actual_img: numpy.ndarray,
+            possible_threshold: Union[int, float],
+            diff_color: tuple,
+    ) -> Tuple[numpy.ndarray, float]:
+        """
+        Calculate difference between two images of the same size.
+
+        :param reference_img: The reference BGR image.
+        :param actual_img: The actual BGR image.
+        :param possible_threshold: The possible difference in percents.
+        :param diff_color: The BGR color for highlighting differences on the diff image.
+        :return: (diff image, difference in percents)
+        """
+        if numpy.array_equal(reference_img, actual_img):
+            return actual_img, 0
+
+        reference_hash, actual_hash = self.get_hash(reference_img), self.get_hash(actual_img)
+        percent_diff = numpy.count_nonzero(reference_hash != actual_hash) / reference_hash.size * 100
+
+        if percent_diff <= possible_threshold:
+            return actual_img, percent_diff
+
+        diff_image = actual_img.copy()
+        diff_image[_get_changed_mask(reference_img, actual_img) > 0] = diff_color
+        return diff_image, percent_diff
+
+    def get_hash(self, image: numpy.ndarray) -> numpy.ndarray:
+        """
+        Calculate the perceptual hash of the image: signs of low frequencies of DCT of the downscaled image
+        relative to their median.
+
+        :param image: BGR image.
+        :return: boolean array with shape (`hash_size`, `hash_size`)
+        """
+        size = self.hash_size * self.highfreq_factor
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        downscaled = cv2.resize(gray, (size, size), interpolation=cv2.INTER_AREA).astype('float32')
+        low_frequencies = cv2.dct(downscaled)[:self.hash_size, :self.hash_size]
+        return low_frequencies > numpy.median(low_frequencies)
+
+
+def _get_changed_mask(reference_img: numpy.ndarray, actual_img: numpy.ndarray) -> numpy.ndarray:
+    """
+    Get the mask of pixels, that differ in any channel.
+
+    :param reference_img: The reference BGR image.
+    :param actual_img: The actual BGR image.
+    :return: mask with non-zero values for changed pixels
+    """
+    # Grayscale of a channel mask is non-zero if any channel is 255
+    return cv2.cvtColor(cv2.compare(reference_img, actual_img, cv2.CMP_NE), cv2.COLOR_BGR2GRAY)
+
+
+def _pack_colors(pixels: numpy.ndarray) -> numpy.ndarray:
+    """
+    Pack BGR pixels into integers to compare colors at once.
+
+    :param pixels: BGR pixels with shape (..., 3)
+    :return: integers with shape (...)
+    """
+    pixels = pixels.astype('int32')
+    return pixels[..., 0] | pixels[..., 1] << 8 | pixels[..., 2] << 16
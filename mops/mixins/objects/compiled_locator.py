@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CompiledLocator:
+    """ Represents a locator string, that is parsed for the specific engine. """
+
+    type: str
+    """
+    The locator type for the engine, e.g. `By.CSS_SELECTOR` for Selenium/Appium or `LocatorType.CSS` for Playwright.
+    """
+
+    value: str
+    """
+    The locator value for the engine.
+    """
+
+    log_locator: str
+    """
+    The locator used in the logs.
+    """
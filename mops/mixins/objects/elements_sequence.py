@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import typing
+from collections.abc import Sequence
+
+
+class ElementsSequence(Sequence):
+    """
+    Represents a lazy sequence of matching elements.
+
+    Source elements are wrapped into :class:`.Element` objects on first access to the given index,
+    so only the requested items are copied. The sequence supports :func:`len`, indexing, slicing and iteration,
+    and can be concatenated or compared with a :class:`list`.
+    """
+
+    def __init__(
+            self,
+            wrap: typing.Callable[[typing.Any], typing.Any],
+            count: typing.Callable[[], int],
+            nth: typing.Callable[[int], typing.Any],
+            last: typing.Optional[typing.Callable[[], typing.Any]] = None,
+    ):
+        """
+        :param wrap: function, that wraps source element into :class:`.Element` object
+        :param count: function, that returns the count of source elements
+        :param nth: function, that returns source element by non-negative index
+        :param last: function, that returns the last source element without counting. Optional
+        """
+        self._wrap = wrap
+        self._count = count
+        self._nth = nth
+        self._last = last
+        self._length: typing.Optional[int] = None
+        self._wrapped_elements: typing.Dict[int, typing.Any] = {}
+        self._wrapped_last: typing.Optional[typing.Any] = None
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self)})'
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = self._count()
+
+        return self._length
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Any:
+        if isinstance(index, slice):
+            return [self._get_wrapped(item) for item in range(*index.indices(len(self)))]
+
+        length = len(self)
+
+        if index < 0:
+            index += length
+
+        if index < 0 or index >= length:
+            raise IndexError('Element index out of range')
+
+        return self._get_wrapped(index)
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        for index in range(len(self)):
+            yield self._get_wrapped(index)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if isinstance(other, (list, tuple, ElementsSequence)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __add__(self, other: typing.Iterable) -> list:
+        return list(self) + list(other)
+
+    def __radd__(self, other: typing.Iterable) -> list:
+        return list(other) + list(self)
+
+    def nth(self, index: int) -> typing.Any:
+        """
+        Get the element by index. Negative index is counted from the end of the sequence.
+
+        :param index: index of the element
+        :return: wrapped :class:`.Element` object
+        """
+        return self[index]
+
+    @property
+    def first(self) -> typing.Any:
+        """
+        Get the first element of the sequence.
+
+        :return: wrapped :class:`.Element` object
+        """
+        return self[0]
+
+    @property
+    def last(self) -> typing.Any:
+        """
+        Get the last element of the sequence. Source element is wrapped only once.
+
+        :return: wrapped :class:`.Element` object
+        """
+        if self._wrapped_last is None and self._last and self._length is None:
+            self._wrapped_last = self._wrap(self._last())
+
+        return self[-1] if self._wrapped_last is None else self._wrapped_last
+
+    def _get_wrapped(self, index: int) -> typing.Any:
+        """
+        Get wrapped element by non-negative index. Source element is wrapped only once.
+
+        :param index: index of the element
+        :return: wrapped :class:`.Element` object
+        """
+        if index not in self._wrapped_elements:
+            self._wrapped_elements[index] = self._wrap(self._nth(index))
+
+        return self._wrapped_elements[index]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import random
+import typing
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+
+class PollingStrategy(ABC):
+    """
+    Represents a strategy of delays between iterations of the :func:`wait_condition` decorator.
+
+    The strategy can be set for the entire :class:`.DriverWrapper`, for the specific :class:`.Element`
+    or for the specific call of wait method via `polling` argument.
+    """
+
+    @abstractmethod
+    def get_delay(self, iteration: int, remaining: float) -> float:
+        """
+        Get the delay before the next iteration.
+
+        :param iteration: The number of the delay within the wait, starting from 1.
+        :param remaining: The remaining time of the wait (in seconds).
+        :return: The delay in seconds.
+        """
+        raise NotImplementedError()
+
+
+@dataclass
+class FixedPolling(PollingStrategy):
+    """ Polls the condition with the same delay for each iteration. """
+
+    delay: typing.Union[int, float] = 0.1
+
+    def __post_init__(self):
+        if self.delay < 0:
+            raise ValueError(f'The `delay` value must not be negative, got {self.delay}')
+
+    def get_delay(self, iteration: int, remaining: float) -> float:
+        return self.delay
+
+
+@dataclass
+class ExponentialPolling(PollingStrategy):
+    """ Polls the condition with the delay, that is multiplied by `factor` for each iteration up to `max_delay`. """
+
+    initial_delay: typing.Union[int, float] = 0.1
+    factor: typing.Union[int, float] = 2
+    max_delay: typing.Union[int, float] = 1.6
+
+    def __post_init__(self):
+        for name in ('initial_delay', 'factor', 'max_delay'):
+            if getattr(self, name) < 0:
+                raise ValueError(f'The `{name}` value must not be negative, got {getattr(self, name)}')
+
+    def get_delay(self, iteration: int, remaining: float) -> float:
+        return min(self.initial_delay * self.factor ** (iteration - 1), self.max_delay)
+
+
+@dataclass
+class JitteredPolling(PollingStrategy):
+    """ Randomizes the delay of given strategy within the `jitter` ratio to spread the load. """
+
+    strategy: PollingStrategy = field(default_factory=FixedPolling)
+    jitter: float = 0.5
+
+    def __post_init__(self):
+        if not 0 <= self.jitter <= 1:
+            raise ValueError(f'The `jitter` value must be within [0, 1], got {self.jitter}')
+
+    def get_delay(self, iteration: int, remaining: float) -> float:
+        delay = self.strategy.get_delay(iteration, remaining)
+        return max(0, random.uniform(delay * (1 - self.jitter), delay * (1 + self.jitter)))
+
+
+@dataclass
+class DeadlineAwarePolling(PollingStrategy):
+    """ Shrinks the delay of given strategy to the remaining time, so the last check happens right at the deadline. """
+
+    strategy: PollingStrategy = field(default_factory=FixedPolling)
+
+    def get_delay(self, iteration: int, remaining: float) -> float:
+        return max(0, min(self.strategy.get_delay(iteration, remaining), remaining))
+
+
+default_polling = FixedPolling()
+default_appium_polling = ExponentialPolling()
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import typing
+from dataclasses import dataclass, field
+
+from mops.mixins.objects.polling_strategy import ExponentialPolling, PollingStrategy
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Represents a policy of retries for interactions with the element:
+    click, check and uncheck of Selenium/Appium, and hover of Selenium.
+
+    The interaction is retried while the element is not interactable, intercepted or stale,
+    with the delays of `backoff` strategy between attempts, until `timeout` or `max_attempts` is reached.
+    The element is re-resolved only if it went stale.
+
+    The policy can be set for the entire :class:`.DriverWrapper` or for the specific :class:`.Element`.
+    """
+
+    timeout: typing.Union[int, float] = 5
+    """
+    The deadline of all attempts (in seconds).
+    """
+
+    max_attempts: typing.Optional[int] = None
+    """
+    The maximum count of attempts. Not limited by default, only the `timeout` is applied.
+    """
+
+    backoff: PollingStrategy = field(
+        default_factory=lambda: ExponentialPolling(initial_delay=0.05, factor=2, max_delay=0.5)
+    )
+    """
+    The strategy of delays between attempts. The delay is shrunk to the remaining time.
+    """
+
+
+default_retry_policy = RetryPolicy()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import typing
+from dataclasses import dataclass, field
+
+
+snapshot_fields = ('text', 'value', 'rect', 'displayed', 'enabled', 'checked')
+
+
+@dataclass(frozen=True)
+class ElementSnapshot:
+    """
+    Represents the state of a UI element, collected within a single call to the browser.
+
+    Fields that were not requested during collection are set to :obj:`None`.
+    """
+
+    present: typing.Optional[bool] = None
+    """ Whether the element is present in the DOM. Other fields are :obj:`None` for absent element. """
+
+    text: typing.Optional[str] = None
+    """ The rendered text of the element. """
+
+    value: typing.Optional[str] = None
+    """ The value of the element. Empty string for elements without value. """
+
+    rect: typing.Optional[dict] = None
+    """ The size and position of the element: {'y', 'x', 'width', 'height'}. """
+
+    displayed: typing.Optional[bool] = None
+    """
+    Whether the element has a non-empty box and is not hidden by CSS.
+    Elements with zero opacity, including one of an ancestor, are considered hidden as by Selenium.
+    """
+
+    enabled: typing.Optional[bool] = None
+    """ Whether the element is not disabled. """
+
+    checked: typing.Optional[bool] = None
+    """ Whether the checkbox, radio button or option is selected. """
+
+    attributes: typing.Dict[str, typing.Optional[str]] = field(default_factory=dict)
+    """ The requested attributes of the element. """
+
+
+def get_snapshot_fields(fields: typing.Optional[typing.Iterable[str]]) -> typing.List[str]:
+    """
+    Validate requested snapshot fields
+
+    :param fields: requested fields. All fields will be collected if :obj:`None` given
+    :return: list of fields to collect
+    """
+    if fields is None:
+        return list(snapshot_fields)
+
+    fields = list(fields)
+    unexpected_fields = [name for name in fields if name not in snapshot_fields]
+
+    if unexpected_fields:
+        raise ValueError(f'Unexpected snapshot fields: {unexpected_fields}. Available fields: {snapshot_fields}')
+
+    return fields
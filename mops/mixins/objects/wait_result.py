@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Tuple
 
 from mops.exceptions import DriverWrapperException
 
@@ -9,3 +9,4 @@ class Result:
     execution_result: Any
     log: str = None
     exc: DriverWrapperException = None
+    log_args: Tuple[Any, ...] = ()
@@ -89,7 +89,7 @@ class PlayDriver(Logging, DriverWrapperABC):
         :return: :obj:`.PlayDriver` - The current instance of the driver wrapper.
         """
         if not silent:
-            self.log(f'Navigating to url {url}')
+            self.log('Navigating to url %s', url)
 
         self.driver.goto(url)
         return self
@@ -423,7 +423,7 @@ class PlayDriver(Logging, DriverWrapperABC):
         :return: :obj:`.PlayDriver` - The current instance of the driver wrapper.
         """
         if not silent:
-            self.log(f'Click by given coordinates (x: {x}, y: {y})')
+            self.log('Click by given coordinates (x: %s, y: %s)', x, y)
 
         self.driver.mouse.click(x=x, y=y)
         return self
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import time
 from abc import ABC
-from typing import Union, List, Any
+from typing import Union, List, Any, Optional, Iterable
 
 from PIL.Image import Image
 from mops.keyboard_keys import KeyboardKeys
@@ -11,8 +11,12 @@ from playwright.sync_api import TimeoutError as PlayTimeoutError, Error
 from playwright.sync_api import Page as PlaywrightPage
 from playwright.sync_api import Locator, Page, Browser, BrowserContext
 
+from mops.mixins.objects.elements_sequence import ElementsSequence
 from mops.mixins.objects.size import Size
 from mops.mixins.objects.location import Location
+from mops.mixins.objects.polling_strategy import PollingStrategy
+from mops.mixins.objects.snapshot import ElementSnapshot, get_snapshot_fields
+from mops.js_scripts import get_element_snapshot_play_js, get_element_visibility_play_js
 from mops.utils.selector_synchronizer import get_platform_locator, set_playwright_locator
 from mops.abstraction.element_abc import ElementABC
 from mops.exceptions import TimeoutException, InvalidSelectorException
@@ -70,13 +74,27 @@ class PlayElement(ElementABC, Logging, ABC):
         self._element = base_element
     
     @property
-    def all_elements(self) -> Union[List[PlayElement], List[Any]]:
+    def all_elements(self) -> ElementsSequence:
         """
-        Returns a list of all matching elements.
+        Returns a lazy sequence of all matching elements.
 
-        :return: A list of wrapped :class:`PlayElement` objects.
+        Matching elements are wrapped into :class:`PlayElement` objects on access.
+        The sequence supports :func:`len`, indexing, slicing, iteration
+        and the `nth(index)`, `first` and `last` shortcuts.
+
+        **Selenium/Appium:**
+
+        - All matching elements are found within a single call.
+
+        **Playwright:**
+
+        - Indexing is mapped to `locator.nth()`, so matching elements are not fetched in advance.
+          The index is validated by a single `locator.count()` call per sequence.
+
+        :return: A lazy sequence of wrapped :class:`PlayElement` objects.
         """
-        return self._get_all_elements(self.element.all())
+        locator = self.element
+        return ElementsSequence(self._wrap_element, count=locator.count, nth=locator.nth, last=lambda: locator.last)
 
     # Element interaction
 
@@ -90,6 +108,7 @@ class PlayElement(ElementABC, Logging, ABC):
         **Selenium/Appium:**
 
         Selenium Safari using js click instead.
+        Not interactable, intercepted or stale clicks are retried according to the :class:`.RetryPolicy`.
 
         :param kwargs: compatibility arg for playwright
 
@@ -99,7 +118,7 @@ class PlayElement(ElementABC, Logging, ABC):
 
         :return: :class:`PlayElement`
         """
-        self.log(f'Click into "{self.name}"')
+        self.log('Click into "%s"', self.name)
 
         if force_wait:
             self.wait_visibility(silent=True)
@@ -117,7 +136,7 @@ class PlayElement(ElementABC, Logging, ABC):
         :type y: int
         :return: :class:`PlayElement`
         """
-        self.log(f'Click outside from "{self.name}"')
+        self.log('Click outside from "%s"', self.name)
 
         self._first_element.click(position={'x': float(x), 'y': float(y)}, force=True)
         return self
@@ -137,7 +156,7 @@ class PlayElement(ElementABC, Logging, ABC):
         x, y = calculate_coordinate_to_click(self, 0, 0)
 
         if not silent:
-            self.log(f'Click into the center (x: {x}, y: {y}) for "{self.name}"')
+            self.log('Click into the center (x: %s, y: %s) for "%s"', x, y, self.name)
 
         self.driver_wrapper.click_by_coordinates(x=x, y=y, silent=True)
         return self
@@ -156,7 +175,7 @@ class PlayElement(ElementABC, Logging, ABC):
         text = str(text)
 
         if not silent:
-            self.log(f'Type text "{cut_log_data(text)}" into "{self.name}"')
+            self.log(lambda: f'Type text "{cut_log_data(text)}" into "{self.name}"')
 
         self._first_element.type(text=text)
         return self
@@ -174,7 +193,7 @@ class PlayElement(ElementABC, Logging, ABC):
         :return: :class:`PlayElement`
         """
         if not silent:
-            self.log(f'Type text {cut_log_data(text)} into "{self.name}"')
+            self.log(lambda: f'Type text {cut_log_data(text)} into "{self.name}"')
 
         self._first_element.type(text=text, delay=sleep_gap)
         return self
@@ -188,7 +207,7 @@ class PlayElement(ElementABC, Logging, ABC):
         :return: :class:`PlayElement`
         """
         if not silent:
-            self.log(f'Clear text in "{self.name}"')
+            self.log('Clear text in "%s"', self.name)
 
         self._first_element.fill('')
         return self
@@ -202,7 +221,7 @@ class PlayElement(ElementABC, Logging, ABC):
         :return: :class:`PlayElement`
         """
         if not silent:
-            self.log(f'Hover over "{self.name}"')
+            self.log('Hover over "%s"', self.name)
 
         self._first_element.hover()
         return self
@@ -217,7 +236,7 @@ class PlayElement(ElementABC, Logging, ABC):
         :type y: int
         :return: :class:`PlayElement`
         """
-        self.log(f'Hover outside from "{self.name}"')
+        self.log('Hover outside from "%s"', self.name)
         self._first_element.hover(position={'x': float(x), 'y': float(y)}, force=True)
         return self
 
@@ -225,6 +244,10 @@ class PlayElement(ElementABC, Logging, ABC):
         """
         Checks the checkbox element.
 
+        **Selenium/Appium:**
+
+        - Not interactable, intercepted or stale clicks are retried according to the :class:`.RetryPolicy`.
+
         :return: :class:`PlayElement`
         """
         self._first_element.check()
@@ -235,6 +258,10 @@ class PlayElement(ElementABC, Logging, ABC):
         """
         Unchecks the checkbox element.
 
+        **Selenium/Appium:**
+
+        - Not interactable, intercepted or stale clicks are retried according to the :class:`.RetryPolicy`.
+
         :return: :class:`PlayElement`
         """
         self._first_element.uncheck()
@@ -243,7 +270,13 @@ class PlayElement(ElementABC, Logging, ABC):
 
     # Element waits
 
-    def wait_visibility(self, *, timeout: int = WAIT_EL, silent: bool = False) -> PlayElement:
+    def wait_visibility(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> PlayElement:
         """
         Waits until the element becomes visible.
         **Note:** The method requires the use of named arguments.
@@ -263,10 +296,13 @@ class PlayElement(ElementABC, Logging, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+          Not used by Playwright, that awaits the state of the element within the browser.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`PlayElement`
         """
         if not silent:
-            self.log(f'Wait until "{self.name}" becomes visible')
+            self.log('Wait until "%s" becomes visible', self.name)
 
         try:
             self._first_element.wait_for(state='visible', timeout=get_timeout_in_ms(timeout))
@@ -274,7 +310,13 @@ class PlayElement(ElementABC, Logging, ABC):
             raise TimeoutException(f'"{self.name}" not visible', timeout=timeout, info=self)
         return self
 
-    def wait_hidden(self, *, timeout: int = WAIT_EL, silent: bool = False) -> PlayElement:
+    def wait_hidden(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> PlayElement:
         """
         Waits until the element becomes hidden.
         **Note:** The method requires the use of named arguments.
@@ -294,17 +336,26 @@ class PlayElement(ElementABC, Logging, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+          Not used by Playwright, that awaits the state of the element within the browser.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`PlayElement`
         """
         if not silent:
-            self.log(f'Wait until "{self.name}" becomes hidden')
+            self.log('Wait until "%s" becomes hidden', self.name)
         try:
             self._first_element.wait_for(state='hidden', timeout=get_timeout_in_ms(timeout))
         except PlayTimeoutError:
             raise TimeoutException(f'"{self.name}" still visible', timeout=timeout, info=self)
         return self
 
-    def wait_availability(self, *, timeout: int = WAIT_EL, silent: bool = False) -> PlayElement:
+    def wait_availability(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> PlayElement:
         """
         Waits until the element becomes available in DOM tree. \n
         **Note:** The method requires the use of named arguments.
@@ -324,10 +375,13 @@ class PlayElement(ElementABC, Logging, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+          Not used by Playwright, that awaits the state of the element within the browser.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`PlayElement`
         """
         if not silent:
-            self.log(f'Wait until presence of "{self.name}"')
+            self.log('Wait until presence of "%s"', self.name)
 
         try:
             self._first_element.wait_for(state='attached', timeout=get_timeout_in_ms(timeout))
@@ -358,7 +412,7 @@ class PlayElement(ElementABC, Logging, ABC):
         :return: :class:`PlayElement`
         """
         if not silent:
-            self.log(f'Scroll element "{self.name}" into view')
+            self.log('Scroll element "%s" into view', self.name)
 
         self._first_element.scroll_into_view_if_needed()
 
@@ -433,7 +487,7 @@ class PlayElement(ElementABC, Logging, ABC):
         :return: :class:`bool`
         """
         if not silent:
-            self.log(f'Check visibility of "{self.name}"')
+            self.log('Check visibility of "%s"', self.name)
 
         try:
             return self._first_element.is_visible()
@@ -450,7 +504,7 @@ class PlayElement(ElementABC, Logging, ABC):
         :return: :class:`bool`
         """
         if not silent:
-            self.log(f'Check invisibility of "{self.name}"')
+            self.log('Check invisibility of "%s"', self.name)
 
         return self._first_element.is_hidden()
 
@@ -465,7 +519,7 @@ class PlayElement(ElementABC, Logging, ABC):
         :return: :class:`str` - The value of the specified attribute.
         """
         if not silent:
-            self.log(f'Get "{attribute}" from "{self.name}"')
+            self.log('Get "%s" from "%s"', attribute, self.name)
 
         return self._first_element.get_attribute(attribute)
 
@@ -478,7 +532,7 @@ class PlayElement(ElementABC, Logging, ABC):
         :return: :class:`list` of :class:`str` - A list containing the text content of all matching elements.
         """
         if not silent:
-            self.log(f'Get all texts from "{self.name}"')
+            self.log('Get all texts from "%s"', self.name)
 
         return self.element.all_text_contents()
 
@@ -491,9 +545,9 @@ class PlayElement(ElementABC, Logging, ABC):
         :return: :class:`int` - The number of matching elements.
         """
         if not silent:
-            self.log(f'Get elements count of "{self.name}"')
+            self.log('Get elements count of "%s"', self.name)
 
-        return len(self.all_elements)
+        return self.element.count()
 
     def get_rect(self) -> dict:
         """
@@ -504,6 +558,37 @@ class PlayElement(ElementABC, Logging, ABC):
         sorted_items: list = sorted(self.element.bounding_box().items(), reverse=True)
         return dict(sorted_items)
 
+    def snapshot(
+            self,
+            fields: Optional[Iterable[str]] = None,
+            attributes: Iterable[str] = (),
+            silent: bool = False,
+    ) -> ElementSnapshot:
+        """
+        Collect the state of the element within a single call to the browser.
+
+        **Appium:**
+
+        - The state is collected with a separate command for each field in the native context.
+
+        :param fields: The fields to collect: 'text', 'value', 'rect', 'displayed', 'enabled', 'checked'.
+          If :obj:`None` - all fields will be collected.
+        :type fields: typing.Optional[typing.Iterable[str]]
+        :param attributes: The names of attributes to collect, such as 'class', 'href', etc.
+        :type attributes: typing.Iterable[str]
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :return: A frozen snapshot object with the collected state of the element.
+        """
+        if not silent:
+            self.log('Get snapshot of "%s"', self.name)
+
+        snapshot_data = self._first_element.evaluate(
+            get_element_snapshot_play_js,
+            {'fields': get_snapshot_fields(fields), 'attributes': list(attributes)},
+        )
+        return ElementSnapshot(**snapshot_data)
+
     @property
     def size(self) -> Size:
         """
@@ -533,7 +618,7 @@ class PlayElement(ElementABC, Logging, ABC):
         :return: :class:`bool` - :obj:`True` if the element is enabled, :obj:`False` otherwise.
         """
         if not silent:
-            self.log(f'Check is element "{self.name}" enabled')
+            self.log('Check is element "%s" enabled', self.name)
 
         return self._first_element.is_enabled()
 
@@ -555,13 +640,24 @@ class PlayElement(ElementABC, Logging, ABC):
         """
         base = self.driver
         if self.parent:
-            self.log(f'Get element "{self.name}" from parent element "{self.parent.name}"', level='debug')
+            self.log('Get element "%s" from parent element "%s"', self.name, self.parent.name, level='debug')
 
             if is_group(self.parent) or is_element(self.parent):
                 base = self.parent.element
 
         return base
 
+    def _get_visibility_data(self) -> Optional[dict]:
+        """
+        Collects the displaying state, rect, viewport size and visibility ratio of the element.
+
+        :return: A dictionary {'displayed', 'rect', 'viewport', 'ratio'} or :obj:`None` if element is not available.
+        """
+        try:
+            return self.element.evaluate_all(get_element_visibility_play_js)
+        except Error as exc:
+            raise InvalidSelectorException(exc.message)
+
     @property
     def _first_element(self):
         """
@@ -0,0 +1,46 @@
+from typing import Callable
+
+import pytest
+
+from mops.utils import metrics
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Register markers of mops
+    """
+    config.addinivalue_line(
+        'markers',
+        'max_driver_calls(limit, driver_wrappers=None, top=5): '
+        'fail the test, if the count of driver calls within it exceeds the limit',
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    """
+    Count driver calls of the test marked with `max_driver_calls` marker
+    """
+    marker = item.get_closest_marker('max_driver_calls')
+
+    if marker is None:
+        yield
+        return
+
+    budget = metrics.max_driver_calls(*marker.args, **marker.kwargs)
+    budget.__enter__()
+    outcome = yield
+
+    try:
+        budget.__exit__(*(outcome.excinfo or (None, None, None)))
+    except metrics.DriverCallsBudgetException as exc:
+        outcome.force_exception(exc)
+
+
+@pytest.fixture
+def max_driver_calls() -> Callable:
+    """
+    Get the :func:`mops.utils.metrics.max_driver_calls` context manager,
+    that fails the block, if the count of driver calls within it exceeds the limit.
+    """
+    return metrics.max_driver_calls
@@ -112,10 +112,11 @@ class CoreDriver(Logging, DriverWrapperABC):
         :return: :obj:`.CoreDriver` - The current instance of the driver wrapper.
         """
         if not silent:
-            self.log(f'Navigating to url {url}')
+            self.log('Navigating to url %s', url)
 
         try:
             self.driver.get(url)
+            self._reset_resolved_elements()
         except SeleniumWebDriverException as exc:
             raise DriverWrapperException(f'Can\'t proceed to {url}. Original error: {exc.msg}')
 
@@ -176,6 +177,7 @@ class CoreDriver(Logging, DriverWrapperABC):
         """
         self.log('Reload current page')
         self.driver.refresh()
+        self._reset_resolved_elements()
         return self
 
     def go_forward(self) -> CoreDriver:
@@ -186,6 +188,7 @@ class CoreDriver(Logging, DriverWrapperABC):
         """
         self.log('Going forward')
         self.driver.forward()
+        self._reset_resolved_elements()
         return self
 
     def go_back(self) -> CoreDriver:
@@ -196,6 +199,7 @@ class CoreDriver(Logging, DriverWrapperABC):
         """
         self.log('Going back')
         self.driver.back()
+        self._reset_resolved_elements()
         return self
 
     def quit(self, silent: bool = False, trace_path: str = 'trace.zip'):
@@ -274,6 +278,7 @@ class CoreDriver(Logging, DriverWrapperABC):
         :return: :obj:`.CoreDriver` - The current instance of the driver wrapper.
         """
         self.driver.switch_to.frame(frame.element)
+        self._reset_resolved_elements()
         return self
 
     def switch_to_default_content(self) -> CoreDriver:
@@ -283,6 +288,7 @@ class CoreDriver(Logging, DriverWrapperABC):
         :return: :obj:`.CoreDriver` - The current instance of the driver wrapper.
         """
         self.driver.switch_to.default_content()
+        self._reset_resolved_elements()
         return self
 
     def execute_script(self, script: str, *args) -> Any:
@@ -310,6 +316,19 @@ class CoreDriver(Logging, DriverWrapperABC):
         self.driver.set_page_load_timeout(timeout)
         return self
 
+    def set_script_timeout(self, timeout: Union[int, float] = 30) -> CoreDriver:
+        """
+        Set the maximum time to wait for an asynchronous script to finish execution before throwing an error.
+        Selenium/Appium only.
+
+        :param timeout: The timeout duration to set, in seconds.
+        :type timeout: typing.Union[int, float]
+        :return: :obj:`.CoreDriver` - The current instance of the driver wrapper.
+        """
+        self.driver.set_script_timeout(timeout)
+        self._script_timeout = timeout
+        return self
+
     def switch_to_alert(self, timeout: Union[int, float] = WAIT_EL) -> Alert:
         """
         Appium/Selenium only: Wait for an alert and switch to it.
@@ -365,7 +384,26 @@ class CoreDriver(Logging, DriverWrapperABC):
         :return: :obj:`.CoreDriver` - The current instance of the driver wrapper.
         """
         if not silent:
-            self.log(f'Click by given coordinates (x: {x}, y: {y})')
+            self.log('Click by given coordinates (x: %s, y: %s)', x, y)
 
         ActionChains(self.driver).move_to_location(x, y).click().perform()
         return self
+
+    def _get_script_timeout(self) -> Union[int, float]:
+        """
+        Get the script timeout of the driver. It's requested once per session and cached afterwards
+
+        :return: the script timeout in seconds
+        """
+        if self._script_timeout is None:
+            self._script_timeout = self.driver.timeouts.script
+
+        return self._script_timeout
+
+    def _reset_resolved_elements(self) -> None:
+        """
+        Invalidate cached element handles after switching of browsing context
+
+        :return: None
+        """
+        self._elements_generation += 1
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import time
 from abc import ABC
-from typing import Union, List, Any, Callable, TYPE_CHECKING
+from functools import partial
+from typing import Union, List, Any, Callable, Optional, Iterable, TYPE_CHECKING
 
 from PIL import Image
 
@@ -19,22 +20,35 @@ from selenium.common.exceptions import (
     ElementNotInteractableException as SeleniumElementNotInteractableException,
     ElementClickInterceptedException as SeleniumElementClickInterceptedException,
     StaleElementReferenceException as SeleniumStaleElementReferenceException,
+    MoveTargetOutOfBoundsException as SeleniumMoveTargetOutOfBoundsException,
+    WebDriverException as SeleniumWebDriverException,
 )
 from mops.abstraction.element_abc import ElementABC
 from mops.selenium.sel_utils import ActionChains
-from mops.js_scripts import get_element_size_js, get_element_position_on_screen_js
+from mops.js_scripts import (
+    get_element_size_js,
+    get_element_position_on_screen_js,
+    get_element_snapshot_js,
+    get_all_texts_js,
+    get_element_visibility_js,
+    wait_in_browser_js,
+)
 from mops.keyboard_keys import KeyboardKeys
+from mops.mixins.objects.elements_sequence import ElementsSequence
 from mops.mixins.objects.location import Location
+from mops.mixins.objects.polling_strategy import PollingStrategy
 from mops.mixins.objects.scrolls import ScrollTo, ScrollTypes, scroll_into_view_blocks
 from mops.mixins.objects.size import Size
+from mops.mixins.objects.snapshot import ElementSnapshot, get_snapshot_fields
 from mops.shared_utils import cut_log_data, _scaled_screenshot
-from mops.utils.internal_utils import WAIT_EL, safe_call, get_dict, HALF_WAIT_EL, wait_condition, is_group
+from mops.utils.browser_waits import get_browser_wait_chunk, get_browser_wait_predicate
+from mops.utils.selector_synchronizer import get_locators_chain
+from mops.utils.internal_utils import WAIT_EL, safe_call, get_dict, wait_condition, is_group, retry_interaction
 from mops.exceptions import (
     TimeoutException,
     InvalidSelectorException,
     DriverWrapperException,
     NoSuchElementException,
-    ElementNotInteractableException,
     NoSuchParentException,
 )
 
@@ -42,12 +56,22 @@ if TYPE_CHECKING:
     from mops.base.element import Element
 
 
+INTERACTION_EXCEPTIONS = (
+    SeleniumElementNotInteractableException,
+    SeleniumElementClickInterceptedException,
+    SeleniumMoveTargetOutOfBoundsException,
+)
+STALE_EXCEPTIONS = (SeleniumStaleElementReferenceException, )
+
+
 class CoreElement(ElementABC, ABC):
 
     parent: Union[Element]
     locator_type: str
     _element: Union[None, SeleniumWebElement, AppiumWebElement] = None
     _cached_element: Union[None, SeleniumWebElement, AppiumWebElement] = None
+    _resolved_element: Union[None, SeleniumWebElement, AppiumWebElement] = None
+    _resolved_generation: int = -1
 
     # Element
 
@@ -70,13 +94,27 @@ class CoreElement(ElementABC, ABC):
         self._element = base_element
 
     @property
-    def all_elements(self) -> Union[List[CoreElement], List[Any]]:
+    def all_elements(self) -> ElementsSequence:
         """
-        Returns a list of all matching elements.
+        Returns a lazy sequence of all matching elements.
+
+        Matching elements are wrapped into :class:`CoreElement` objects on access.
+        The sequence supports :func:`len`, indexing, slicing, iteration
+        and the `nth(index)`, `first` and `last` shortcuts.
+
+        **Selenium/Appium:**
+
+        - All matching elements are found within a single call.
 
-        :return: A list of wrapped :class:`CoreElement` objects.
+        **Playwright:**
+
+        - Indexing is mapped to `locator.nth()`, so matching elements are not fetched in advance.
+          The index is validated by a single `locator.count()` call per sequence.
+
+        :return: A lazy sequence of wrapped :class:`CoreElement` objects.
         """
-        return self._get_all_elements(self._find_elements())
+        sources = self._find_elements()
+        return ElementsSequence(self._wrap_element, count=lambda: len(sources), nth=sources.__getitem__)
 
     # Element interaction
 
@@ -90,6 +128,7 @@ class CoreElement(ElementABC, ABC):
         **Selenium/Appium:**
 
         Selenium Safari using js click instead.
+        Not interactable, intercepted or stale clicks are retried according to the :class:`.RetryPolicy`.
 
         :param kwargs: compatibility arg for playwright
 
@@ -99,30 +138,9 @@ class CoreElement(ElementABC, ABC):
 
         :return: :class:`CoreElement`
         """
-        self.log(f'Click into "{self.name}"')
-
-        self.element = self._get_element(force_wait=force_wait)
-
-        selenium_exc_msg = None
-        start_time = time.time()
-        while time.time() - start_time < HALF_WAIT_EL:
-            try:
-                element = self.wait_enabled(silent=True).element
-                element.click()
-                return self
-            except (
-                    SeleniumElementNotInteractableException,
-                    SeleniumElementClickInterceptedException,
-                    SeleniumStaleElementReferenceException,
-            ) as exc:
-                selenium_exc_msg = exc.msg
-            finally:
-                self.element = None
-
-        raise ElementNotInteractableException(
-            f'Element "{self.name}" not interactable after {HALF_WAIT_EL} seconds. {self.get_element_info()}. '
-            f'Original error: {selenium_exc_msg}'
-        )
+        self.log('Click into "%s"', self.name)
+        self._interact(self._click_element, force_wait=force_wait)
+        return self
 
     def type_text(self, text: Union[str, KeyboardKeys], silent: bool = False) -> CoreElement:
         """
@@ -137,7 +155,7 @@ class CoreElement(ElementABC, ABC):
         text = str(text)
 
         if not silent:
-            self.log(f'Type text "{cut_log_data(text)}" into "{self.name}"')
+            self.log(lambda: f'Type text "{cut_log_data(text)}" into "{self.name}"')
 
         self.element.send_keys(text)
         return self
@@ -157,7 +175,7 @@ class CoreElement(ElementABC, ABC):
         text = str(text)
 
         if not silent:
-            self.log(f'Type text "{cut_log_data(text)}" into "{self.name}"')
+            self.log(lambda: f'Type text "{cut_log_data(text)}" into "{self.name}"')
 
         element = self.element
         for letter in str(text):
@@ -174,7 +192,7 @@ class CoreElement(ElementABC, ABC):
         :return: :class:`CoreElement`
         """
         if not silent:
-            self.log(f'Clear text in "{self.name}"')
+            self.log('Clear text in "%s"', self.name)
 
         self.element.clear()
         return self
@@ -183,38 +201,38 @@ class CoreElement(ElementABC, ABC):
         """
         Checks the checkbox element.
 
-        :return: :class:`CoreElement`
-        """
-        self.element = self._get_element(wait=self.wait_availability)
+        **Selenium/Appium:**
 
-        try:
-            if not self.is_checked():
-                self.click(with_wait=False)
-        finally:
-            self.element = None
+        - Not interactable, intercepted or stale clicks are retried according to the :class:`.RetryPolicy`.
 
+        :return: :class:`CoreElement`
+        """
+        self._interact(lambda: self.is_checked() or self._click_element(), wait=self.wait_availability)
         return self
 
     def uncheck(self) -> CoreElement:
         """
         Unchecks the checkbox element.
 
-        :return: :class:`CoreElement`
-        """
-        self.element = self._get_element(wait=self.wait_availability)
+        **Selenium/Appium:**
 
-        try:
-            if self.is_checked():
-                self.click(with_wait=False)
-        finally:
-            self.element = None
+        - Not interactable, intercepted or stale clicks are retried according to the :class:`.RetryPolicy`.
 
+        :return: :class:`CoreElement`
+        """
+        self._interact(lambda: not self.is_checked() or self._click_element(), wait=self.wait_availability)
         return self
 
     # Element waits
 
     @wait_condition
-    def wait_visibility(self, *, timeout: int = WAIT_EL, silent: bool = False) -> CoreElement:
+    def wait_visibility(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> CoreElement:
         """
         Waits until the element becomes visible.
         **Note:** The method requires the use of named arguments.
@@ -234,16 +252,26 @@ class CoreElement(ElementABC, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+          Not used by Playwright, that awaits the state of the element within the browser.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`CoreElement`
         """
         return Result(  # noqa
             execution_result=self.is_displayed(silent=True),
-            log=f'Wait until "{self.name}" becomes visible',
-            exc=TimeoutException(f'"{self.name}" not visible', info=self)
+            log='Wait until "%s" becomes visible',
+            exc=TimeoutException(f'"{self.name}" not visible', info=self),
+            log_args=(self.name,),
         )
 
     @wait_condition
-    def wait_hidden(self, *, timeout: int = WAIT_EL, silent: bool = False) -> CoreElement:
+    def wait_hidden(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> CoreElement:
         """
         Waits until the element becomes hidden.
         **Note:** The method requires the use of named arguments.
@@ -263,16 +291,26 @@ class CoreElement(ElementABC, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+          Not used by Playwright, that awaits the state of the element within the browser.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`CoreElement`
         """
         return Result(  # noqa
             execution_result=self.is_hidden(silent=True),
-            log=f'Wait until "{self.name}" becomes hidden',
+            log='Wait until "%s" becomes hidden',
             exc=TimeoutException(f'"{self.name}" still visible', info=self),
+            log_args=(self.name,),
         )
 
     @wait_condition
-    def wait_availability(self, *, timeout: int = WAIT_EL, silent: bool = False) -> CoreElement:
+    def wait_availability(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None
+    ) -> CoreElement:
         """
         Waits until the element becomes available in DOM tree. \n
         **Note:** The method requires the use of named arguments.
@@ -292,12 +330,16 @@ class CoreElement(ElementABC, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param polling: The polling strategy for the call. Default: the strategy of the element or driver wrapper.
+          Not used by Playwright, that awaits the state of the element within the browser.
+        :type polling: typing.Optional[PollingStrategy]
         :return: :class:`CoreElement`
         """
         return Result(  # noqa
             execution_result=self.is_available(),
-            log=f'Wait until presence of "{self.name}"',
+            log='Wait until presence of "%s"',
             exc=TimeoutException(f'"{self.name}" not available in DOM', info=self),
+            log_args=(self.name,),
         )
 
     # Element state
@@ -323,7 +365,7 @@ class CoreElement(ElementABC, ABC):
         :return: :class:`CoreElement`
         """
         if not silent:
-            self.log(f'Scroll element "{self.name}" into view')
+            self.log('Scroll element "%s" into view', self.name)
 
         assert block in scroll_into_view_blocks, f'Provide one of {scroll_into_view_blocks} option in `block` argument'
 
@@ -411,7 +453,7 @@ class CoreElement(ElementABC, ABC):
         :return: :class:`bool`
         """
         if not silent:
-            self.log(f'Check displaying of "{self.name}"')
+            self.log('Check displaying of "%s"', self.name)
 
         is_displayed = self.is_available()
 
@@ -429,7 +471,7 @@ class CoreElement(ElementABC, ABC):
         :return: :class:`bool`
         """
         if not silent:
-            self.log(f'Check invisibility of "{self.name}"')
+            self.log('Check invisibility of "%s"', self.name)
 
         return not self.is_displayed(silent=True)
 
@@ -444,7 +486,7 @@ class CoreElement(ElementABC, ABC):
         :return: :class:`str` - The value of the specified attribute.
         """
         if not silent:
-            self.log(f'Get "{attribute}" from "{self.name}"')
+            self.log('Get "%s" from "%s"', attribute, self.name)
 
         return self.element.get_attribute(attribute)
 
@@ -457,10 +499,15 @@ class CoreElement(ElementABC, ABC):
         :return: :class:`list` of :class:`str` - A list containing the text content of all matching elements.
         """
         if not silent:
-            self.log(f'Get all texts from "{self.name}"')
+            self.log('Get all texts from "%s"', self.name)
 
         self.wait_visibility(silent=True)
-        return list(element_item.text for element_item in self.all_elements)
+
+        if self.driver_wrapper.is_appium and self.driver_wrapper.is_native_context:
+            return list(element_item.text for element_item in self.all_elements)
+
+        text_property = 'textContent' if self.driver_wrapper.is_safari else 'innerText'
+        return self.driver.execute_script(get_all_texts_js, self._find_elements(), text_property)
 
     def get_elements_count(self, silent: bool = False) -> int:
         """
@@ -471,9 +518,9 @@ class CoreElement(ElementABC, ABC):
         :return: :class:`int` - The number of matching elements.
         """
         if not silent:
-            self.log(f'Get elements count of "{self.name}"')
+            self.log('Get elements count of "%s"', self.name)
 
-        return len(self.all_elements)
+        return len(self._find_elements())
 
     def get_rect(self) -> dict:
         """
@@ -484,6 +531,41 @@ class CoreElement(ElementABC, ABC):
         sorted_items = sorted({**get_dict(self.size), **get_dict(self.location)}.items(), reverse=True)
         return dict(sorted_items)
 
+    def snapshot(
+            self,
+            fields: Optional[Iterable[str]] = None,
+            attributes: Iterable[str] = (),
+            silent: bool = False,
+    ) -> ElementSnapshot:
+        """
+        Collect the state of the element within a single call to the browser.
+
+        **Appium:**
+
+        - The state is collected with a separate command for each field in the native context.
+
+        :param fields: The fields to collect: 'text', 'value', 'rect', 'displayed', 'enabled', 'checked'.
+          If :obj:`None` - all fields will be collected.
+        :type fields: typing.Optional[typing.Iterable[str]]
+        :param attributes: The names of attributes to collect, such as 'class', 'href', etc.
+        :type attributes: typing.Iterable[str]
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :return: A frozen snapshot object with the collected state of the element.
+        """
+        if not silent:
+            self.log('Get snapshot of "%s"', self.name)
+
+        fields, attributes = get_snapshot_fields(fields), list(attributes)
+        self.element = self._get_element(wait=self.wait_availability)
+
+        try:
+            snapshot_data = self.execute_script(get_element_snapshot_js, fields, attributes)
+        finally:
+            self.element = None
+
+        return ElementSnapshot(**snapshot_data)
+
     @property
     def size(self) -> Size:
         """
@@ -511,7 +593,7 @@ class CoreElement(ElementABC, ABC):
         :return: :class:`bool` - :obj:`True` if the element is enabled, :obj:`False` otherwise.
         """
         if not silent:
-            self.log(f'Check is element "{self.name}" enabled')
+            self.log('Check is element "%s" enabled', self.name)
 
         return self.element.is_enabled()
 
@@ -525,6 +607,57 @@ class CoreElement(ElementABC, ABC):
 
     # Mixin
 
+    def _get_visibility_data(self) -> Optional[dict]:
+        """
+        Collects the displaying state, rect, viewport size and visibility ratio of the element.
+
+        :return: A dictionary {'displayed', 'rect', 'viewport', 'ratio'} or :obj:`None` if element is not available.
+        """
+        if not self.is_available():
+            return None
+
+        return safe_call(self.driver.execute_script, get_element_visibility_js, self._cached_element)
+
+    def _wait_in_browser(self, method_name: str, args: tuple, kwargs: dict, timeout: Union[int, float]) -> Optional[bool]:
+        """
+        Wait for the condition of given wait method within the browser.
+        The condition is checked on DOM mutations and animation frames by a single async script.
+        Long waits are split into chunks, that fit into the script timeout of the driver.
+
+        :param method_name: name of wait method
+        :param args: positional arguments of wait method
+        :param kwargs: keyword arguments of wait method, except timeout and silent
+        :param timeout: the maximum time to wait for the condition (in seconds)
+        :return: :obj:`True` if the condition is met, :obj:`False` if timed out,
+          :obj:`None` if the condition can't be checked within the browser
+        """
+        if timeout <= 0 or (self.driver_wrapper.is_appium and self.driver_wrapper.is_native_context):
+            return None
+
+        predicate = get_browser_wait_predicate(method_name, args, kwargs)
+        chain = get_locators_chain(self) if predicate else None
+
+        if not chain:
+            return None
+
+        deadline = time.time() + timeout
+
+        try:
+            max_chunk = get_browser_wait_chunk(self.driver_wrapper._get_script_timeout())
+
+            if max_chunk <= 0:
+                return None
+
+            while True:
+                chunk = min(deadline - time.time(), max_chunk)
+                is_passed = self.driver.execute_async_script(wait_in_browser_js, chain, predicate, int(chunk * 1000))
+
+                if is_passed or time.time() >= deadline:
+                    return bool(is_passed)
+        except SeleniumWebDriverException as exc:
+            self.log('Browser-side wait for "%s" is not available: %s', self.name, exc.msg, level='debug')
+            return None
+
     def _get_wait(self, timeout: int = WAIT_EL) -> WebDriverWait:
         """
         Get wait with depends on parent element if available
@@ -542,6 +675,45 @@ class CoreElement(ElementABC, ABC):
         """
         return ActionChains(self.driver)
 
+    def _interact(self, action: Callable[[], Any], wait: Union[bool, Callable] = True, force_wait: bool = False) -> Any:
+        """
+        Perform the interaction with the element, retried according to the retry policy.
+        The element is resolved once and re-resolved only if it went stale,
+        waiting for it within the remaining time of the retry policy.
+
+        :param action: function, that performs the interaction
+        :param wait: wait strategy for element before the first attempt
+        :param force_wait: force wait for element before the first attempt
+        :return: result of the action
+        """
+        def resolve_stale_element(timeout: Union[int, float]):
+            stale_wait = self.wait_visibility if wait is True else wait
+
+            if stale_wait:
+                stale_wait = partial(stale_wait, timeout=timeout)
+
+            self.element = None
+            self.element = self._get_element(wait=stale_wait)
+
+        self.element = self._get_element(wait=wait, force_wait=force_wait)
+
+        try:
+            return retry_interaction(
+                self,
+                action,
+                retry_on=INTERACTION_EXCEPTIONS,
+                stale_on=STALE_EXCEPTIONS,
+                on_stale=resolve_stale_element,
+            )
+        finally:
+            self.element = None
+
+    def _click_element(self) -> None:
+        """
+        Click on the resolved element, once it is enabled
+        """
+        self.wait_enabled(silent=True).element.click()
+
     def _get_element(self, wait: Union[bool, Callable] = True, force_wait: bool = False) -> SeleniumWebElement:
         """
         Get selenium element from driver or parent element
@@ -597,10 +769,59 @@ class CoreElement(ElementABC, ABC):
                 return base
 
         if self.parent:
-            base = self.parent._get_element(wait=wait)
+            if self.driver_wrapper.cache_parent_elements:
+                base = self.parent._get_resolved_element(wait=wait)
+            else:
+                base = self.parent._get_element(wait=wait)
 
         return base
 
+    def _get_resolved_element(self, wait: Union[bool, Callable] = True) -> SeleniumWebElement:
+        """
+        Get element from the resolved handles cache or find it and store it in the cache.
+        Used for parent elements when :attr:`DriverWrapper.cache_parent_elements` is enabled
+
+        :param wait: wait strategy for element and/or element parent before grab
+        :return: SeleniumWebElement
+        """
+        generation = self.driver_wrapper._elements_generation
+
+        if self._resolved_element is None or self._resolved_generation != generation:
+            self._resolved_element = self._get_element(wait=wait)
+            self._resolved_generation = generation
+
+        return self._resolved_element
+
+    def _drop_resolved_element(self) -> None:
+        """
+        Remove the resolved handle of current element from the cache
+
+        :return: None
+        """
+        self._resolved_element = None
+        self._resolved_generation = -1
+
+    def _find_from_base(self, method_name: str, wait_parent: bool = False) -> Any:
+        """
+        Call find method of base object.
+        The stale cached parent will be re-resolved only once, starting from the stale level.
+
+        :param method_name: find method name of base object: find_element or find_elements
+        :param wait_parent: wait for base(parent) element
+        :return: result of find method
+        """
+        base = self._get_base(wait=wait_parent)
+
+        try:
+            return getattr(base, method_name)(self.locator_type, self.locator)
+        except SeleniumStaleElementReferenceException:
+            if not self.parent or base is not self.parent._resolved_element:
+                raise
+
+            self.parent._drop_resolved_element()
+            base = self._get_base(wait=wait_parent)
+            return getattr(base, method_name)(self.locator_type, self.locator)
+
     def _find_element(self, wait_parent: bool = False) -> Union[SeleniumWebElement, AppiumWebElement]:
         """
         Find selenium/appium element
@@ -608,11 +829,10 @@ class CoreElement(ElementABC, ABC):
         :param wait_parent: wait for base(parent) element
         :return: SeleniumWebElement or AppiumWebElement
         """
-        base = self._get_base(wait=wait_parent)
         self._cached_element = None
 
         try:
-            element = base.find_element(self.locator_type, self.locator)
+            element = self._find_from_base('find_element', wait_parent=wait_parent)
             self._cached_element = element
             return element
         except (SeleniumInvalidArgumentException, SeleniumInvalidSelectorException) as exc:
@@ -627,11 +847,10 @@ class CoreElement(ElementABC, ABC):
         :param wait_parent: wait for base(parent) element
         :return: list of SeleniumWebElement or AppiumWebElement
         """
-        base = self._get_base(wait=wait_parent)
         self._cached_element = None
 
         try:
-            elements = base.find_elements(self.locator_type, self.locator)
+            elements = self._find_from_base('find_elements', wait_parent=wait_parent)
 
             if elements:
                 self._cached_element = elements[0]
@@ -109,6 +109,7 @@ class MobileDriver(CoreDriver):
         self.driver.switch_to.context(self.native_context_name)
         self.__is_native_context = True
         self.__is_web_context = False
+        self._reset_resolved_elements()
         return self
 
     def switch_to_web(self) -> MobileDriver:
@@ -120,6 +121,7 @@ class MobileDriver(CoreDriver):
         self.driver.switch_to.context(self.web_context_name)
         self.__is_native_context = False
         self.__is_web_context = True
+        self._reset_resolved_elements()
         return self
 
     def get_web_view_context(self) -> Union[None, str]:
@@ -254,7 +256,7 @@ class MobileDriver(CoreDriver):
         :return: :obj:`.MobileDriver` - The current instance of the driver wrapper.
         """
         if not silent:
-            self.log(f'Tap by given coordinates (x: {x}, y: {y})')
+            self.log('Tap by given coordinates (x: %s, y: %s)', x, y)
 
         if self.is_ios:
             self.driver.tap(positions=[(x, y)])
@@ -57,6 +57,7 @@ class WebDriver(CoreDriver):
         :return: :obj:`.WebDriver` - The current instance of the driver wrapper, now switched to the new tab.
         """
         self.driver.switch_to.new_window('tab')
+        self._reset_resolved_elements()
         return self
 
     def switch_to_original_tab(self) -> WebDriver:
@@ -66,6 +67,7 @@ class WebDriver(CoreDriver):
         :return: :obj:`.WebDriver` - The current instance of the driver wrapper, now switched to the original tab.
         """
         self.driver.switch_to.window(self.original_tab)
+        self._reset_resolved_elements()
         return self
 
     def switch_to_tab(self, tab: int = -1) -> WebDriver:
@@ -82,6 +84,7 @@ class WebDriver(CoreDriver):
             tab = self.get_all_tabs()[tab - 1]
 
         self.driver.switch_to.window(tab)
+        self._reset_resolved_elements()
         return self
 
     def close_unused_tabs(self) -> WebDriver:
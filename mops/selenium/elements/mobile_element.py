@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import time
 from abc import ABC
+from typing import Optional, Iterable
 
 from PIL.Image import Image
 
 from mops.selenium.core.core_element import CoreElement
 from mops.mixins.objects.location import Location
 from mops.mixins.objects.size import Size
-from mops.utils.internal_utils import calculate_coordinate_to_click
+from mops.mixins.objects.snapshot import ElementSnapshot, get_snapshot_fields
+from mops.utils.internal_utils import calculate_coordinate_to_click, get_dict, get_visibility_ratio
 from mops.utils.selector_synchronizer import get_platform_locator, set_selenium_selector, set_appium_selector
 
 
@@ -40,7 +42,7 @@ class MobileElement(CoreElement, ABC):
         if self.driver_wrapper.is_ios:
             y += self.driver_wrapper.top_bar_height
 
-        self.log(f'Tap outside from "{self.name}" with coordinates (x: {x}, y: {y})')
+        self.log('Tap outside from "%s" with coordinates (x: %s, y: %s)', self.name, x, y)
 
         self.driver_wrapper.click_by_coordinates(x=x, y=y, silent=True)
         return self
@@ -63,7 +65,7 @@ class MobileElement(CoreElement, ABC):
             y += self.driver_wrapper.top_bar_height
 
         if not silent:
-            self.log(f'Tap into the center by coordinates (x: {x}, y: {y}) for "{self.name}"')
+            self.log('Tap into the center by coordinates (x: %s, y: %s) for "%s"', x, y, self.name)
 
         self.driver_wrapper.click_by_coordinates(x, y, silent=True)
 
@@ -78,7 +80,7 @@ class MobileElement(CoreElement, ABC):
         :return: :class:`MobileElement`
         """
         if not silent:
-            self.log(f'Hover over "{self.name}"')
+            self.log('Hover over "%s"', self.name)
 
         self.click_into_center()
         return self
@@ -135,6 +137,49 @@ class MobileElement(CoreElement, ABC):
 
         return image
 
+    def snapshot(
+            self,
+            fields: Optional[Iterable[str]] = None,
+            attributes: Iterable[str] = (),
+            silent: bool = False,
+    ) -> ElementSnapshot:
+        """
+        Collect the state of the element within a single call to the browser.
+
+        **Appium:**
+
+        - The state is collected with a separate command for each field in the native context.
+
+        :param fields: The fields to collect: 'text', 'value', 'rect', 'displayed', 'enabled', 'checked'.
+          If :obj:`None` - all fields will be collected.
+        :type fields: typing.Optional[typing.Iterable[str]]
+        :param attributes: The names of attributes to collect, such as 'class', 'href', etc.
+        :type attributes: typing.Iterable[str]
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :return: A frozen snapshot object with the collected state of the element.
+        """
+        if not self.driver_wrapper.is_native_context:
+            return CoreElement.snapshot(self, fields=fields, attributes=attributes, silent=silent)
+
+        if not silent:
+            self.log('Get snapshot of "%s"', self.name)
+
+        fields = get_snapshot_fields(fields)
+        getters = {
+            'text': lambda: self.text,
+            'value': lambda: self.value,
+            'rect': self.get_rect,
+            'displayed': lambda: self.is_displayed(silent=True),
+            'enabled': lambda: self.is_enabled(silent=True),
+            'checked': self.is_checked,
+        }
+        snapshot_data = {name: getters[name]() for name in fields}
+        snapshot_data['present'] = True
+        snapshot_data['attributes'] = {name: self.get_attribute(name, silent=True) for name in attributes}
+
+        return ElementSnapshot(**snapshot_data)
+
     @property
     def size(self) -> Size:
         """
@@ -159,6 +204,26 @@ class MobileElement(CoreElement, ABC):
 
         return CoreElement.location.fget(self)
 
+    def _get_visibility_data(self) -> Optional[dict]:
+        """
+        Collects the displaying state, rect, viewport size and visibility ratio of the element.
+
+        :return: A dictionary {'displayed', 'rect', 'viewport', 'ratio'} or :obj:`None` if element is not available.
+        """
+        if not self.driver_wrapper.is_native_context:
+            return CoreElement._get_visibility_data(self)
+
+        if not self.is_available():
+            return None
+
+        rect, viewport = self.get_rect(), self.driver_wrapper.get_inner_window_size()
+        return {
+            'displayed': self.is_displayed(silent=True),
+            'rect': rect,
+            'viewport': get_dict(viewport),
+            'ratio': get_visibility_ratio(rect, viewport),
+        }
+
     def _element_box(self) -> tuple:
         """
         Get element coordinates on screen for ios safari
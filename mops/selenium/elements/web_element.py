@@ -17,34 +17,6 @@ class WebElement(CoreElement, ABC):
         self.locator = get_platform_locator(self)
         set_selenium_selector(self)
 
-    def click(self, *, force_wait: bool = True, **kwargs) -> WebElement:
-        """
-        Clicks on the element.
-
-        :param force_wait: If :obj:`True`, waits for element visibility before clicking.
-        :type force_wait: bool
-
-        **Selenium/Appium:**
-
-        Selenium Safari using js click instead.
-
-        :param kwargs: compatibility arg for playwright
-
-        **Playwright:**
-
-        :param kwargs: `any kwargs params from source API <https://playwright.dev/python/docs/api/class-locator#locator-click>`_
-
-        :return: :class:`WebElement`
-        """
-        if self.driver_wrapper.is_safari:
-            self.log(f'Click into "{self.name}"')
-            self.execute_script(js_click)
-        else:
-            CoreElement.click(self, force_wait=force_wait, **kwargs)
-
-        return self
-
-
     def hover(self, silent: bool = False) -> WebElement:
         """
         Hover the mouse over the current element.
@@ -54,13 +26,9 @@ class WebElement(CoreElement, ABC):
         :return: :class:`WebElement`
         """
         if not silent:
-            self.log(f'Hover over "{self.name}"')
+            self.log('Hover over "%s"', self.name)
 
-        self._action_chains\
-            .move_to_element(self.element)\
-            .move_by_offset(1, 1)\
-            .move_to_element(self.element)\
-            .perform()
+        self._interact(self._hover_element)
         return self
 
     def hover_outside(self, x: int = 0, y: int = -5) -> WebElement:
@@ -73,7 +41,7 @@ class WebElement(CoreElement, ABC):
         :type y: int
         :return: :class:`WebElement`
         """
-        self.log(f'Hover outside from "{self.name}"')
+        self.log('Hover outside from "%s"', self.name)
 
         if not self.is_fully_visible(silent=True):
             self.scroll_into_view()
@@ -94,7 +62,7 @@ class WebElement(CoreElement, ABC):
         :type y: int
         :return: :class:`WebElement`
         """
-        self.log(f'Click outside from "{self.name}"')
+        self.log('Click outside from "%s"', self.name)
 
         if not self.is_fully_visible(silent=True):
             self.scroll_into_view()
@@ -118,7 +86,27 @@ class WebElement(CoreElement, ABC):
         x, y = calculate_coordinate_to_click(self, 0, 0)
 
         if not silent:
-            self.log(f'Click into the center (x: {x}, y: {y}) for "{self.name}"')
+            self.log('Click into the center (x: %s, y: %s) for "%s"', x, y, self.name)
 
         self.driver_wrapper.click_by_coordinates(x=x, y=y, silent=True)
         return self
+
+    def _click_element(self) -> None:
+        """
+        Click on the resolved element, once it is enabled. Selenium Safari using js click instead
+        """
+        if self.driver_wrapper.is_safari:
+            self.execute_script(js_click)
+        else:
+            CoreElement._click_element(self)
+
+    def _hover_element(self) -> None:
+        """
+        Hover the mouse over the resolved element
+        """
+        element = self.element
+        self._action_chains\
+            .move_to_element(element)\
+            .move_by_offset(1, 1)\
+            .move_to_element(element)\
+            .perform()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Optional, Union
+
+
+BROWSER_WAIT_CHUNK = 20
+BROWSER_WAIT_SCRIPT_TIMEOUT_MARGIN = 0.5
+
+browser_wait_predicates = {
+    'wait_visibility': 'visible',
+    'wait_hidden': 'hidden',
+    'wait_enabled': 'enabled',
+    'wait_for_text': 'text',
+    'wait_for_value': 'value',
+    'wait_elements_count': 'count',
+}
+
+
+def get_browser_wait_predicate(method_name: str, args: tuple, kwargs: dict) -> Optional[dict]:
+    """
+    Get predicate of wait method, that can be checked within the browser
+
+    :param method_name: name of wait method
+    :param args: positional arguments of wait method
+    :param kwargs: keyword arguments of wait method, except timeout and silent
+    :return: dict with predicate type and expected value or :obj:`None` if wait method is not supported
+    """
+    predicate_type = browser_wait_predicates.get(method_name)
+
+    if not predicate_type:
+        return None
+
+    expected = args[0] if args else next(iter(kwargs.values()), None)
+    return {'type': predicate_type, 'expected': expected}
+
+
+def get_browser_wait_chunk(script_timeout: Optional[Union[int, float]]) -> Union[int, float]:
+    """
+    Get the maximum duration of a single browser-side wait, that fits into the script timeout of the driver
+
+    :param script_timeout: script timeout of the driver (in seconds). :obj:`None` - no timeout
+    :return: the maximum duration of a single wait (in seconds). Non-positive if the timeout is too short
+    """
+    if script_timeout is None:
+        return BROWSER_WAIT_CHUNK
+
+    return min(BROWSER_WAIT_CHUNK, script_timeout - BROWSER_WAIT_SCRIPT_TIMEOUT_MARGIN)
@@ -3,15 +3,27 @@ from __future__ import annotations
 import sys
 import inspect
 import time
+from abc import ABCMeta
 from copy import copy
 from functools import lru_cache, wraps
-from typing import Any, Union, Callable
+from weakref import WeakKeyDictionary
+from typing import Any, Union, Callable, Optional, Tuple, Type
 
+from mops.mixins.objects.elements_sequence import ElementsSequence
+from mops.mixins.objects.polling_strategy import PollingStrategy, default_polling, default_appium_polling
+from mops.mixins.objects.retry_policy import RetryPolicy, default_retry_policy
 from mops.mixins.objects.size import Size
 from mops.mixins.objects.wait_result import Result
 from selenium.common.exceptions import StaleElementReferenceException as SeleniumStaleElementReferenceException
 
-from mops.exceptions import NoSuchElementException, InvalidSelectorException, TimeoutException, NoSuchParentException
+from mops.exceptions import (
+    DriverWrapperException,
+    NoSuchElementException,
+    InvalidSelectorException,
+    TimeoutException,
+    NoSuchParentException,
+    ElementNotInteractableException,
+)
 
 
 WAIT_METHODS_DELAY = 0.1
@@ -101,25 +113,132 @@ def is_driver_wrapper(obj: Any) -> bool:
 
 def initialize_objects(current_object, objects: dict, cls: Any):
     """
-    Copy objects and initializing them with driver_wrapper from current object
+    Copy objects and initializing them with driver_wrapper from current object.
+    Objects registered for lazy initialization are skipped.
 
     :param current_object: list of objects to initialize
     :param objects: list of objects to initialize
     :param cls: class of initializing objects
     :return: None
     """
+    lazy_objects = get_lazy_objects(current_object)
+
     for name, obj in objects.items():
-        copied_obj = copy(obj)
-        promote_parent_element(copied_obj, current_object, cls)
-        setattr(current_object, name, copied_obj(driver_wrapper=current_object.driver_wrapper))
-        initialize_objects(copied_obj, get_child_elements_with_names(copied_obj, cls), cls)
+        if id(obj) not in lazy_objects:
+            initialize_object(current_object, name, obj, cls)
+
+
+def initialize_object(current_object, name: str, obj: Any, cls: Any) -> Any:
+    """
+    Copy object and initialize it with driver_wrapper from current object
+
+    :param current_object: base object of the object
+    :param name: attribute name of the object
+    :param obj: object to initialize
+    :param cls: class of initializing objects
+    :return: initialized copy of the object
+    """
+    copied_obj = copy(obj)
+    promote_parent_element(copied_obj, current_object, cls)
+    setattr(current_object, name, copied_obj(driver_wrapper=current_object.driver_wrapper))
+    initialize_objects(copied_obj, get_child_elements_with_names(copied_obj, cls), cls)
+    return copied_obj
+
+
+def register_lazy_objects(current_object, objects: dict):
+    """
+    Register class level objects for initialization on first access, if `lazy_children` of current object is set
+
+    :param current_object: Page/Group object
+    :param objects: child objects of current object
+    :return: None
+    """
+    if getattr(current_object, 'lazy_children', False):
+        current_object._lazy_objects = {
+            id(obj): name for name, obj in objects.items() if name not in current_object.__dict__
+        }
+
+
+def get_lazy_objects(current_object) -> dict:
+    """
+    Get objects registered for lazy initialization
+
+    :param current_object: Page/Group object
+    :return: dict, where key is id of the class level object and value is its attribute name
+    """
+    return getattr(current_object, '__dict__', {}).get('_lazy_objects', {})
+
+
+def initialize_lazy_object(current_object, name: str, obj: Any, cls: Any) -> Any:
+    """
+    Initialize lazy object on first access and memoize it within current object
+
+    :param current_object: Page/Group object
+    :param name: attribute name of the object
+    :param obj: class level object
+    :param cls: class of initializing objects
+    :return: initialized copy of the object
+    """
+    initialized_obj = current_object.__dict__.get(name)
+
+    if initialized_obj is not None:
+        return initialized_obj
+
+    initialized_obj = initialize_object(current_object, name, obj, cls)
+
+    if is_group(current_object):
+        set_parent_for_child(current_object, initialized_obj, cls)
+
+    return initialized_obj
+
+
+def initialize_lazy_objects(current_object, objects: dict, cls: Any) -> dict:
+    """
+    Initialize lazy objects among given ones
+
+    :param current_object: Page/Group object
+    :param objects: child objects of current object, where key is the attribute name
+    :param cls: class of initializing objects
+    :return: dict of initialized objects
+    """
+    lazy_objects = get_lazy_objects(current_object)
+
+    if not lazy_objects:
+        return objects
+
+    return {
+        name: initialize_lazy_object(current_object, name, obj, cls) if id(obj) in lazy_objects else obj
+        for name, obj in objects.items()
+    }
+
+
+def get_child_elements_sequence(current_object, cls: Any) -> Union[list, ElementsSequence]:
+    """
+    Get child objects of current object. Lazy objects are initialized on access to the item of sequence
+
+    :param current_object: Page/Group object
+    :param cls: class of child objects
+    :return: list of child objects or lazy sequence if there are lazy objects
+    """
+    objects = get_child_elements_with_names(current_object, cls)
+
+    if not get_lazy_objects(current_object):
+        return list(objects.values())
+
+    names = list(objects)
+    return ElementsSequence(
+        wrap=lambda name: initialize_lazy_objects(current_object, {name: objects[name]}, cls)[name],
+        count=lambda: len(names),
+        nth=names.__getitem__,
+    )
 
 
 def set_parent_for_attr(base_obj: object, instance_class: Union[type, tuple], with_copy: bool = False):
     """
     Sets parent for all Elements/Group of given class.
     Should be called ONLY in Group object or all_elements method.
-    Copy of objects will be executed if with_copy is True. Required for all_elements method
+    Copy of objects will be executed if with_copy is True. Required for all_elements method.
+    Objects registered for lazy initialization are skipped.
 
     :param instance_class: attribute class to looking for
     :param base_obj: object of attribute
@@ -127,23 +246,39 @@ def set_parent_for_attr(base_obj: object, instance_class: Union[type, tuple], wi
     :return: self
     """
     child_elements = get_child_elements_with_names(base_obj, instance_class).items()
+    lazy_objects = get_lazy_objects(base_obj)
 
     for name, child in child_elements:
+        if id(child) in lazy_objects:
+            continue
+
         if with_copy:
             child = copy(child)
+            setattr(base_obj, name, child)
 
-        if (is_group(base_obj) and child.parent is None) or is_group(child.parent):
-            child.parent = base_obj
+        set_parent_for_child(base_obj, child, instance_class, with_copy)
 
-        if with_copy:
-            setattr(base_obj, name, child)
 
-        set_parent_for_attr(child, instance_class, with_copy)
+def set_parent_for_child(base_obj: object, child: Any, instance_class: Union[type, tuple], with_copy: bool = False):
+    """
+    Sets parent for given child of base object and all its children
+
+    :param base_obj: object of attribute
+    :param child: child object
+    :param instance_class: attribute class to looking for
+    :param with_copy: copy child objects or not
+    :return: None
+    """
+    if (is_group(base_obj) and child.parent is None) or is_group(child.parent):
+        child.parent = base_obj
+
+    set_parent_for_attr(child, instance_class, with_copy)
 
 
 def promote_parent_element(obj: Any, base_obj: Any, cls: Any):
     """
-    Promote parent object in Element if parent is another Element
+    Promote parent object in Element if parent is another Element.
+    Lazy parent is initialized before the promotion.
 
     :param obj: any element
     :param base_obj: base object of element: Page/Group instance
@@ -156,8 +291,13 @@ def promote_parent_element(obj: Any, base_obj: Any, cls: Any):
         return None
 
     if is_element_instance(initial_parent) and initial_parent != base_obj:
-        for el in get_child_elements(base_obj, cls):
+        lazy_objects = get_lazy_objects(base_obj)
+
+        for name, el in get_child_elements_with_names(base_obj, cls).items():
             if obj.parent.__base_obj_id == el.__base_obj_id:
+                if id(el) in lazy_objects:
+                    el = initialize_lazy_object(base_obj, name, el, cls)
+
                 obj.parent = el
 
 
@@ -177,12 +317,31 @@ def get_child_elements_with_names(obj: Any, instance: Union[type, tuple] = None)
 
     :returns: dict of page elements and page objects
     """
-    elements = {}
+    if not obj:
+        return {}
 
-    for attribute, value in get_all_attributes_from_object(obj).items():
-        if instance and isinstance(value, instance) or not instance:
-            if attribute != 'parent' and not attribute.startswith('__') and not attribute.endswith('__'):
-                elements.update({attribute: value})
+    reference_class = obj if inspect.isclass(obj) else obj.__class__
+    elements = dict(_get_class_children(reference_class, instance))
+
+    if inspect.isclass(obj):
+        return elements
+
+    class_attributes = get_class_attributes(reference_class)
+
+    for attribute, value in obj.__dict__.items():
+        if instance and not isinstance(value, instance):
+            if attribute in elements:
+                del elements[attribute]
+            continue
+
+        if not _is_child_attribute(attribute):
+            continue
+
+        if attribute not in elements and attribute in class_attributes:
+            # Keep the position of overridden class attribute
+            return _collect_child_elements(get_all_attributes_from_object(obj), instance)
+
+        elements[attribute] = value
 
     return elements
 
@@ -194,23 +353,32 @@ def get_all_attributes_from_object(reference_obj: Any) -> dict:
     :param reference_obj: reference object
     :return: dict of all attributes
     """
-    items = {}
-
     if not reference_obj:
-        return items
+        return {}
 
-    reference_class = reference_obj if inspect.isclass(reference_obj) else reference_obj.__class__
-    all_bases = list(inspect.getmro(reference_class))
-    all_bases.reverse()  # Reverse needed for collect subclasses attributes as base one
+    if inspect.isclass(reference_obj):
+        return dict(get_class_attributes(reference_obj))
 
-    for parent_class in all_bases:
+    return {**get_class_attributes(reference_obj.__class__), **reference_obj.__dict__}
 
-        if 'ABC' in str(parent_class) or parent_class == object:
-            continue
 
-        items.update(dict(parent_class.__dict__))
+def get_class_attributes(reference_class: type) -> dict:
+    """
+    Get attributes from given class and all its bases.
+    The result is computed once per class and recomputed only if any class of MRO got changed attributes.
+    The returned dict is shared, so it should not be modified.
+
+    :param reference_class: reference class
+    :return: dict of all class attributes
+    """
+    version = _get_class_version(reference_class)
+    schema = _classes_schema.get(reference_class)
 
-    return {**items, **get_attributes_from_object(reference_obj)}
+    if schema is None or schema.version != version:
+        schema = _ClassSchema(version, _collect_class_attributes(reference_class))
+        _classes_schema[reference_class] = schema
+
+    return schema.attributes
 
 
 def get_attributes_from_object(reference_obj: Any) -> dict:
@@ -233,6 +401,157 @@ def get_attributes_from_object(reference_obj: Any) -> dict:
     return items
 
 
+class _ClassSchema:
+    """ Cached attributes and child objects of the class """
+
+    __slots__ = ('version', 'attributes', 'children')
+
+    def __init__(self, version: tuple, attributes: dict):
+        self.version = version
+        self.attributes = attributes
+        self.children = {}
+
+
+_classes_schema: WeakKeyDictionary[type, _ClassSchema] = WeakKeyDictionary()
+
+
+class CachedAttributesMeta(ABCMeta):
+    """ Metaclass, that keeps cached attributes of its class and subclasses in sync with changed attributes """
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        previous = cls.__dict__.get(name, value)
+        super().__setattr__(name, value)
+
+        if _is_schema_value(previous) or _is_schema_value(value):
+            _invalidate_classes_schema(cls)
+        else:
+            _update_classes_schema(cls, name, value)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        _invalidate_classes_schema(cls)
+
+
+def _is_schema_value(value: Any) -> bool:
+    """
+    Check if the value affects the child objects of the class: Element/Group/Page object or descriptor
+
+    :param value: attribute value
+    :return: :obj:`True` if the cached attributes should be recollected
+    """
+    return isinstance(type(value), CachedAttributesMeta) or hasattr(type(value), '__get__')
+
+
+def _invalidate_classes_schema(changed_class: type) -> None:
+    """
+    Drop cached attributes of given class and its subclasses, so they will be recomputed on the next access
+
+    :param changed_class: the class with changed attributes
+    :return: None
+    """
+    for reference_class in list(_classes_schema.keys()):
+        if changed_class in reference_class.__mro__:
+            del _classes_schema[reference_class]
+
+
+def _update_classes_schema(changed_class: type, name: str, value: Any) -> None:
+    """
+    Replace the plain value within cached attributes of given class and its subclasses,
+    if the value isn't overridden by a subclass
+
+    :param changed_class: the class with changed attribute
+    :param name: attribute name
+    :param value: new attribute value
+    :return: None
+    """
+    if 'ABC' in str(changed_class):
+        return  # Attributes of abstract classes aren't collected
+
+    for reference_class, schema in list(_classes_schema.items()):
+        mro = reference_class.__mro__
+
+        if changed_class not in mro or name not in schema.attributes:
+            continue
+
+        overridden = any(
+            name in base.__dict__ and 'ABC' not in str(base)
+            for base in mro[:mro.index(changed_class)]
+        )
+
+        if not overridden:
+            schema.attributes[name] = value
+            schema.children.clear()
+
+
+def _get_class_version(reference_class: type) -> tuple:
+    """
+    Get the cheap version of the class, that is changed once any class of MRO got new attributes.
+    Replaced attributes of :class:`CachedAttributesMeta` classes are synced by the metaclass itself.
+
+    :param reference_class: reference class
+    :return: tuple of attributes count of each class of MRO
+    """
+    return tuple(len(base.__dict__) for base in reference_class.__mro__)
+
+
+def _get_class_children(reference_class: type, instance: Union[type, tuple, None]) -> dict:
+    """
+    Get child objects of given class by instance, computed once per class
+
+    :param reference_class: reference class
+    :param instance: instance of child objects
+    :return: dict of child objects
+    """
+    attributes = get_class_attributes(reference_class)
+    schema = _classes_schema[reference_class]
+    children = schema.children.get(instance)
+
+    if children is None:
+        children = _collect_child_elements(attributes, instance)
+        schema.children[instance] = children
+
+    return children
+
+
+def _collect_class_attributes(reference_class: type) -> dict:
+    """
+    Collect attributes from given class and all its bases
+
+    :param reference_class: reference class
+    :return: dict of all class attributes
+    """
+    items = {}
+    all_bases = list(inspect.getmro(reference_class))
+    all_bases.reverse()  # Reverse needed for collect subclasses attributes as base one
+
+    for parent_class in all_bases:
+
+        if 'ABC' in str(parent_class) or parent_class == object:
+            continue
+
+        items.update(dict(parent_class.__dict__))
+
+    return items
+
+
+def _collect_child_elements(attributes: dict, instance: Union[type, tuple, None]) -> dict:
+    """
+    Filter child objects from given attributes by instance
+
+    :param attributes: attributes of the object
+    :param instance: instance of child objects
+    :return: dict of child objects
+    """
+    return {
+        attribute: value for attribute, value in attributes.items()
+        if (not instance or isinstance(value, instance)) and _is_child_attribute(attribute)
+    }
+
+
+def _is_child_attribute(attribute: str) -> bool:
+    return attribute != 'parent' and not attribute.startswith('__') and not attribute.endswith('__')
+
+
 def is_target_on_screen(x: int, y: int, possible_range: Size):
     """
     Check is given coordinates fit into given range
@@ -246,11 +565,29 @@ def is_target_on_screen(x: int, y: int, possible_range: Size):
     :return: bool
     """
     safe_value = 2
-    is_x_on_screen = x in range(possible_range.width + safe_value)
-    is_y_on_screen = y in range(possible_range.height + safe_value)
+    is_x_on_screen = 0 <= x < possible_range.width + safe_value
+    is_y_on_screen = 0 <= y < possible_range.height + safe_value
     return is_x_on_screen and is_y_on_screen
 
 
+def get_visibility_ratio(rect: dict, viewport: Size) -> float:
+    """
+    Get the ratio of the element area, that intersects with the viewport
+
+    :param rect: element rect {'x', 'y', 'width', 'height'}
+    :param viewport: viewport size
+    :return: ratio from 0 to 1
+    """
+    area = rect['width'] * rect['height']
+
+    if area <= 0:
+        return 0
+
+    visible_width = max(0, min(rect['x'] + rect['width'], viewport.width) - max(rect['x'], 0))
+    visible_height = max(0, min(rect['y'] + rect['height'], viewport.height) - max(rect['y'], 0))
+    return visible_width * visible_height / area
+
+
 def calculate_coordinate_to_click(element: Any, x: int = 0, y: int = 0) -> tuple:
     """
     Calculate coordinates to click for element
@@ -293,33 +630,133 @@ def validate_silent(silent) -> bool:
     return silent
 
 
-def increase_delay(delay, max_delay: Union[int, float] = 1.5) -> Union[int, float]:
-    if delay < max_delay:
-        return delay + delay
-    return delay
+def get_polling_strategy(obj: Any, polling: Optional[PollingStrategy] = None) -> PollingStrategy:
+    """
+    Get polling strategy for the wait: given for the call, of the object, of the driver wrapper or default one
+
+    :param obj: Element or any object with driver_wrapper
+    :param polling: polling strategy given for the call
+    :return: polling strategy
+    """
+    polling = polling or getattr(obj, 'polling_strategy', None) or getattr(obj.driver_wrapper, 'polling_strategy', None)
+
+    if polling:
+        return polling
+
+    return default_appium_polling if obj.driver_wrapper.is_appium else default_polling
+
+
+def get_retry_policy(obj: Any, policy: Optional[RetryPolicy] = None) -> RetryPolicy:
+    """
+    Get retry policy for the interaction: given for the call, of the object, of the driver wrapper or default one
+
+    :param obj: Element or any object with driver_wrapper
+    :param policy: retry policy given for the call
+    :return: retry policy
+    """
+    return (
+        policy
+        or getattr(obj, 'retry_policy', None)
+        or getattr(obj.driver_wrapper, 'retry_policy', None)
+        or default_retry_policy
+    )
+
+
+def retry_interaction(
+        obj: Any,
+        action: Callable[[], Any],
+        retry_on: Tuple[Type[Exception], ...],
+        stale_on: Tuple[Type[Exception], ...] = (),
+        on_stale: Optional[Callable[[float], Any]] = None,
+        policy: Optional[RetryPolicy] = None,
+) -> Any:
+    """
+    Perform the interaction with the element and retry it according to the retry policy
+
+    :param obj: Element, that is interacted
+    :param action: function, that performs the interaction
+    :param retry_on: exceptions, that are retried with the same element
+    :param stale_on: exceptions, that are retried after the `on_stale` call
+    :param on_stale: function, that re-resolves the stale element within the given remaining time
+    :param policy: retry policy for the call. Default: the policy of the element or driver wrapper
+    :return: result of the action
+    """
+    policy = get_retry_policy(obj, policy)
+    start_time = time.time()
+    attempt = 0
+
+    while True:
+        attempt += 1
+
+        try:
+            return action()
+        except retry_on + stale_on as exc:
+            original_exc = exc
+
+        remaining = policy.timeout - (time.time() - start_time)
+
+        if remaining <= 0 or (policy.max_attempts and attempt >= policy.max_attempts):
+            break
+
+        if isinstance(original_exc, stale_on) and on_stale:
+            try:
+                on_stale(remaining)
+            except DriverWrapperException as exc:
+                original_exc = exc
+                break
+
+            remaining = policy.timeout - (time.time() - start_time)
+
+        time.sleep(max(0, min(policy.backoff.get_delay(attempt, remaining), remaining)))
+
+    raise ElementNotInteractableException(
+        f'Element "{obj.name}" not interactable after {attempt} attempts '
+        f'within {time.time() - start_time:.1f} seconds. {obj.get_element_info()}. '
+        f'Original error: {getattr(original_exc, "msg", None) or original_exc}'
+    )
 
 
 def wait_condition(method: Callable):
 
     @wraps(method)
-    def wrapper(self, *args, timeout: Union[int, float] = WAIT_EL, silent: bool = False, **kwargs):
+    def wrapper(
+            self,
+            *args,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None,
+            **kwargs,
+    ):
         validate_timeout(timeout)
         validate_silent(silent)
 
         start_time = time.time()
         result: Result = method(self, *args, **kwargs)
+        iterations = 1
 
         if not silent:
-            self.log(result.log)
+            self.log(result.log, *result.log_args)
+
+        wait_in_browser = getattr(getattr(self, '_base_cls', None), '_wait_in_browser', None)
+
+        if not result.execution_result and wait_in_browser and self.driver_wrapper.browser_side_waits:
+            remaining_timeout = timeout - (time.time() - start_time)
+            is_passed = wait_in_browser(self, method.__name__, args, kwargs, timeout=remaining_timeout)
 
-        should_increase_delay = self.driver_wrapper.is_appium
-        delay = WAIT_METHODS_DELAY
+            # The browser may evaluate the condition differently (e.g. innerText vs WebDriver text),
+            # so the result is confirmed by the method itself and polling continues on mismatch
+            if is_passed is not None:
+                result: Result = method(self, *args, **kwargs)
+                iterations += 1
+
+        polling = get_polling_strategy(self, polling)
 
         while time.time() - start_time < timeout and not result.execution_result:
-            time.sleep(delay)
+            time.sleep(polling.get_delay(iterations, remaining=timeout - (time.time() - start_time)))
             result: Result = method(self, *args, **kwargs)
-            if should_increase_delay:
-                delay = increase_delay(delay)
+            iterations += 1
+
+        self.last_wait_iterations = iterations
 
         if result.execution_result:
             return self
@@ -4,13 +4,15 @@ import logging
 import sys
 from functools import lru_cache
 from os.path import basename
-from typing import Any
+from typing import Any, Callable, Union
 
 from mops.utils.internal_utils import get_frame, is_driver_wrapper
 
 
 logger = logging.getLogger('mops')
 
+_code_info_enabled = True
+
 
 class LogLevel:
     CRITICAL = 'critical'
@@ -20,13 +22,18 @@ class LogLevel:
     DEBUG = 'debug'
 
 
-def driver_wrapper_logs_settings(level: str = LogLevel.INFO) -> None:
+_log_levels = (LogLevel.CRITICAL, LogLevel.ERROR, LogLevel.WARNING, LogLevel.INFO, LogLevel.DEBUG)
+
+
+def driver_wrapper_logs_settings(level: str = LogLevel.INFO, code_info: bool = True) -> None:
     """
     Sets driver wrapper log format(unchangeable) and log level (can be changed)
 
     :param level: log level to be captured. Example: DEBUG - all, CRITICAL - only highest level priority level
+    :param code_info: capture module/function/line of the caller for each log message or not
     :return: None
     """
+    set_code_info_capture(code_info)
     handler = logging.StreamHandler(sys.stdout)
     level = getattr(logging, level.upper())
     logger.setLevel(level)
@@ -38,6 +45,18 @@ def driver_wrapper_logs_settings(level: str = LogLevel.INFO) -> None:
     logger.addHandler(handler)
 
 
+def set_code_info_capture(enabled: bool) -> None:
+    """
+    Enables or disables the capture of module/function/line of the caller in :meth:`Logging.log`.
+    Disabling skips the frame inspection for each log message.
+
+    :param enabled: capture code info or not
+    :return: None
+    """
+    global _code_info_enabled
+    _code_info_enabled = enabled
+
+
 def autolog(message: Any, level: str = LogLevel.INFO) -> None:
     """
     Logs a message with detailed context in the following format:
@@ -60,7 +79,12 @@ def autolog(message: Any, level: str = LogLevel.INFO) -> None:
 
 class Logging:
 
-    def log(self: Any, message: str, level: str = LogLevel.INFO) -> None:
+    def log(
+            self: Any,
+            message: Union[str, Callable[[], str]],
+            *args: Any,
+            level: str = LogLevel.INFO,
+    ) -> None:
         """
         Logs a message with detailed context in the following format:
 
@@ -71,18 +95,33 @@ class Logging:
            # Example
            [Aug 14][16:04:22.767][I][2_driver][play_element.py][is_displayed:328] Check visibility of "Mouse page"
 
-        :param message: The log message to record.
-        :type message: str
+        The message is formatted only if the given level is enabled for the logger.
+
+        :param message: The log message to record. Might be a `%`-style format string with `args`
+          or a callable, that returns the message.
+        :type message: typing.Union[str, typing.Callable[[], str]]
+        :param args: The arguments for `%`-style formatting of the message.
+          A single :class:`LogLevel` value is taken as the `level`, if the message doesn't expect arguments.
+        :type args: typing.Any
         :param level: The logging level, which should be one of the values from :class:`LogLevel`
         :type level: str
         :return: :obj:`None`
         """
+        if _is_positional_level(message, args):
+            level, args = args[0], ()
+
+        log_level = _get_log_level(level)
+
+        if not logger.isEnabledFor(log_level):
+            return None
+
         if is_driver_wrapper(self):
             label = self.label
         else:
             label = self.driver_wrapper.label
 
-        _send_log_message(f'[{label}]{self._get_code_info()} {message}', level)
+        code_info = self._get_code_info() if _code_info_enabled else ''
+        logger.log(log_level, f'[{label}]{code_info} {_format_message(message, args)}')
         return None
 
     def _get_code_info(self) -> str:
@@ -95,6 +134,47 @@ class Logging:
         return f'[{basename(code.co_filename)}][{code.co_name}:{code.co_firstlineno}]'
 
 
+def _is_positional_level(message: Union[Any, Callable[[], str]], args: tuple) -> bool:
+    """
+    Check if the only given argument is the log level, passed positionally as in previous versions
+
+    :param message: message, `%`-style format string or callable, that returns the message
+    :param args: arguments given after the message
+    :return: :obj:`True` if the argument should be taken as the log level
+    """
+    if len(args) != 1 or not isinstance(args[0], str) or args[0].lower() not in _log_levels:
+        return False
+
+    if callable(message):
+        return True
+
+    try:
+        str(message) % ()
+    except TypeError:
+        return False  # The message expects arguments for formatting
+    except ValueError:
+        pass
+
+    return True
+
+
+def _format_message(message: Union[Any, Callable[[], str]], args: tuple) -> str:
+    """
+    Format log message
+
+    :param message: message, `%`-style format string or callable, that returns the message
+    :param args: arguments for `%`-style formatting
+    :return: formatted message
+    """
+    if callable(message):
+        message = message()
+
+    if args:
+        return str(message) % args
+
+    return str(message)
+
+
 def _send_log_message(log_message: str, level: str) -> None:
     """
     Send log message
@@ -0,0 +1,501 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from functools import wraps
+from os.path import dirname
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from weakref import WeakKeyDictionary, WeakSet
+
+from playwright.sync_api import Locator as PlaywrightLocator, Page as PlaywrightPage
+
+import mops
+from mops.exceptions import DriverCallsBudgetException
+from mops.mixins.objects.command_stats import CommandStats
+from mops.utils.internal_utils import is_element_instance, is_page
+
+
+MOPS_PATH = dirname(mops.__file__)
+MOPS_PATH_PREFIX = MOPS_PATH + os.sep
+
+PLAYWRIGHT_PAGE_COMMANDS = (
+    'goto', 'reload', 'go_back', 'go_forward', 'evaluate', 'screenshot',
+    'set_viewport_size', 'bring_to_front', 'title', 'content',
+)
+PLAYWRIGHT_LOCATOR_COMMANDS = (
+    'click', 'dblclick', 'tap', 'fill', 'type', 'press', 'press_sequentially', 'clear', 'hover', 'focus',
+    'check', 'uncheck', 'set_checked', 'select_option', 'drag_to', 'dispatch_event', 'scroll_into_view_if_needed',
+    'is_visible', 'is_hidden', 'is_enabled', 'is_disabled', 'is_checked', 'is_editable', 'wait_for', 'count',
+    'bounding_box', 'screenshot', 'evaluate', 'evaluate_all', 'get_attribute', 'inner_text', 'inner_html',
+    'text_content', 'input_value', 'all_text_contents', 'all_inner_texts', 'element_handle', 'element_handles',
+)
+
+_GROUP_BY_KEYS = {'command': 0, 'element': 1, 'page': 2, 'method': 3}
+_playwright_contexts_metrics: WeakKeyDictionary = WeakKeyDictionary()
+_playwright_original_commands: Dict[Tuple[type, str], Callable] = {}
+
+
+class Metrics:
+    """
+    Collects the count and duration of backend commands, that were sent by the :class:`.DriverWrapper`.
+
+    Each command is attributed to the originating :class:`.Element`, :class:`.Page`
+    and the public method of mops, that was called by the test.
+
+    **Selenium/Appium:**
+
+    - All commands of the driver are collected: `findElement`, `executeScript`, `clickElement`, `screenshot` etc.
+
+    **Playwright:**
+
+    - Operations of locators and pages within the browser context are collected: `Locator.click`,
+      `Page.evaluate` etc.
+    - If several driver wrappers share the browser context, the operation is attributed
+      to the driver wrapper of its page.
+    - Playwright classes are patched while metrics of any browser context are enabled.
+    """
+
+    def __init__(self, driver_wrapper: Any):
+        """
+        :param driver_wrapper: The :class:`.DriverWrapper` to collect metrics of.
+        """
+        self.driver_wrapper = driver_wrapper
+        self._stats: Dict[Tuple[str, Optional[str], Optional[str], Optional[str]], CommandStats] = {}
+        self._enabled = False
+        self._context: Optional[Any] = None
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(count={self.count}, duration={self.duration:.3f})'
+
+    @property
+    def enabled(self) -> bool:
+        """
+        :obj:`True` if the commands are collected, otherwise :obj:`False`.
+        """
+        return self._enabled
+
+    @property
+    def count(self) -> int:
+        """
+        The total number of collected commands.
+        """
+        return sum(stats.count for stats in self._stats.values())
+
+    @property
+    def duration(self) -> float:
+        """
+        The total duration of collected commands in seconds.
+        """
+        return sum(stats.duration for stats in self._stats.values())
+
+    def enable(self) -> Metrics:
+        """
+        Start collecting of commands.
+
+        :return: :obj:`Metrics` - The current instance.
+        """
+        if self._enabled:
+            return self
+
+        if self.driver_wrapper.is_playwright:
+            self._context = self.driver_wrapper.context or self.driver_wrapper.driver.context
+            _register_playwright_metrics(self._context, self)
+        else:
+            driver = self.driver_wrapper.driver
+            driver.execute = self._wrap_command(driver.execute)
+
+        self._enabled = True
+        return self
+
+    def disable(self) -> Metrics:
+        """
+        Stop collecting of commands. Collected data is kept.
+
+        :return: :obj:`Metrics` - The current instance.
+        """
+        if not self._enabled:
+            return self
+
+        if self.driver_wrapper.is_playwright:
+            _unregister_playwright_metrics(self._context, self)
+            self._context = None
+        else:
+            vars(self.driver_wrapper.driver).pop('execute', None)
+
+        self._enabled = False
+        return self
+
+    def reset(self) -> Metrics:
+        """
+        Remove all collected data.
+
+        :return: :obj:`Metrics` - The current instance.
+        """
+        self._stats = {}
+        return self
+
+    def record(self, command: str, duration: float) -> None:
+        """
+        Record the command with given duration, attributed to the current call of mops object.
+
+        :param command: The name of the command.
+        :param duration: The duration of the command in seconds.
+        :return: :obj:`None`
+        """
+        key = (command, *get_command_origin())
+        stats = self._stats.get(key)
+
+        if stats is None:
+            stats = self._stats[key] = CommandStats()
+
+        stats.add(duration)
+
+    def copy(self) -> Metrics:
+        """
+        Get a detached copy of collected data. The copy does not collect new commands.
+
+        :return: :obj:`Metrics` - The new instance with the current data.
+        """
+        metrics = Metrics(self.driver_wrapper)
+        metrics._stats = {key: CommandStats(**vars(stats)) for key, stats in self._stats.items()}
+        return metrics
+
+    def difference(self, previous: Metrics) -> Metrics:
+        """
+        Get the commands, that were collected after the given copy of metrics.
+        The `max_duration` of changed records is taken from the current data.
+
+        :param previous: The copy of metrics, taken earlier by :meth:`copy`.
+        :return: :obj:`Metrics` - The new detached instance with the difference.
+        """
+        metrics = Metrics(self.driver_wrapper)
+
+        for key, stats in self._stats.items():
+            previous_stats = previous._stats.get(key, CommandStats())  # noqa
+
+            if stats.count > previous_stats.count:
+                metrics._stats[key] = CommandStats(
+                    count=stats.count - previous_stats.count,
+                    duration=stats.duration - previous_stats.duration,
+                    max_duration=stats.max_duration,
+                )
+
+        return metrics
+
+    def get_stats(self, group_by: str = 'command') -> Dict[str, CommandStats]:
+        """
+        Get statistics of collected commands grouped by given key.
+        Commands without the given origin are not included in `element`, `page` and `method` groups.
+
+        :param group_by: The key to group by: `command`, `element`, `page` or `method`.
+        :return: :obj:`dict` - The statistics, where key is the value of the `group_by` key.
+        """
+        index = _GROUP_BY_KEYS[group_by]
+        result: Dict[str, CommandStats] = {}
+
+        for key, stats in self._stats.items():
+            name = key[index]
+
+            if name is None:
+                continue
+
+            result.setdefault(name, CommandStats()).merge(stats)
+
+        return result
+
+    def to_dict(self) -> dict:
+        """
+        Get all collected metrics as a JSON-serializable :obj:`dict`.
+
+        :return: :obj:`dict` - The metrics.
+        """
+        def serialize(stats: CommandStats) -> dict:
+            return {'count': stats.count, 'duration': stats.duration, 'max_duration': stats.max_duration}
+
+        return {
+            'label': self.driver_wrapper.label,
+            'count': self.count,
+            'duration': self.duration,
+            **{
+                f'{group_by}s': {name: serialize(stats) for name, stats in self.get_stats(group_by).items()}
+                for group_by in _GROUP_BY_KEYS
+            },
+            'records': [
+                {'command': command, 'element': element, 'page': page, 'method': method, **serialize(stats)}
+                for (command, element, page, method), stats in self._stats.items()
+            ],
+        }
+
+    def dump(self, path: str) -> None:
+        """
+        Write all collected metrics into the JSON file.
+
+        :param path: The path of the file.
+        :return: :obj:`None`
+        """
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def _run(self, command: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run the function and record its duration as given command
+
+        :param command: name of the command
+        :param func: function, that sends the command
+        :return: result of the function
+        """
+        start_time = time.perf_counter()
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.record(command, time.perf_counter() - start_time)
+
+    def _wrap_command(self, execute: Callable) -> Callable:
+        """
+        Wrap the `execute` method of Selenium/Appium driver
+
+        :param execute: original bound `execute` method
+        :return: wrapped method
+        """
+        @wraps(execute)
+        def wrapper(driver_command: str, params: Optional[dict] = None):
+            return self._run(driver_command, execute, driver_command, params)
+
+        return wrapper
+
+
+@contextmanager
+def max_driver_calls(limit: int, driver_wrappers: Optional[List[Any]] = None, top: int = 5) -> Iterator[List[Metrics]]:
+    """
+    Fail the block, if the count of driver calls within it exceeds the given limit.
+
+    Metrics are enabled for the block, if they are not enabled yet,
+    including sessions initialized within the block if `driver_wrappers` are not given.
+    The exception lists the top offending elements and methods.
+
+    :param limit: The maximum count of driver calls.
+    :param driver_wrappers: The :class:`.DriverWrapper` objects to count calls of.
+      All initialized sessions are used by default, including sessions initialized within the block.
+    :param top: The count of offending elements and methods to list in the exception.
+    :return: :obj:`list` of :obj:`Metrics` - The calls within the block per driver wrapper,
+      filled after the block is finished.
+    """
+    from mops.base.driver_wrapper import DriverWrapperSessions
+
+    initial_sessions = list(driver_wrappers or DriverWrapperSessions.all_sessions)
+    disabled = [driver_wrapper for driver_wrapper in initial_sessions if not driver_wrapper.metrics.enabled]
+    previous = {}
+    result: List[Metrics] = []
+
+    for driver_wrapper in initial_sessions:
+        previous[driver_wrapper] = driver_wrapper.metrics.enable().copy()
+
+    if not driver_wrappers:
+        DriverWrapperSessions.metrics_budgets += 1
+
+    try:
+        yield result
+    finally:
+        sessions = driver_wrappers or DriverWrapperSessions.all_sessions
+
+        for driver_wrapper in sessions:
+            metrics = driver_wrapper.metrics
+            result.append(metrics.difference(previous.get(driver_wrapper, Metrics(driver_wrapper))))
+
+        if not driver_wrappers:
+            DriverWrapperSessions.metrics_budgets -= 1
+
+            if not DriverWrapperSessions.metrics_budgets:
+                disabled.extend(
+                    driver_wrapper for driver_wrapper in sessions
+                    if driver_wrapper not in previous and not driver_wrapper.collect_metrics
+                )
+
+        for driver_wrapper in disabled:
+            driver_wrapper.metrics.disable()
+
+    count = sum(metrics.count for metrics in result)
+
+    if count > limit:
+        message = 'Driver calls budget exceeded.'
+
+        for group_by in ('element', 'method'):
+            top_calls = _get_top_calls(result, group_by, top)
+
+            if top_calls:
+                message += f' Top {group_by}s: ' + ', '.join(f'"{name}" ({calls})' for name, calls in top_calls) + '.'
+
+        raise DriverCallsBudgetException(message, actual=count, expected=limit)
+
+
+def _get_top_calls(metrics_list: List[Metrics], group_by: str, top: int) -> List[Tuple[str, int]]:
+    """
+    Get names with the highest count of calls across the given metrics
+
+    :param metrics_list: metrics of driver wrappers
+    :param group_by: key to group by
+    :param top: count of names to return
+    :return: list of name and count of calls
+    """
+    calls: Dict[str, int] = {}
+
+    for metrics in metrics_list:
+        for name, stats in metrics.get_stats(group_by).items():
+            calls[name] = calls.get(name, 0) + stats.count
+
+    return sorted(calls.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def get_command_origin() -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Get the names of the outermost Element, Page and public method of mops, that is being executed
+
+    :return: tuple of element name, page name and method name
+    """
+    frame = sys._getframe(1)  # noqa
+    element_name, page_name, method_name = None, None, None
+    within_mops = False
+
+    while frame:
+        filename = frame.f_code.co_filename
+
+        if filename.startswith(MOPS_PATH_PREFIX) and filename != __file__:
+            within_mops = True
+            obj = frame.f_locals.get('self')
+            name = frame.f_code.co_name
+
+            if obj is not None and not name.startswith('_') and hasattr(type(obj), name):
+                if is_element_instance(obj):
+                    element_name, method_name = obj.name, name
+                elif is_page(obj):
+                    page_name, method_name = obj.name, name
+                else:
+                    method_name = name
+
+        elif within_mops:
+            break
+
+        frame = frame.f_back
+
+    return element_name, page_name, method_name
+
+
+def _register_playwright_metrics(context: Any, metrics: Metrics) -> None:
+    """
+    Start recording commands of the browser context into given metrics.
+    The context is unregistered on close, or released with the context object.
+
+    :param context: browser context of Playwright
+    :param metrics: metrics to record commands into
+    :return: None
+    """
+    _patch_playwright_classes()
+
+    if context not in _playwright_contexts_metrics:
+        _playwright_contexts_metrics[context] = WeakSet()
+        context.once('close', lambda *_: _unregister_playwright_context(context))
+
+    _playwright_contexts_metrics[context].add(metrics)
+
+
+def _unregister_playwright_metrics(context: Any, metrics: Metrics) -> None:
+    """
+    Stop recording commands of the browser context into given metrics.
+    Playwright classes are restored, when no more contexts are registered.
+
+    :param context: browser context of Playwright
+    :param metrics: metrics to stop recording into
+    :return: None
+    """
+    context_metrics = _playwright_contexts_metrics.get(context)
+
+    if context_metrics is not None:
+        context_metrics.discard(metrics)
+
+        if not context_metrics:
+            _unregister_playwright_context(context)
+
+
+def _unregister_playwright_context(context: Any) -> None:
+    """
+    Stop recording commands of the browser context
+
+    :param context: browser context of Playwright
+    :return: None
+    """
+    _playwright_contexts_metrics.pop(context, None)
+
+    if not _playwright_contexts_metrics:
+        _unpatch_playwright_classes()
+
+
+def _get_playwright_metrics(page: Any) -> Optional[Metrics]:
+    """
+    Get the metrics to record the command of given page into
+
+    :param page: Playwright page of the command
+    :return: metrics of the driver wrapper, that owns the page, or the only metrics of its context
+    """
+    context_metrics = _playwright_contexts_metrics.get(page.context)
+
+    if not context_metrics:
+        return None
+
+    for metrics in context_metrics:
+        if metrics.driver_wrapper.driver is page:
+            return metrics
+
+    return next(iter(context_metrics)) if len(context_metrics) == 1 else None
+
+
+def _patch_playwright_classes() -> None:
+    """
+    Wrap commands of Playwright locators and pages once.
+    Commands are recorded only for the browser contexts with enabled :class:`Metrics`.
+    """
+    if _playwright_original_commands:
+        return
+
+    for cls, commands, get_page in (
+            (PlaywrightLocator, PLAYWRIGHT_LOCATOR_COMMANDS, lambda locator: locator.page),
+            (PlaywrightPage, PLAYWRIGHT_PAGE_COMMANDS, lambda page: page),
+    ):
+        for name in commands:
+            if name in vars(cls):
+                method = _playwright_original_commands[(cls, name)] = vars(cls)[name]
+                setattr(cls, name, _wrap_playwright_command(method, f'{cls.__name__}.{name}', get_page))
+
+
+def _unpatch_playwright_classes() -> None:
+    """
+    Restore original commands of Playwright locators and pages
+    """
+    for (cls, name), method in _playwright_original_commands.items():
+        setattr(cls, name, method)
+
+    _playwright_original_commands.clear()
+
+
+def _wrap_playwright_command(method: Callable, command: str, get_page: Callable) -> Callable:
+    """
+    Wrap the command of Playwright object
+
+    :param method: original method
+    :param command: name of the command
+    :param get_page: function, that returns page of the object
+    :return: wrapped method
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        metrics = _get_playwright_metrics(get_page(self)) if _playwright_contexts_metrics else None
+
+        if metrics is None:
+            return method(self, *args, **kwargs)
+
+        return metrics._run(command, method, self, *args, **kwargs)  # noqa
+
+    return wrapper
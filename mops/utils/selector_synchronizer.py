@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Union
+from functools import lru_cache
+from typing import Any, Union, List, Optional, Tuple
 
 from selenium.webdriver.common.by import By
 
 from mops.exceptions import InvalidLocatorException
+from mops.mixins.objects.compiled_locator import CompiledLocator
 from mops.mixins.objects.locator import Locator
 from mops.mixins.objects.locator_type import LocatorType
 from mops.utils.internal_utils import all_tags
@@ -15,6 +17,13 @@ DEFAULT_MATCH = (f"{LocatorType.XPATH}=", f"{LocatorType.ID}=", f"{LocatorType.C
 XPATH_MATCH = ("/", "./", "(/")
 CSS_MATCH = ("#", ".")
 CSS_REGEXP = r"[#.\[\]=]"
+CSS_PATTERN = re.compile(CSS_REGEXP)
+EXACT_OR_REGEX_TEXT_PATTERN = re.compile(r'^\s*(".*"[is]?|\'.*\'|/.*/[a-z]*)\s*$', re.DOTALL)
+
+SELENIUM_ENGINE = 'selenium'
+PLAYWRIGHT_ENGINE = 'playwright'
+APPIUM_ENGINE = 'appium'
+LOCATORS_CACHE_SIZE = 4096
 
 
 def get_platform_locator(obj: Any):
@@ -25,22 +34,21 @@ def get_platform_locator(obj: Any):
     :return: current platform locator
     """
     locator: Union[Locator, str] = obj.locator
+    driver_wrapper = obj.driver_wrapper
 
-    if type(locator) is str or not obj.driver_wrapper:
+    if type(locator) is str or not driver_wrapper:
         return locator
 
-    mobile_fallback_locator = locator.mobile or locator.default
-
-    if obj.driver_wrapper.is_desktop:
-        locator = locator.desktop or locator.default
-    if obj.driver_wrapper.is_tablet:
-        locator = locator.tablet or locator.default
-    elif obj.driver_wrapper.is_android:
-        locator = locator.android or mobile_fallback_locator
-    elif obj.driver_wrapper.is_ios:
-        locator = locator.ios or mobile_fallback_locator
-    elif obj.driver_wrapper.is_mobile:
-        locator = mobile_fallback_locator
+    locator = resolve_platform_locator(
+        (locator.default, locator.desktop, locator.mobile, locator.tablet, locator.ios, locator.android),
+        (
+            driver_wrapper.is_desktop,
+            driver_wrapper.is_tablet,
+            driver_wrapper.is_android,
+            driver_wrapper.is_ios,
+            driver_wrapper.is_mobile,
+        ),
+    )
 
     if not isinstance(locator, str):
         raise InvalidLocatorException(f'Cannot extract locator for current platform for following object: {obj}')
@@ -48,107 +56,227 @@ def get_platform_locator(obj: Any):
     return locator
 
 
+@lru_cache(maxsize=LOCATORS_CACHE_SIZE)
+def resolve_platform_locator(locators: Tuple[Optional[str], ...], platform: Tuple[bool, ...]) -> Optional[str]:
+    """
+    Resolve locator for current platform. The result is cached per given locators and platform flags
+
+    :param locators: locators of :class:`.Locator` object: default, desktop, mobile, tablet, ios, android
+    :param platform: platform flags of driver wrapper: is_desktop, is_tablet, is_android, is_ios, is_mobile
+    :return: current platform locator or :obj:`None` if there is no locator for current platform
+    """
+    default, desktop, mobile, tablet, ios, android = locators
+    is_desktop, is_tablet, is_android, is_ios, is_mobile = platform
+    locator = None
+    mobile_fallback_locator = mobile or default
+
+    if is_desktop:
+        locator = desktop or default
+    if is_tablet:
+        locator = tablet or default
+    elif is_android:
+        locator = android or mobile_fallback_locator
+    elif is_ios:
+        locator = ios or mobile_fallback_locator
+    elif is_mobile:
+        locator = mobile_fallback_locator
+
+    return locator
+
+
+@lru_cache(maxsize=LOCATORS_CACHE_SIZE)
+def compile_locator(locator: str, engine: str) -> CompiledLocator:
+    """
+    Parse locator string for given engine. The result is cached per given locator and engine
+
+    :param locator: raw locator string
+    :param engine: one of :obj:`SELENIUM_ENGINE`, :obj:`PLAYWRIGHT_ENGINE`, :obj:`APPIUM_ENGINE`
+    :return: :class:`.CompiledLocator`
+    """
+    if engine == PLAYWRIGHT_ENGINE:
+        return _compile_playwright_locator(locator)
+
+    compiled_locator = _compile_selenium_locator(locator)
+
+    if engine == APPIUM_ENGINE:
+        compiled_locator = _compile_appium_locator(compiled_locator)
+
+    return compiled_locator
+
+
 def set_selenium_selector(obj: Any):
     """
     Sets selenium locator & locator type
     """
-    locator = obj.locator.strip()
-    obj.log_locator = locator
+    _set_compiled_locator(obj, compile_locator(obj.locator, SELENIUM_ENGINE))
+
+
+def set_playwright_locator(obj: Any):
+    """
+    Sets playwright locator & locator type
+    """
+    _set_compiled_locator(obj, compile_locator(obj.locator, PLAYWRIGHT_ENGINE))
+
+
+def set_appium_selector(obj: Any):
+    """
+    Sets appium locator & locator type
+    """
+    _set_compiled_locator(obj, compile_locator(obj.locator, APPIUM_ENGINE))
+
+
+def _set_compiled_locator(obj: Any, compiled_locator: CompiledLocator):
+    """
+    Sets locator, locator type and log locator of object from compiled locator
+    """
+    obj.locator = compiled_locator.value
+    obj.locator_type = compiled_locator.type
+    obj.log_locator = compiled_locator.log_locator
+
+
+def _compile_selenium_locator(raw_locator: str) -> CompiledLocator:
+    """
+    Parse selenium locator & locator type
+    """
+    locator = raw_locator.strip()
 
     # Checking the supported locators
 
     if locator.startswith(f"{LocatorType.XPATH}="):
-        obj.locator = obj.locator.split(f"{LocatorType.XPATH}=")[-1]
-        obj.locator_type = By.XPATH
+        return CompiledLocator(By.XPATH, raw_locator.split(f"{LocatorType.XPATH}=")[-1], locator)
 
     elif locator.startswith(f"{LocatorType.TEXT}="):
-        locator = obj.locator.split(f"{LocatorType.TEXT}=")[-1]
-        obj.locator = f'//*[contains(text(), "{locator}")]'
-        obj.locator_type = By.XPATH
+        text = raw_locator.split(f"{LocatorType.TEXT}=")[-1]
+        return CompiledLocator(By.XPATH, f'//*[contains(text(), "{text}")]', locator)
 
     elif locator.startswith(f"{LocatorType.CSS}="):
-        obj.locator = obj.locator.split(f"{LocatorType.CSS}=")[-1]
-        obj.locator_type = By.CSS_SELECTOR
+        return CompiledLocator(By.CSS_SELECTOR, raw_locator.split(f"{LocatorType.CSS}=")[-1], locator)
 
     elif locator.startswith(f"{LocatorType.ID}="):
-        locator = obj.locator.split(f"{LocatorType.ID}=")[-1]
-        obj.locator = f'[{LocatorType.ID}="{locator}"]'
-        obj.locator_type = By.CSS_SELECTOR
+        id_value = raw_locator.split(f"{LocatorType.ID}=")[-1]
+        return CompiledLocator(By.CSS_SELECTOR, f'[{LocatorType.ID}="{id_value}"]', locator)
 
     # Checking the regular locators
 
     elif locator.startswith(XPATH_MATCH):
-        obj.locator_type = By.XPATH
-        obj.log_locator = f'{LocatorType.XPATH}={locator}'
+        return CompiledLocator(By.XPATH, raw_locator, f'{LocatorType.XPATH}={locator}')
 
-    elif locator.startswith(CSS_MATCH) or re.search(CSS_REGEXP, locator):
-        obj.locator_type = By.CSS_SELECTOR
-        obj.log_locator = f'{LocatorType.CSS}={locator}'
+    elif locator.startswith(CSS_MATCH) or CSS_PATTERN.search(locator):
+        return CompiledLocator(By.CSS_SELECTOR, raw_locator, f'{LocatorType.CSS}={locator}')
 
     elif locator in all_tags or all(tag in all_tags for tag in locator.split()):
-        obj.locator_type = By.CSS_SELECTOR
-        obj.log_locator = f'{LocatorType.CSS}={locator}'
+        return CompiledLocator(By.CSS_SELECTOR, raw_locator, f'{LocatorType.CSS}={locator}')
 
     elif " " in locator:
-        obj.locator = f'//*[contains(text(), "{locator}")]'
-        obj.locator_type = By.XPATH
-        obj.log_locator = f'{LocatorType.XPATH}={obj.locator}'
+        xpath = f'//*[contains(text(), "{locator}")]'
+        return CompiledLocator(By.XPATH, xpath, f'{LocatorType.XPATH}={xpath}')
 
     # Default to ID if nothing else matches
 
-    else:
-        locator = obj.locator.split(f"{LocatorType.ID}=")[-1]
-        obj.locator = f'[{LocatorType.ID}="{locator}"]'
-        obj.locator_type = By.CSS_SELECTOR
-        obj.log_locator = f'{LocatorType.ID}={locator}'
+    id_value = raw_locator.split(f"{LocatorType.ID}=")[-1]
+    return CompiledLocator(By.CSS_SELECTOR, f'[{LocatorType.ID}="{id_value}"]', f'{LocatorType.ID}={id_value}')
 
 
-def set_playwright_locator(obj: Any):
+def _compile_playwright_locator(raw_locator: str) -> CompiledLocator:
     """
-    Sets playwright locator & locator type
+    Parse playwright locator & locator type
     """
-    locator = obj.locator.strip()
-    obj.log_locator = locator
+    locator = raw_locator.strip()
 
     # Checking the supported locators
 
     if locator.startswith(DEFAULT_MATCH):
-        obj.locator_type = locator.partition('=')[0]
-        return
+        return CompiledLocator(locator.partition('=')[0], raw_locator, locator)
 
     # Checking the regular locators
 
     elif locator.startswith(XPATH_MATCH):
-        obj.locator_type = LocatorType.XPATH
+        locator_type = LocatorType.XPATH
 
-    elif locator.startswith(CSS_MATCH) or re.search(CSS_REGEXP, locator):
-        obj.locator_type = LocatorType.CSS
+    elif locator.startswith(CSS_MATCH) or CSS_PATTERN.search(locator):
+        locator_type = LocatorType.CSS
 
     elif locator in all_tags or all(tag in all_tags for tag in locator.split()):
-        obj.locator_type = LocatorType.CSS
+        locator_type = LocatorType.CSS
 
     elif " " in locator:
-        obj.locator_type = LocatorType.TEXT
+        locator_type = LocatorType.TEXT
 
     # Default to ID if nothing else matches
 
     else:
-        obj.locator_type = LocatorType.ID
+        locator_type = LocatorType.ID
 
-    obj.locator = f'{obj.locator_type}={locator}'
-    obj.log_locator = obj.locator
+    value = f'{locator_type}={locator}'
+    return CompiledLocator(locator_type, value, value)
 
 
-def set_appium_selector(obj: Any):
+def _compile_appium_locator(compiled_locator: CompiledLocator) -> CompiledLocator:
     """
-    Sets appium locator & locator type
+    Parse appium locator & locator type over the selenium one
     """
-    set_selenium_selector(obj)
-
-    locator = obj.locator.strip()
+    locator = compiled_locator.value.strip()
 
     # Mobile com.android selector
 
     if ':id' in locator:
-        obj.locator_type = By.CSS_SELECTOR
-        obj.log_locator = f'{LocatorType.ID}={locator}'
+        return CompiledLocator(By.CSS_SELECTOR, compiled_locator.value, f'{LocatorType.ID}={locator}')
+
+    return compiled_locator
+
+
+def get_js_locator(obj: Any) -> Union[dict, None]:
+    """
+    Get locator of object in format that can be resolved within the browser
+
+    :param obj: Group/Element
+    :return: dict with locator type and value or :obj:`None` if locator can't be resolved within the browser
+    """
+    locator, locator_type = obj.locator, obj.locator_type
+
+    if not isinstance(locator, str):
+        return None
+
+    if obj.driver_wrapper.is_playwright:
+        value = locator.partition('=')[-1]
+
+        if locator_type == LocatorType.ID:
+            return {'type': 'css', 'value': f'[{LocatorType.ID}="{value}"]'}
+        if locator_type == LocatorType.TEXT and EXACT_OR_REGEX_TEXT_PATTERN.match(value):
+            # Exact and regex text matching of Playwright isn't emulated within the browser
+            return None
+        if locator_type in (LocatorType.CSS, LocatorType.XPATH, LocatorType.TEXT):
+            return {'type': locator_type, 'value': value, 'relative': True}
+
+        return None
+
+    if locator_type == By.CSS_SELECTOR:
+        return {'type': 'css', 'value': locator}
+    if locator_type == By.XPATH:
+        return {'type': 'xpath', 'value': locator, 'relative': False}
+
+    return None
+
+
+def get_locators_chain(element: Any) -> Union[List[dict], None]:
+    """
+    Get locators of element and all its parents, starting from the top-level parent
+
+    :param element: Group/Element
+    :return: list of locators or :obj:`None` if any locator can't be resolved within the browser
+    """
+    chain = []
+
+    while element:
+        if element._element:
+            return None
+
+        locator = get_js_locator(element)
+
+        if not locator:
+            return None
+
+        chain.insert(0, locator)
+        element = element.parent
+
+    return chain
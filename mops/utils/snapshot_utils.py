@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from mops.js_scripts import (
+    get_children_snapshot_js,
+    get_children_snapshot_play_js,
+    get_page_state_js,
+    get_page_state_play_js,
+)
+from mops.mixins.objects.snapshot import ElementSnapshot, get_snapshot_fields
+from mops.utils.selector_synchronizer import get_locators_chain
+
+
+def get_children_snapshot(
+        elements: Dict[str, Any],
+        driver_wrapper: Any,
+        fields: Optional[Iterable[str]] = None,
+        attributes: Iterable[str] = (),
+) -> Dict[str, ElementSnapshot]:
+    """
+    Collect the state of given elements within a single call to the browser.
+    Elements that can't be resolved within the browser, elements that aren't found by Playwright
+    within the browser, and all elements in the native context of Appium, are collected element by element.
+
+    :param elements: elements to collect, where key is the name of the element
+    :param driver_wrapper: driver wrapper of elements
+    :param fields: requested fields. All fields will be collected if :obj:`None` given
+    :param attributes: requested attributes
+    :return: dict of snapshots, where key is the name of the element
+    """
+    return _collect_children_state(elements, driver_wrapper, fields, attributes, with_url=False)[0]
+
+
+def get_page_state(
+        elements: Dict[str, Any],
+        driver_wrapper: Any,
+        fields: Optional[Iterable[str]] = None,
+        attributes: Iterable[str] = (),
+) -> Tuple[Dict[str, ElementSnapshot], Optional[str]]:
+    """
+    Collect the state of given elements and the URL of the top-level page within a single call to the browser.
+    The URL is :obj:`None` if it can't be read within the browser call,
+    e.g. no element was resolved within the browser.
+
+    :param elements: elements to collect, where key is the name of the element
+    :param driver_wrapper: driver wrapper of elements
+    :param fields: requested fields. All fields will be collected if :obj:`None` given
+    :param attributes: requested attributes
+    :return: tuple of snapshots dict, where key is the name of the element, and the URL
+    """
+    return _collect_children_state(elements, driver_wrapper, fields, attributes, with_url=True)
+
+
+def _collect_children_state(
+        elements: Dict[str, Any],
+        driver_wrapper: Any,
+        fields: Optional[Iterable[str]],
+        attributes: Iterable[str],
+        with_url: bool,
+) -> Tuple[Dict[str, ElementSnapshot], Optional[str]]:
+    """
+    Collect the state of given elements and, optionally, the URL of the top-level page
+
+    :param elements: elements to collect, where key is the name of the element
+    :param driver_wrapper: driver wrapper of elements
+    :param fields: requested fields. All fields will be collected if :obj:`None` given
+    :param attributes: requested attributes
+    :param with_url: collect the URL within the same call or not
+    :return: tuple of snapshots dict and the URL
+    """
+    fields, attributes = get_snapshot_fields(fields), list(attributes)
+    chains, fallback_elements = {}, {}
+
+    for name, element in elements.items():
+        chain = None
+
+        if not (driver_wrapper.is_appium and driver_wrapper.is_native_context):
+            chain = get_locators_chain(element)
+
+        if chain:
+            chains[name] = chain
+        else:
+            fallback_elements[name] = element
+
+    snapshots_data, url = {}, None
+
+    if chains:
+        if driver_wrapper.is_playwright:
+            script = get_page_state_play_js if with_url else get_children_snapshot_play_js
+            args = {'chains': chains, 'fields': fields, 'attributes': attributes}
+            snapshots_data = driver_wrapper.driver.evaluate(script, args)
+        else:
+            script = get_page_state_js if with_url else get_children_snapshot_js
+            snapshots_data = driver_wrapper.driver.execute_script(script, chains, fields, attributes)
+
+        if with_url:
+            snapshots_data, url = snapshots_data['snapshots'], snapshots_data['url']
+
+    snapshots = {}
+
+    for name in chains:
+        snapshot_data = snapshots_data[name]
+
+        # Playwright selectors, e.g. ":has-text()" or ones within the shadow DOM,
+        # may be unresolvable or missed by the browser-side search
+        if snapshot_data.pop('unresolvable', False) or (driver_wrapper.is_playwright and not snapshot_data['present']):
+            fallback_elements[name] = elements[name]
+        else:
+            snapshots[name] = ElementSnapshot(**snapshot_data)
+
+    for name, element in fallback_elements.items():
+        if element.is_available():
+            snapshot = element._base_cls.snapshot(element, fields=fields, attributes=attributes, silent=True)
+        else:
+            snapshot = ElementSnapshot(present=False)
+
+        snapshots[name] = snapshot
+
+    return {name: snapshots[name] for name in elements}, url
@@ -7,6 +7,7 @@ import time
 import math
 import json
 import base64
+import hashlib
 import importlib
 from dataclasses import astuple
 from urllib.parse import urljoin
@@ -19,14 +20,21 @@ except ImportError:
     import cv2  # ~cv2@4.10.0.84 + python@3.11/12
 import numpy
 from skimage._shared.utils import check_shape_equality  # noqa
-from skimage.metrics import structural_similarity
 from PIL import Image
+from playwright.sync_api import Error as PlaywrightError
+from selenium.common.exceptions import WebDriverException as SeleniumWebDriverException
 
 from mops.mixins.objects.size import Size
 from mops.exceptions import DriverWrapperException, TimeoutException
-from mops.js_scripts import add_element_over_js, delete_element_over_js
+from mops.js_scripts import (
+    add_element_over_js,
+    delete_element_over_js,
+    wait_animations_finished_js,
+    wait_animations_finished_play_js,
+)
 from mops.mixins.objects.box import Box
-from mops.utils.logs import autolog
+from mops.mixins.objects.comparison_engine import ComparisonEngine, SSIMEngine
+from mops.utils.logs import autolog, LogLevel
 from mops.mixins.internal_mixin import get_element_info
 
 if TYPE_CHECKING:
@@ -65,7 +73,22 @@ class VisualComparison:
     """Allows the generation of visual references only if they do not already exist."""
 
     default_delay: Union[int, float] = 0.75
-    """The default delay before taking a screenshot."""
+    """The default delay before taking a screenshot. Not applied if `stable_screenshot` is enabled."""
+
+    stable_screenshot: bool = False
+    """
+    If set to `True`, screenshots are captured until two consecutive captures are equal
+    instead of the fixed default delay.
+    """
+
+    stable_screenshot_timeout: Union[int, float] = 3
+    """The maximum time to wait for two equal consecutive captures. The last capture is used after it."""
+
+    wait_for_animations: bool = False
+    """
+    If set to `True`, finite CSS/Web animations are awaited within the browser
+    before each capture of the stable screenshot.
+    """
 
     default_threshold: Union[int, float] = 0
     """The default threshold for image comparison."""
@@ -76,6 +99,12 @@ class VisualComparison:
     diff_color_scheme: tuple = (0, 255, 0)
     """The color scheme used for highlighting differences in images."""
 
+    comparison_engine: ComparisonEngine = SSIMEngine()
+    """
+    The engine to calculate the difference between screenshots.
+    Can be overridden for the specific call of `assert_screenshot` via `engine` argument.
+    """
+
     __initialized = False
 
     def __init__(self, driver_wrapper: DriverWrapper, element: Element = None):
@@ -117,7 +146,8 @@ class VisualComparison:
             scroll: bool,
             remove: List[Any],
             fill_background: Union[str, bool],
-            cut_box: Optional[Box]
+            cut_box: Optional[Box],
+            engine: Optional[ComparisonEngine] = None,
     ) -> VisualComparison:
         """
         Assert that the given (by name) and taken screenshots are equal.
@@ -130,7 +160,8 @@ class VisualComparison:
         :type name_suffix: str
         :param threshold: Possible threshold for image comparison.
         :type threshold: float
-        :param delay: Delay before taking the screenshot.
+        :param delay: Delay before taking the screenshot. If :obj:`None` - takes default delay,
+          or no delay if `stable_screenshot` is enabled.
         :type delay: float
         :param scroll: Whether to scroll to the element before taking the screenshot.
         :type scroll: bool
@@ -140,12 +171,16 @@ class VisualComparison:
         :type fill_background: bool
         :param cut_box: Custom coordinates to cut from the original image (left, top, right, bottom).
         :type cut_box: :class:`.Box`
+        :param engine: The engine to calculate the difference between screenshots.
+          If :obj:`None` - takes `comparison_engine`.
+        :type engine: :class:`.ComparisonEngine`
         :return: :class:`VisualComparison`
         """
         if self.skip_screenshot_comparison:
             return self
 
         remove = remove if remove else []
+        delay = delay or (0 if self.stable_screenshot else self.default_delay)
         screenshot_params = dict(delay=delay, remove=remove, fill_background=fill_background, cut_box=cut_box)
 
         if filename:
@@ -166,8 +201,15 @@ class VisualComparison:
             self._save_screenshot(reference_file, **screenshot_params)
             return self
 
-        image = cv2.imread(reference_file)
-        if isinstance(image, type(None)):
+        reference_image = None
+
+        if os.path.exists(reference_file):
+            if self.visual_reference_generation and not self.soft_visual_reference_generation:
+                return self
+
+            reference_image = cv2.imread(reference_file)
+
+        if reference_image is None:
             self._save_screenshot(reference_file, **screenshot_params)
 
             if self.visual_reference_generation or self.soft_visual_reference_generation:
@@ -179,13 +221,12 @@ class VisualComparison:
             raise AssertionError(f'Reference file "{reference_file}" not found, but its just saved. '
                                  f'If it CI run, then you need to commit reference files.') from None
 
-        if self.visual_reference_generation and not self.soft_visual_reference_generation:
-            return self
-
-        self._save_screenshot(output_file, **screenshot_params)
+        image = self._take_screenshot(**screenshot_params)
 
         try:
-            self._assert_same_images(output_file, reference_file, diff_file, threshold)
+            self._assert_same_images(
+                image, reference_image, output_file, reference_file, diff_file, threshold, engine
+            )
             for file_path in (output_file, diff_file):
                 if os.path.exists(file_path):
                     os.remove(file_path)
@@ -208,9 +249,22 @@ class VisualComparison:
         :param dynamic_threshold_factor: use provided threshold factor
         :return: tuple of calculated threshold and additional data
         """
+        with Image.open(file) as image:
+            width, height = image.size
+
+        return VisualComparison._calculate_threshold_by_size(width, height, dynamic_threshold_factor)
+
+    @staticmethod
+    def _calculate_threshold_by_size(width: int, height: int, dynamic_threshold_factor: int = None) -> Tuple:
+        """
+        Calculate possible threshold for the image of given size, based on dynamic_threshold_factor
+
+        :param width: image width
+        :param height: image height
+        :param dynamic_threshold_factor: use provided threshold factor
+        :return: tuple of calculated threshold and additional data
+        """
         factor = VisualComparison.dynamic_threshold_factor or dynamic_threshold_factor
-        img = Image.open(file)
-        width, height = img.size
         pixels_grid = height * width
         calculated_threshold = factor / math.sqrt(pixels_grid)
         pixels_allowed = int(pixels_grid / 100 * calculated_threshold)
@@ -224,25 +278,131 @@ class VisualComparison:
             remove: list,
             fill_background: bool,
             cut_box: Optional[Box],
-    ):
+    ) -> Image.Image:
+        """
+        Take the screenshot and save it into the file
+
+        :param screenshot_name: path of the file
+        :return: the screenshot image
+        """
+        image = self._take_screenshot(delay, remove, fill_background, cut_box)
+        self._get_desired_obj().save_screenshot(screenshot_name, screenshot_base=image)
+        return image
+
+    def _take_screenshot(
+            self,
+            delay: Union[int, float],
+            remove: list,
+            fill_background: bool,
+            cut_box: Optional[Box],
+    ) -> Image.Image:
+        """
+        Take the screenshot without saving it
+
+        :return: the screenshot image
+        """
         time.sleep(delay)
 
         self._fill_background(fill_background)
         self._appends_dummy_elements(remove)
 
-        if fill_background or remove:
+        if (fill_background or remove) and not self.stable_screenshot:
             time.sleep(0.1)
 
-        desired_obj = self.element_wrapper or self.driver_wrapper.anchor or self.driver_wrapper
-        image = desired_obj.screenshot_image()
+        desired_obj = self._get_desired_obj()
+
+        if self.stable_screenshot:
+            image = self._get_stable_screenshot_image(desired_obj)
+        else:
+            image = desired_obj.screenshot_image()
 
         if cut_box:
             image_size = Size(*image.size)
             image = image.crop(astuple(cut_box.get_image_cut_box(image_size)))
 
-        desired_obj.save_screenshot(screenshot_name, screenshot_base=image)
-
         self._remove_dummy_elements()
+        return image
+
+    def _get_desired_obj(self) -> Any:
+        """
+        Get the object to take the screenshot of: element, anchor of the page or driver wrapper
+
+        :return: element or driver wrapper
+        """
+        return self.element_wrapper or self.driver_wrapper.anchor or self.driver_wrapper
+
+    @staticmethod
+    def _to_cv2_image(image: Image.Image) -> numpy.ndarray:
+        """
+        Convert the screenshot image to the BGR array, same as `cv2.imread` of the saved PNG file
+
+        :param image: the screenshot image
+        :return: BGR image array
+        """
+        return cv2.cvtColor(numpy.asarray(image.convert('RGB')), cv2.COLOR_RGB2BGR)
+
+    def _get_stable_screenshot_image(self, desired_obj: Any) -> Image.Image:
+        """
+        Capture screenshots until two consecutive captures are equal or `stable_screenshot_timeout` is reached
+
+        :param desired_obj: element or driver wrapper to capture
+        :return: the last captured image
+        """
+        start_time = time.time()
+        self._wait_animations_finished(self.stable_screenshot_timeout)
+        image = desired_obj.screenshot_image()
+        digest = self._get_image_digest(image)
+
+        while time.time() - start_time < self.stable_screenshot_timeout:
+            self._wait_animations_finished(self.stable_screenshot_timeout - (time.time() - start_time))
+            previous_digest, image = digest, desired_obj.screenshot_image()
+            digest = self._get_image_digest(image)
+
+            if digest == previous_digest:
+                return image
+
+        autolog(
+            f'Screenshot of "{self.screenshot_name}" is not stable after {self.stable_screenshot_timeout} seconds',
+            level=LogLevel.WARNING,
+        )
+        return image
+
+    def _wait_animations_finished(self, timeout: Union[int, float]) -> None:
+        """
+        Wait for finite CSS/Web animations and the next paint within the browser, if `wait_for_animations` is enabled
+
+        :param timeout: the maximum time to wait for animations (in seconds)
+        :return: None
+        """
+        driver_wrapper = self.driver_wrapper
+
+        if not self.wait_for_animations or timeout <= 0:
+            return None
+
+        if driver_wrapper.is_appium and driver_wrapper.is_native_context:
+            return None
+
+        timeout = int(timeout * 1000)
+
+        try:
+            if driver_wrapper.is_playwright:
+                driver_wrapper.driver.evaluate(wait_animations_finished_play_js, timeout)
+            else:
+                driver_wrapper.driver.execute_async_script(wait_animations_finished_js, timeout)
+        except (SeleniumWebDriverException, PlaywrightError) as exc:
+            autolog(f'Waiting for animations is not available: {exc}', level=LogLevel.DEBUG)
+
+        return None
+
+    @staticmethod
+    def _get_image_digest(image: Image.Image) -> bytes:
+        """
+        Get a cheap hash of the image pixels
+
+        :param image: image to hash
+        :return: digest of the image size and pixels
+        """
+        return hashlib.blake2b(f'{image.size}{image.mode}'.encode() + image.tobytes(), digest_size=16).digest()
 
     def _appends_dummy_elements(self, remove_data: list) -> VisualComparison:
         """
@@ -290,28 +450,41 @@ class VisualComparison:
 
         return self
 
-    def _assert_same_images(self, actual_file: str, reference_file: str, diff_file: str,
-                            threshold: Union[int, float]) -> VisualComparison:
+    def _assert_same_images(
+            self,
+            actual_image: Image.Image,
+            reference_image: numpy.ndarray,
+            actual_file: str,
+            reference_file: str,
+            diff_file: str,
+            threshold: Union[int, float],
+            engine: Optional[ComparisonEngine] = None,
+    ) -> VisualComparison:
         """
-        Assert that given images are equal to each other
+        Assert that given images are equal to each other.
+        The actual image is saved only if images are different.
 
+        :param actual_image: actual screenshot image
+        :param reference_image: decoded reference image
         :param actual_file: actual image path
         :param reference_file: reference image path
         :param diff_file: difference image name
         :param threshold: possible difference in percents
+        :param engine: comparison engine. If :obj:`None` - takes `comparison_engine`
         :return: VisualComparison
         """
-        reference_image = cv2.imread(reference_file)
-        output_image = cv2.imread(actual_file)
+        output_image = self._to_cv2_image(actual_image)
         threshold = threshold if threshold is not None else self.default_threshold
 
         additional_data = ''
         if not threshold:
-            threshold, additional_data = self.calculate_threshold(reference_file)
+            height, width = reference_image.shape[0:2]
+            threshold, additional_data = self._calculate_threshold_by_size(width, height)
 
         try:
             check_shape_equality(reference_image, output_image)
         except ValueError:
+            actual_image.save(actual_file)
             self._attach_allure_diff(actual_file, reference_file, actual_file)
             # TODO: watermark / fill size difference with color on diff image is better, but need more time
             # rescale output image to the size of reference image, and save it as diff image
@@ -322,10 +495,11 @@ class VisualComparison:
                                  f"\nExpected: {reference_image.shape[0:2]};"
                                  f"\nActual: {output_image.shape[0:2]}.") from None
 
-        diff, actual_threshold = self._get_difference(reference_image, output_image, threshold)
+        diff, actual_threshold = self._get_difference(reference_image, output_image, threshold, engine)
         is_different = actual_threshold > threshold
 
         if is_different:
+            actual_image.save(actual_file)
             cv2.imwrite(diff_file, diff)
             self._attach_allure_diff(actual_file, reference_file, diff_file)
 
@@ -400,52 +574,20 @@ class VisualComparison:
             self,
             reference_img: numpy.ndarray,
             actual_img: numpy.ndarray,
-            possible_threshold: Union[int, float]
+            possible_threshold: Union[int, float],
+            engine: Optional[ComparisonEngine] = None,
     ) -> tuple[numpy.ndarray, float]:
         """
         Calculate difference between two images
 
         :param reference_img: image 1, numpy.ndarray
         :param actual_img: image 2, numpy.ndarray
+        :param possible_threshold: possible difference in percents
+        :param engine: comparison engine. If :obj:`None` - takes `comparison_engine`
         :return: (diff image, diff float value )
         """
-        # Convert images to grayscale
-        reference_img_gray = cv2.cvtColor(reference_img, cv2.COLOR_BGR2GRAY)
-        actual_img_gray = cv2.cvtColor(actual_img, cv2.COLOR_BGR2GRAY)
-
-        # Compute SSIM between the two images
-        score, diff = structural_similarity(reference_img_gray, actual_img_gray, full=True)
-        score *= 100
-
-        # The diff image contains the actual image differences between the two images
-        # and is represented as a floating point data type in the range [0,1]
-        # so we must convert the array to 8-bit unsigned integers in the range
-        # [0,255] before we can use it with OpenCV
-        diff = (diff * 255).astype("uint8")
-        diff_box = cv2.merge([diff, diff, diff])
-
-        # Threshold the difference image, followed by finding contours to
-        # obtain the regions of the two input images that differ
-        thresh = cv2.threshold(diff, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)[1]
-        contours = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        contours = contours[0] if len(contours) == 2 else contours[1]
-
-        mask = numpy.zeros(reference_img.shape, dtype='uint8')
-        filled_after = actual_img.copy()
-        percent_diff = 100 - score
-        is_different_enough = percent_diff > possible_threshold
-
-        for c in contours:
-            if is_different_enough or cv2.contourArea(c) > 40:
-                x, y, w, h = cv2.boundingRect(c)
-                cv2.rectangle(reference_img, (x, y), (x + w, y + h), self.diff_color_scheme, 2)
-                cv2.rectangle(actual_img, (x, y), (x + w, y + h), self.diff_color_scheme, 2)
-                cv2.rectangle(diff_box, (x, y), (x + w, y + h), self.diff_color_scheme, 2)
-                cv2.drawContours(mask, [c], 0, (255, 255, 255), -1)
-                cv2.drawContours(filled_after, [c], 0, self.diff_color_scheme, -1)
-
-        diff_image, percent_diff = filled_after, 100 - score
-        return diff_image, percent_diff
+        engine = engine or self.comparison_engine
+        return engine.get_difference(reference_img, actual_img, possible_threshold, self.diff_color_scheme)
 
     def _attach_allure_diff(self, actual_path: str, expected_path: str, diff_path: str = None) -> None:
         """
@@ -24,6 +24,8 @@ from tests.adata.pages.playground_main_page import PlaygroundMainPage, SecondPla
 from tests.adata.pytest_utils import skip_platform
 
 
+pytest_plugins = ['pytester', 'mops.pytest_plugin']
+
 driver_wrapper_logs_settings()
 
 DESKTOP_WINDOW_SIZE = Size(1024, 900)
@@ -1,14 +1,14 @@
 import pytest
-from mops.mixins.objects.driver import Driver
-from mock.mock import MagicMock
 
-from playwright.sync_api import Browser, Page as PlaywrightSourcePage
-from appium.webdriver.webdriver import WebDriver as AppiumDriver
-from selenium.webdriver.remote.webdriver import WebDriver as SeleniumDriver
-
-from mops.base.driver_wrapper import DriverWrapper, DriverWrapperSessions
-from mops.playwright.play_driver import PlayDriver
-from mops.selenium.core.core_driver import CoreDriver
+from mops.base.driver_wrapper import DriverWrapper
+from tests.static_tests.mocked_drivers import (
+    android_capabilities,
+    get_mocked_appium_driver,
+    get_mocked_play_driver,
+    get_mocked_selenium_driver,
+    ios_capabilities,
+    reset_sessions,
+)
 
 
 class MockedDriverWrapper(DriverWrapper):
@@ -19,140 +19,59 @@ class MockedDriverWrapper(DriverWrapper):
 
 
 @pytest.fixture
-def mocked_shared_mobile_driver():
-    appium_driver = AppiumDriver
-    appium_driver.__init__ = lambda *args, **kwargs: None
-    appium_driver.session_id = None
-    appium_driver.command_executor = MagicMock()
-    appium_driver.error_handler = MagicMock()
-    return appium_driver
+def mocked_ios_driver():
+    yield get_mocked_appium_driver(ios_capabilities, MockedDriverWrapper)
+    reset_sessions()
 
 
 @pytest.fixture
-def mocked_ios_driver(mocked_shared_mobile_driver):
-    mocked_shared_mobile_driver.capabilities = MagicMock(
-        return_value={
-            'platformName': 'ios',
-            'browserName': 'safari',
-            'automationName': 'safari'
-        }
-    )()
-    driver_wrapper = MockedDriverWrapper(Driver(driver=mocked_shared_mobile_driver()))
-    yield driver_wrapper
-    DriverWrapperSessions.all_sessions = []
+def mocked_android_driver():
+    yield get_mocked_appium_driver(android_capabilities, MockedDriverWrapper)
+    reset_sessions()
 
 
 @pytest.fixture
-def mocked_android_driver(mocked_shared_mobile_driver):
-    mocked_shared_mobile_driver.capabilities = MagicMock(
-        return_value={
-            'platformName': 'Android',
-            'browserName': 'chrome',
-            'automationName': 'UiAutomator2'
-        }
-    )()
-    driver_wrapper = MockedDriverWrapper(Driver(driver=mocked_shared_mobile_driver()))
-    yield driver_wrapper
-    DriverWrapperSessions.all_sessions = []
+def mocked_ios_tablet_driver():
+    yield get_mocked_appium_driver({**ios_capabilities, 'is_tablet': True}, MockedDriverWrapper)
+    reset_sessions()
 
 
 @pytest.fixture
-def mocked_ios_tablet_driver(mocked_shared_mobile_driver):
-    mocked_shared_mobile_driver.capabilities = MagicMock(
-        return_value={
-            'platformName': 'ios',
-            'browserName': 'safari',
-            'automationName': 'safari',
-            'is_tablet': True,
-        }
-    )()
-    driver_wrapper = MockedDriverWrapper(Driver(driver=mocked_shared_mobile_driver()))
-    yield driver_wrapper
-    DriverWrapperSessions.all_sessions = []
-
-
-@pytest.fixture
-def mocked_android_tablet_driver(mocked_shared_mobile_driver):
-    mocked_shared_mobile_driver.capabilities = MagicMock(
-        return_value={
-            'platformName': 'Android',
-            'browserName': 'chrome',
-            'automationName': 'UiAutomator2',
-            'is_tablet': True,
-        }
-    )()
-    driver_wrapper = MockedDriverWrapper(Driver(driver=mocked_shared_mobile_driver()))
-    yield driver_wrapper
-    DriverWrapperSessions.all_sessions = []
+def mocked_android_tablet_driver():
+    yield get_mocked_appium_driver({**android_capabilities, 'is_tablet': True}, MockedDriverWrapper)
+    reset_sessions()
 
 
 @pytest.fixture
 def mocked_selenium_driver():
-    selenium_driver = SeleniumDriver
-    selenium_driver.__init__ = lambda *args, **kwargs: None
-    selenium_driver.session_id = None
-    selenium_driver.command_executor = MagicMock()
-    selenium_driver.error_handler = MagicMock()
-
-    selenium_driver.caps = {}
-    driver_wrapper = MockedDriverWrapper(Driver(driver=selenium_driver()))
-    yield driver_wrapper
-    DriverWrapperSessions.all_sessions = []
+    yield get_mocked_selenium_driver(MockedDriverWrapper)
+    reset_sessions()
 
 
 @pytest.fixture
 def mocked_selenium_mobile_driver():
-    selenium_driver = SeleniumDriver
-    selenium_driver.__init__ = lambda *args, **kwargs: None
-    selenium_driver.session_id = None
-    selenium_driver.command_executor = MagicMock()
-    selenium_driver.error_handler = MagicMock()
-
-    selenium_driver.caps = {}
-    driver_wrapper = MockedDriverWrapper(Driver(driver=selenium_driver(), is_mobile_resolution=True))
-    yield driver_wrapper
-    DriverWrapperSessions.all_sessions = []
+    yield get_mocked_selenium_driver(MockedDriverWrapper, is_mobile_resolution=True)
+    reset_sessions()
 
 
 @pytest.fixture
 def mocked_play_driver():
-    driver_wrapper = MockedDriverWrapper(
-        Driver(
-            driver=PlaywrightSourcePage(MagicMock()),
-            instance=Browser(MagicMock())
-        )
-    )
+    driver_wrapper = get_mocked_play_driver(MockedDriverWrapper)
     driver_wrapper.is_desktop = True
     yield driver_wrapper
-    DriverWrapperSessions.all_sessions = []
+    reset_sessions()
 
 
 @pytest.fixture
 def mocked_play_mobile_driver():
-    driver_wrapper = MockedDriverWrapper(
-        Driver(
-            driver=PlaywrightSourcePage(MagicMock()),
-            instance=Browser(MagicMock()),
-            is_mobile_resolution=True,
-        )
-    )
-    yield driver_wrapper
-    DriverWrapperSessions.all_sessions = []
+    yield get_mocked_play_driver(MockedDriverWrapper, is_mobile_resolution=True)
+    reset_sessions()
 
 
 @pytest.fixture(autouse=True)
 def base_teardown():
     yield
-    DriverWrapper.is_multiplatform = False
-    DriverWrapper.is_mobile = False
-    DriverWrapper.is_desktop = False
-    DriverWrapper.is_ios = False
-    DriverWrapper.is_android = False
-    DriverWrapper.is_selenium = False
-    DriverWrapper.is_playwright = False
-    PlayDriver.driver = None
-    CoreDriver.driver = None
-    DriverWrapperSessions.all_sessions = []
+    reset_sessions()
 
 
 mobile_drivers = [mocked_ios_driver.__name__, mocked_android_driver.__name__]
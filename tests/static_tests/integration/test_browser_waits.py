@@ -0,0 +1,139 @@
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+
+from mops.base.element import Element
+from mops.exceptions import TimeoutException
+from mops.js_scripts import wait_in_browser_js
+from mops.selenium.core.core_element import CoreElement
+from mops.utils.browser_waits import BROWSER_WAIT_CHUNK, get_browser_wait_chunk, get_browser_wait_predicate
+
+
+chain = [{'type': 'css', 'value': '.element'}]
+
+
+def set_script_timeout(driver_wrapper, script_timeout):
+    timeouts = {'implicit': 0, 'pageLoad': 300000, 'script': script_timeout * 1000}
+    driver_wrapper.driver.execute = MagicMock(return_value={'value': timeouts})
+
+
+@pytest.fixture
+def hidden_element(mocked_selenium_driver):
+    mocked_selenium_driver.browser_side_waits = True
+    mocked_selenium_driver.driver.execute_async_script = MagicMock(return_value=True)
+    set_script_timeout(mocked_selenium_driver, 30)
+    element = Element('.element', name='element')
+    element.is_displayed = MagicMock(return_value=False)
+    return element
+
+
+def test_browser_side_waits_disabled_by_default(mocked_selenium_driver):
+    mocked_selenium_driver.driver.execute_async_script = MagicMock()
+    element = Element('.element', name='element')
+    element.is_displayed = MagicMock(side_effect=[False, True])
+
+    CoreElement.wait_visibility(element, timeout=1)
+
+    mocked_selenium_driver.driver.execute_async_script.assert_not_called()
+
+
+def test_browser_side_wait_single_call(hidden_element, mocked_selenium_driver):
+    hidden_element.is_displayed.side_effect = [False, True]
+
+    assert CoreElement.wait_visibility(hidden_element, timeout=1) == hidden_element
+
+    mocked_selenium_driver.driver.execute_async_script.assert_called_once()
+    script, *args = mocked_selenium_driver.driver.execute_async_script.call_args.args
+    assert script == wait_in_browser_js
+    assert args[:2] == [chain, {'type': 'visible', 'expected': None}]
+    assert 0 < args[2] <= 1000
+    assert hidden_element.is_displayed.call_count == 2, 'browser-side result is not confirmed'
+
+
+def test_browser_side_wait_confirmation_mismatch(mocked_selenium_driver):
+    mocked_selenium_driver.browser_side_waits = True
+    mocked_selenium_driver.driver.execute_async_script = MagicMock(return_value=True)
+    set_script_timeout(mocked_selenium_driver, 30)
+    element = Element('.element', name='element')
+    text = PropertyMock(side_effect=['', 'TEXT', 'text'])
+
+    with patch.object(Element, 'text', text):
+        element.wait_for_text('text', timeout=1)
+
+    mocked_selenium_driver.driver.execute_async_script.assert_called_once()
+    assert text.call_count == 3, 'polling is not continued after confirmation mismatch'
+
+
+def test_browser_side_wait_timeout(hidden_element, mocked_selenium_driver):
+    mocked_selenium_driver.driver.execute_async_script.return_value = False
+
+    with pytest.raises(TimeoutException):
+        CoreElement.wait_visibility(hidden_element, timeout=0.2)
+
+    assert hidden_element.is_displayed.call_count == 2, 'final check is not performed after browser-side wait'
+
+
+def test_browser_side_wait_fallback_to_polling(hidden_element, mocked_selenium_driver):
+    mocked_selenium_driver.driver.execute_async_script.side_effect = JavascriptException('blocked')
+    hidden_element.is_displayed.side_effect = [False, False, True]
+
+    CoreElement.wait_visibility(hidden_element, timeout=1)
+
+    mocked_selenium_driver.driver.execute_async_script.assert_called_once()
+    assert hidden_element.is_displayed.call_count == 3
+
+
+def test_browser_side_wait_chunk_within_script_timeout(hidden_element, mocked_selenium_driver):
+    hidden_element.is_displayed.side_effect = [False, True]
+    set_script_timeout(mocked_selenium_driver, 2)
+    mocked_selenium_driver.driver.execute_async_script.side_effect = [False, True]
+
+    CoreElement.wait_visibility(hidden_element, timeout=10)
+
+    assert mocked_selenium_driver.driver.execute_async_script.call_count == 2
+    assert mocked_selenium_driver.driver.execute_async_script.call_args_list[0].args[3] == 1500
+
+
+def test_browser_side_wait_short_script_timeout(hidden_element, mocked_selenium_driver):
+    set_script_timeout(mocked_selenium_driver, 0.5)
+    hidden_element.is_displayed.side_effect = [False, True]
+
+    CoreElement.wait_visibility(hidden_element, timeout=1)
+
+    mocked_selenium_driver.driver.execute_async_script.assert_not_called()
+
+
+def test_browser_side_wait_script_timeout_cached(hidden_element, mocked_selenium_driver):
+    hidden_element.is_displayed.side_effect = [False, True, False, True]
+    CoreElement.wait_visibility(hidden_element, timeout=1)
+    CoreElement.wait_visibility(hidden_element, timeout=1)
+
+    assert mocked_selenium_driver.driver.execute.call_count == 1, 'script timeout is requested for each wait'
+
+
+def test_browser_side_wait_script_timeout_refreshed(hidden_element, mocked_selenium_driver):
+    hidden_element.is_displayed.side_effect = [False, True, False, True]
+    CoreElement.wait_visibility(hidden_element, timeout=1)
+    mocked_selenium_driver.set_script_timeout(2)
+    mocked_selenium_driver.driver.execute_async_script.side_effect = [False, True]
+
+    CoreElement.wait_visibility(hidden_element, timeout=10)
+
+    assert mocked_selenium_driver.driver.execute_async_script.call_args_list[1].args[3] == 1500
+
+
+@pytest.mark.parametrize('script_timeout, chunk', [(None, BROWSER_WAIT_CHUNK), (300, BROWSER_WAIT_CHUNK), (5, 4.5)])
+def test_get_browser_wait_chunk(script_timeout, chunk):
+    assert get_browser_wait_chunk(script_timeout) == chunk
+
+
+@pytest.mark.parametrize('method_name, args, kwargs, predicate', [
+    ('wait_visibility', (), {}, {'type': 'visible', 'expected': None}),
+    ('wait_for_text', ('text',), {}, {'type': 'text', 'expected': 'text'}),
+    ('wait_for_value', (), {'expected_value': 'value'}, {'type': 'value', 'expected': 'value'}),
+    ('wait_elements_count', (3,), {}, {'type': 'count', 'expected': 3}),
+    ('wait_for_size', (None,), {}, None),
+])
+def test_get_browser_wait_predicate(method_name, args, kwargs, predicate):
+    assert get_browser_wait_predicate(method_name, args, kwargs) == predicate
@@ -1,5 +1,9 @@
 from mops.base.element import Element
 from mops.base.group import Group
+from mops.base.page import Page
+from mops.utils.internal_utils import get_class_attributes
+from tests.static_tests.conftest import MockedDriverWrapper
+from tests.static_tests.mocked_drivers import get_mocked_selenium_driver
 
 
 class Section1:
@@ -34,3 +38,84 @@ def test_child_elements(mocked_selenium_driver):
     assert section2.some_element
     assert section2.some_element._initialized  # noqa
     assert section2.child_elements
+
+
+def test_child_elements_order(mocked_selenium_driver):
+    class Section4(Section2):
+        def __init__(self):
+            super().__init__('section4', name='section4')
+
+        first_element = Element('first_element')
+        second_element = Element('second_element')
+
+    section4 = Section4()
+    names = [element.locator for element in section4.child_elements]
+    assert names == ['[id="some_element"]', '[id="first_element"]', '[id="second_element"]']
+
+
+def test_child_elements_class_changed(mocked_selenium_driver):
+    class Section5(Section2):
+        def __init__(self):
+            super().__init__('section5', name='section5')
+
+    assert len(Section5().child_elements) == 1
+
+    Section5.new_element = Element('new_element')
+    assert len(Section5().child_elements) == 2
+
+
+def test_child_elements_class_attribute_replaced(mocked_selenium_driver):
+    class Section6(Section2):
+        def __init__(self):
+            super().__init__('section6', name='section6')
+
+        replaced_element = Element('.a')
+
+    assert Section6().replaced_element.locator == '.a'
+
+    Section6.replaced_element = Element('.b')
+    assert Section6().replaced_element.locator == '.b'
+
+    Section2.some_element = Element('.another')
+    try:
+        assert Section6().some_element.locator == '.another'
+    finally:
+        Section2.some_element = Element('some_element')
+
+
+def test_page_class_attribute_replaced(mocked_selenium_driver):
+    class ReplacedPage(Page):
+        def __init__(self):
+            super().__init__('.page', name='page')
+
+        a = Element('.a')
+
+    assert ReplacedPage().a.locator == '.a'
+
+    ReplacedPage.a = Element('.b')
+    assert ReplacedPage().a.locator == '.b'
+
+
+def test_class_attributes_kept_on_driver_wrapper_initialization(mocked_selenium_driver):
+    attributes = get_class_attributes(Section3)
+
+    get_mocked_selenium_driver(MockedDriverWrapper)
+
+    assert get_class_attributes(Section3) is attributes, 'cached attributes of unrelated class are invalidated'
+
+
+def test_class_attribute_plain_value_replaced(mocked_selenium_driver):
+    class Section7(Section2):
+        flag = False
+
+    class Section8(Section7):
+        flag = 'overridden'
+
+    attributes = get_class_attributes(Section7)
+    get_class_attributes(Section8)
+
+    Section7.flag = True
+
+    assert get_class_attributes(Section7) is attributes
+    assert attributes['flag'] is True
+    assert get_class_attributes(Section8)['flag'] == 'overridden'
@@ -1,3 +1,12 @@
+import pytest
+from mock.mock import MagicMock
+from selenium.webdriver.remote.webdriver import WebDriver as SeleniumDriver
+
+from mops.base.driver_wrapper import DriverWrapperSessions
+from mops.mixins.objects.driver import Driver
+from tests.static_tests.conftest import MockedDriverWrapper
+
+
 def test_driver_variables_android_tablet(mocked_android_tablet_driver):
     dw = mocked_android_tablet_driver
 
@@ -148,3 +157,22 @@ def test_driver_variables_playwright_mobile_resolution(mocked_play_mobile_driver
     assert dw.is_mobile_resolution is True
     assert dw.is_playwright is True
     assert dw.is_mobile is True
+
+
+@pytest.mark.parametrize('option', ['cache_parent_elements', 'browser_side_waits', 'collect_metrics'])
+def test_driver_wrapper_class_options_kept(option):
+    selenium_driver = SeleniumDriver
+    selenium_driver.__init__ = lambda *args, **kwargs: None
+    selenium_driver.session_id = None
+    selenium_driver.command_executor = MagicMock()
+    selenium_driver.error_handler = MagicMock()
+    selenium_driver.caps = {}
+
+    configured_cls = type('ConfiguredDriverWrapper', (MockedDriverWrapper, ), {option: True})
+    try:
+        driver_wrapper = configured_cls(Driver(driver=selenium_driver()))
+        assert getattr(driver_wrapper, option) is True
+        assert driver_wrapper.metrics.enabled is (option == 'collect_metrics')
+        driver_wrapper.metrics.disable()
+    finally:
+        DriverWrapperSessions.all_sessions = []
@@ -0,0 +1,73 @@
+import pytest
+from mock.mock import MagicMock
+from selenium.common.exceptions import (
+    ElementClickInterceptedException as SeleniumElementClickInterceptedException,
+    StaleElementReferenceException as SeleniumStaleElementReferenceException,
+)
+
+from mops.base.element import Element
+from mops.exceptions import ElementNotInteractableException, TimeoutException
+from mops.mixins.objects.polling_strategy import FixedPolling
+from mops.mixins.objects.retry_policy import RetryPolicy
+from mops.selenium.core.core_element import CoreElement
+
+
+def get_element(driver_wrapper, source_element):
+    driver_wrapper.is_safari = False
+    driver_wrapper.retry_policy = RetryPolicy(backoff=FixedPolling(delay=0))
+    element = Element('button', name='button')
+    element._find_element = MagicMock(return_value=source_element)
+    element.wait_enabled = lambda **kwargs: element
+    return element
+
+
+def test_click_retried_without_resolving(mocked_selenium_driver):
+    source_element = MagicMock()
+    source_element.click.side_effect = [SeleniumElementClickInterceptedException(), None]
+    element = get_element(mocked_selenium_driver, source_element)
+    CoreElement.click(element, force_wait=False)
+    assert source_element.click.call_count == 2
+    assert element._find_element.call_count == 1
+    assert element._element is None
+
+
+def test_click_stale_element_resolved(mocked_selenium_driver):
+    source_element = MagicMock()
+    source_element.click.side_effect = [SeleniumStaleElementReferenceException(), None]
+    element = get_element(mocked_selenium_driver, source_element)
+    CoreElement.click(element, force_wait=False)
+    assert source_element.click.call_count == 2
+    assert element._find_element.call_count == 2
+
+
+def test_click_stale_element_waited_within_deadline(mocked_selenium_driver):
+    source_element = MagicMock()
+    source_element.click.side_effect = SeleniumStaleElementReferenceException()
+    element = get_element(mocked_selenium_driver, source_element)
+    mocked_selenium_driver.retry_policy = RetryPolicy(timeout=0.5, backoff=FixedPolling(delay=0))
+    element._find_element.side_effect = [source_element, None]
+    element.wait_visibility = MagicMock(side_effect=TimeoutException('"button" not visible'))
+
+    with pytest.raises(ElementNotInteractableException):
+        CoreElement.click(element, force_wait=False)
+
+    assert element.wait_visibility.call_count == 1
+    assert 0 < element.wait_visibility.call_args.kwargs['timeout'] <= 0.5
+
+
+def test_check_retried(mocked_selenium_driver):
+    source_element = MagicMock()
+    source_element.is_selected.return_value = False
+    source_element.click.side_effect = [SeleniumElementClickInterceptedException(), None]
+    element = get_element(mocked_selenium_driver, source_element)
+    CoreElement.check(element)
+    assert source_element.click.call_count == 2
+    assert element._find_element.call_count == 1
+
+
+def test_uncheck_skipped(mocked_selenium_driver):
+    source_element = MagicMock()
+    source_element.is_selected.return_value = False
+    element = get_element(mocked_selenium_driver, source_element)
+    CoreElement.uncheck(element)
+    assert not source_element.click.called
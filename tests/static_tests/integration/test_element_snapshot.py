@@ -0,0 +1,181 @@
+from dataclasses import FrozenInstanceError
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from mops.base.element import Element
+from mops.base.group import Group
+from mops.base.page import Page
+from mops.js_scripts import (
+    get_children_snapshot_js,
+    get_children_snapshot_play_js,
+    get_element_snapshot_js,
+    get_element_snapshot_play_js,
+)
+from mops.mixins.objects.snapshot import ElementSnapshot, snapshot_fields
+from mops.playwright.play_element import PlayElement
+from mops.selenium.core.core_element import CoreElement
+
+
+snapshot_data = {
+    'text': 'text',
+    'value': '',
+    'rect': {'y': 1, 'x': 2, 'width': 3, 'height': 4},
+    'displayed': True,
+    'enabled': True,
+    'checked': False,
+    'attributes': {'class': 'some-class'},
+}
+
+
+def test_snapshot_selenium_single_call(mocked_selenium_driver):
+    element = Element('.element', name='element')
+    mocked_selenium_driver.driver.find_element = MagicMock()
+    mocked_selenium_driver.execute_script = MagicMock(return_value=snapshot_data)
+
+    snapshot = CoreElement.snapshot(element, attributes=['class'])
+
+    mocked_selenium_driver.execute_script.assert_called_once_with(
+        get_element_snapshot_js, element, list(snapshot_fields), ['class']
+    )
+    assert snapshot == ElementSnapshot(**snapshot_data)
+    assert element._element is None
+
+
+def test_snapshot_playwright_single_call(mocked_play_driver):
+    element = Element('.element', name='element')
+    locator = MagicMock()
+    locator.evaluate = MagicMock(return_value={'text': 'text', 'attributes': {}})
+
+    with patch.object(element.__class__, '_first_element', new_callable=PropertyMock, return_value=locator):
+        snapshot = PlayElement.snapshot(element, fields=['text'])
+
+    locator.evaluate.assert_called_once_with(get_element_snapshot_play_js, {'fields': ['text'], 'attributes': []})
+    assert snapshot.text == 'text'
+    assert snapshot.rect is None
+
+
+def test_snapshot_unexpected_field(mocked_selenium_driver):
+    with pytest.raises(ValueError, match='Unexpected snapshot fields'):
+        CoreElement.snapshot(Element('.element', name='element'), fields=['text', 'size'])
+
+
+def test_snapshot_is_frozen():
+    snapshot = ElementSnapshot(**snapshot_data)
+    with pytest.raises(FrozenInstanceError):
+        snapshot.text = 'new text'  # noqa
+
+
+class SnapshotGroup(Group):
+    def __init__(self):
+        super().__init__('.group', name='group')
+
+    title = Element('//h1', name='title')
+    button = Element('id=submit', name='button')
+
+
+class SnapshotPage(Page):
+    def __init__(self):
+        super().__init__('.page', name='page')
+
+    group = SnapshotGroup()
+    link = Element('.link', name='link')
+
+
+def test_group_snapshot_selenium_single_call(mocked_selenium_driver):
+    group = SnapshotGroup()
+    mocked_selenium_driver.driver.execute_script = MagicMock(
+        return_value={'title': snapshot_data, 'button': {'present': False}}
+    )
+
+    snapshot = group.snapshot(fields=['text'])
+
+    mocked_selenium_driver.driver.execute_script.assert_called_once_with(
+        get_children_snapshot_js,
+        {
+            'title': [{'type': 'css', 'value': '.group'}, {'type': 'xpath', 'value': '//h1', 'relative': False}],
+            'button': [{'type': 'css', 'value': '.group'}, {'type': 'css', 'value': '[id="submit"]'}],
+        },
+        ['text'],
+        [],
+    )
+    assert snapshot == {'title': ElementSnapshot(**snapshot_data), 'button': ElementSnapshot(present=False)}
+
+
+def test_page_snapshot_playwright_single_call(mocked_play_driver):
+    page = SnapshotPage()
+    page.link.is_available = MagicMock(return_value=False)
+    mocked_play_driver.driver.evaluate = MagicMock(return_value={
+        'anchor': {'present': True}, 'group': {'present': True}, 'link': {'present': False},
+    })
+
+    snapshot = page.snapshot(fields=['displayed'])
+
+    mocked_play_driver.driver.evaluate.assert_called_once_with(
+        get_children_snapshot_play_js,
+        {
+            'chains': {
+                'anchor': [{'type': 'css', 'value': '.page', 'relative': True}],
+                'group': [{'type': 'css', 'value': '.group', 'relative': True}],
+                'link': [{'type': 'css', 'value': '.link', 'relative': True}],
+            },
+            'fields': ['displayed'],
+            'attributes': [],
+        }
+    )
+    assert snapshot['link'] == ElementSnapshot(present=False)
+    assert snapshot['group'].present
+
+
+def test_group_snapshot_unresolvable_element_fallback(mocked_selenium_driver):
+    group = SnapshotGroup()
+    group.button.is_available = MagicMock(return_value=True)
+    mocked_selenium_driver.driver.execute_script = MagicMock(
+        return_value={'title': snapshot_data, 'button': {'present': False, 'unresolvable': True}}
+    )
+
+    with patch.object(CoreElement, 'snapshot', return_value=ElementSnapshot(present=True, text='Submit')) as snapshot:
+        result = group.snapshot(fields=['text'])
+
+    snapshot.assert_called_once_with(group.button, fields=['text'], attributes=[], silent=True)
+    mocked_selenium_driver.driver.execute_script.assert_called_once()
+    assert list(result) == ['title', 'button']
+    assert result['button'] == ElementSnapshot(present=True, text='Submit')
+
+
+def test_page_snapshot_playwright_not_found_element_fallback(mocked_play_driver):
+    page = SnapshotPage()
+    page.link.is_available = MagicMock(return_value=True)
+    mocked_play_driver.driver.evaluate = MagicMock(return_value={
+        'anchor': {'present': True}, 'group': {'present': True}, 'link': {'present': False},
+    })
+
+    with patch.object(PlayElement, 'snapshot', return_value=ElementSnapshot(present=True)) as snapshot:
+        result = page.snapshot(fields=['displayed'])
+
+    snapshot.assert_called_once_with(page.link, fields=['displayed'], attributes=[], silent=True)
+    assert set(result) == {'anchor', 'group', 'link'}
+    assert result['link'].present
+
+
+class TextSnapshotGroup(Group):
+    def __init__(self):
+        super().__init__('.group', name='group')
+
+    unquoted = Element('text=Submit', name='unquoted')
+    quoted = Element('text="Submit"', name='quoted')
+
+
+def test_group_snapshot_playwright_quoted_text_fallback(mocked_play_driver):
+    group = TextSnapshotGroup()
+    group.quoted.is_available = MagicMock(return_value=True)
+    mocked_play_driver.driver.evaluate = MagicMock(return_value={'unquoted': {'present': True}})
+
+    with patch.object(PlayElement, 'snapshot', return_value=ElementSnapshot(present=True)) as snapshot:
+        result = group.snapshot(fields=['displayed'])
+
+    chains = mocked_play_driver.driver.evaluate.call_args.args[1]['chains']
+    assert list(chains) == ['unquoted']
+    assert chains['unquoted'][-1] == {'type': 'text', 'value': 'Submit', 'relative': True}
+    snapshot.assert_called_once_with(group.quoted, fields=['displayed'], attributes=[], silent=True)
+    assert result['unquoted'].present and result['quoted'].present
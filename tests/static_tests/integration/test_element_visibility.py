@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from mops.base.element import Element
+from mops.js_scripts import get_element_visibility_js, get_element_visibility_play_js
+from mops.mixins.objects.size import Size
+from mops.utils.internal_utils import get_visibility_ratio, is_target_on_screen
+
+
+def get_visibility_data(x=0, y=0, width=100, height=100, displayed=True, ratio=1):
+    return {
+        'displayed': displayed,
+        'rect': {'x': x, 'y': y, 'width': width, 'height': height},
+        'viewport': {'width': 1000, 'height': 500},
+        'ratio': ratio,
+    }
+
+
+@pytest.fixture
+def selenium_element(mocked_selenium_driver):
+    element = Element('.element', name='element')
+    element.is_available = MagicMock(return_value=True)
+    element._cached_element = MagicMock()
+    mocked_selenium_driver.driver.execute_script = MagicMock()
+    return element
+
+
+@pytest.mark.parametrize('data, is_visible, is_fully_visible', [
+    (get_visibility_data(), True, True),
+    (get_visibility_data(x=950), True, False),
+    (get_visibility_data(y=-50), True, False),
+    (get_visibility_data(y=600), False, False),
+    (get_visibility_data(displayed=False), False, False),
+])
+def test_visibility_single_call(selenium_element, mocked_selenium_driver, data, is_visible, is_fully_visible):
+    mocked_selenium_driver.driver.execute_script.return_value = data
+
+    assert selenium_element.is_visible() is is_visible
+    assert selenium_element.is_fully_visible() is is_fully_visible
+    assert mocked_selenium_driver.driver.execute_script.call_count == 2
+    mocked_selenium_driver.driver.execute_script.assert_called_with(
+        get_element_visibility_js, selenium_element._cached_element
+    )
+
+
+def test_visibility_without_displaying_check(selenium_element, mocked_selenium_driver):
+    mocked_selenium_driver.driver.execute_script.return_value = get_visibility_data(displayed=False)
+
+    assert selenium_element.is_fully_visible(check_displaying=False)
+
+
+def test_visibility_of_not_available_element(selenium_element, mocked_selenium_driver):
+    selenium_element.is_available.return_value = False
+
+    assert not selenium_element.is_visible(check_displaying=False)
+    assert selenium_element.visibility_ratio() == 0
+    mocked_selenium_driver.driver.execute_script.assert_not_called()
+
+
+def test_visibility_ratio(selenium_element, mocked_selenium_driver):
+    mocked_selenium_driver.driver.execute_script.return_value = get_visibility_data(ratio=0.25)
+    assert selenium_element.visibility_ratio() == 0.25
+
+    mocked_selenium_driver.driver.execute_script.return_value = get_visibility_data(ratio=0.25, displayed=False)
+    assert selenium_element.visibility_ratio() == 0
+
+
+def test_visibility_playwright_single_call(mocked_play_driver):
+    element = Element('.element', name='element')
+    locator = MagicMock()
+    locator.evaluate_all = MagicMock(return_value=get_visibility_data(x=950, ratio=0.5))
+
+    with patch.object(Element, 'element', new_callable=PropertyMock, return_value=locator):
+        assert element.is_visible()
+        assert element.visibility_ratio() == 0.5
+
+    locator.evaluate_all.assert_called_with(get_element_visibility_play_js)
+    assert locator.evaluate_all.call_count == 2
+
+
+@pytest.mark.parametrize('rect, ratio', [
+    ({'x': 0, 'y': 0, 'width': 100, 'height': 100}, 1),
+    ({'x': 50, 'y': 80, 'width': 100, 'height': 40}, 0.25),
+    ({'x': -100, 'y': 0, 'width': 100, 'height': 100}, 0),
+    ({'x': 0, 'y': 0, 'width': 0, 'height': 100}, 0),
+])
+def test_get_visibility_ratio(rect, ratio):
+    assert get_visibility_ratio(rect, Size(width=100, height=100)) == ratio
+
+
+def test_target_on_screen_float_coordinates():
+    assert is_target_on_screen(x=10.5, y=0.2, possible_range=Size(width=100, height=100))
+    assert not is_target_on_screen(x=-0.5, y=0, possible_range=Size(width=100, height=100))
@@ -0,0 +1,124 @@
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from mops.base.element import Element
+from mops.js_scripts import get_all_texts_js
+from mops.playwright.play_element import PlayElement
+from mops.selenium.core.core_element import CoreElement
+
+
+def get_element_with_handles(driver_wrapper, count):
+    element = Element('.row', name='row')
+    handles = [MagicMock() for _ in range(count)]
+    element.wait_visibility = MagicMock()
+    driver_wrapper.is_safari = False
+    driver_wrapper.driver.find_elements = MagicMock(return_value=handles)
+    driver_wrapper.driver.execute_script = MagicMock(return_value=[f'row {i}' for i in range(count)])
+    return element, handles
+
+
+def test_get_all_texts_selenium_single_call(mocked_selenium_driver):
+    element, handles = get_element_with_handles(mocked_selenium_driver, 500)
+
+    assert CoreElement.get_all_texts(element) == [f'row {i}' for i in range(500)]
+    mocked_selenium_driver.driver.find_elements.assert_called_once()
+    mocked_selenium_driver.driver.execute_script.assert_called_once_with(get_all_texts_js, handles, 'innerText')
+    assert not any(handle.text.called for handle in handles)
+
+
+def test_get_all_texts_selenium_safari(mocked_selenium_driver):
+    element, handles = get_element_with_handles(mocked_selenium_driver, 2)
+    mocked_selenium_driver.is_safari = True
+
+    CoreElement.get_all_texts(element)
+
+    mocked_selenium_driver.driver.execute_script.assert_called_once_with(get_all_texts_js, handles, 'textContent')
+
+
+def test_all_elements_selenium_wraps_on_access(mocked_selenium_driver):
+    element, handles = get_element_with_handles(mocked_selenium_driver, 1000)
+    element._wrap_element = MagicMock(side_effect=lambda source: source)
+
+    all_elements = CoreElement.all_elements.fget(element)
+
+    assert len(all_elements) == 1000
+    assert all_elements[5] is handles[5]
+    assert all_elements.nth(-1) is all_elements.last is handles[-1]
+    assert all_elements[10:12] == handles[10:12]
+    assert element._wrap_element.call_count == 4
+    assert all_elements[5] is handles[5] and element._wrap_element.call_count == 4, 'same index wrapped twice'
+    mocked_selenium_driver.driver.find_elements.assert_called_once()
+
+
+def test_all_elements_selenium_index_out_of_range(mocked_selenium_driver):
+    element, handles = get_element_with_handles(mocked_selenium_driver, 2)
+
+    with pytest.raises(IndexError):
+        CoreElement.all_elements.fget(element)[2]
+
+
+def test_all_elements_playwright_nth_without_fetch(mocked_play_driver):
+    element = Element('.row', name='row')
+    locator = MagicMock()
+    locator.count = MagicMock(return_value=3)
+    element._wrap_element = MagicMock(side_effect=lambda source: source)
+
+    with patch.object(Element, 'element', new_callable=PropertyMock, return_value=locator):
+        all_elements = PlayElement.all_elements.fget(element)
+
+    assert all_elements.last is locator.last
+    locator.count.assert_not_called()
+
+    assert all_elements.nth(2) is locator.nth.return_value
+    assert all_elements.first is locator.nth.return_value
+    locator.nth.assert_called_with(0)
+    locator.all.assert_not_called()
+
+    assert len(list(all_elements)) == 3
+    locator.count.assert_called_once()
+
+
+def test_all_elements_playwright_index_out_of_range(mocked_play_driver):
+    element = Element('.row', name='row')
+    locator = MagicMock()
+    locator.count = MagicMock(return_value=2)
+
+    with patch.object(Element, 'element', new_callable=PropertyMock, return_value=locator):
+        all_elements = PlayElement.all_elements.fget(element)
+
+    with pytest.raises(IndexError):
+        all_elements[2]
+
+    locator.nth.assert_not_called()
+
+
+def test_all_elements_playwright_last_wrapped_once(mocked_play_driver):
+    element = Element('.row', name='row')
+    element._wrap_element = MagicMock(side_effect=lambda source: MagicMock())
+
+    with patch.object(Element, 'element', new_callable=PropertyMock, return_value=MagicMock()):
+        all_elements = PlayElement.all_elements.fget(element)
+
+    assert all_elements.last is all_elements.last
+    element._wrap_element.assert_called_once()
+
+
+def test_get_elements_count_selenium_without_wrapping(mocked_selenium_driver):
+    element, handles = get_element_with_handles(mocked_selenium_driver, 500)
+    element._wrap_element = MagicMock()
+
+    assert CoreElement.get_elements_count(element) == 500
+    element._wrap_element.assert_not_called()
+
+
+def test_get_elements_count_playwright_locator_count(mocked_play_driver):
+    element = Element('.row', name='row')
+    locator = MagicMock()
+    locator.count = MagicMock(return_value=7)
+
+    with patch.object(Element, 'element', new_callable=PropertyMock, return_value=locator):
+        assert PlayElement.get_elements_count(element) == 7
+
+    locator.all.assert_not_called()
+    locator.nth.assert_not_called()
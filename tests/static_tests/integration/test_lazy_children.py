@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock
+
+from mops.base.element import Element
+from mops.base.group import Group
+from mops.base.page import Page
+
+
+class LazySection(Group):
+    def __init__(self):
+        super().__init__('.section', name='section')
+
+    lazy_children = True
+
+    title = Element('.title', name='title')
+
+
+class LazyPage(Page):
+    def __init__(self):
+        super().__init__('.page', name='lazy page')
+
+    lazy_children = True
+
+    header = Element('.header', name='header', wait=True)
+    logo = Element('.logo', name='logo', parent=header)
+    section = LazySection()
+
+
+def test_lazy_children_not_initialized(mocked_selenium_driver):
+    page = LazyPage()
+    assert 'header' not in page.__dict__
+    assert 'section' not in page.__dict__
+
+
+def test_lazy_children_initialized_on_access(mocked_selenium_driver):
+    page = LazyPage()
+    header = page.header
+    assert header._initialized  # noqa
+    assert header.driver_wrapper == mocked_selenium_driver
+    assert page.header is header
+    assert page.__dict__['header'] is header
+    assert not LazyPage.header._initialized  # noqa
+
+
+def test_lazy_children_parent_promoted(mocked_selenium_driver):
+    page = LazyPage()
+    assert page.logo.parent is page.header
+
+
+def test_lazy_group_children(mocked_selenium_driver):
+    page = LazyPage()
+    section = page.section
+    assert 'title' not in section.__dict__
+    assert section.title._initialized  # noqa
+    assert section.title.parent is section
+
+
+def test_lazy_page_elements(mocked_selenium_driver):
+    page = LazyPage()
+    assert len(page.page_elements) == 4
+    assert all(element._initialized for element in page.page_elements)  # noqa
+    assert page.page_elements[0] is page.header
+
+
+def test_lazy_page_wait_page_loaded(mocked_selenium_driver):
+    mocked_selenium_driver.driver.execute_script = MagicMock(return_value={
+        'anchor': {'present': True, 'displayed': True},
+        'header': {'present': True, 'displayed': True},
+    })
+    page = LazyPage()
+    page.wait_page_loaded(timeout=1)
+    assert 'header' in page.__dict__
+    assert 'logo' not in page.__dict__
+
+
+def test_lazy_group_wrapped(mocked_selenium_driver):
+    section = LazyPage().section
+    wrapped = section._wrap_element(MagicMock())
+    assert 'title' not in wrapped.__dict__
+    assert wrapped.title.parent is wrapped
+    assert section.title.parent is section
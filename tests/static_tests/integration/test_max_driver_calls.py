@@ -0,0 +1,95 @@
+import pytest
+from mock.mock import MagicMock
+from pluggy import Result
+
+from mops.base.element import Element
+from mops.exceptions import DriverCallsBudgetException
+from mops.pytest_plugin import pytest_runtest_call
+from mops.utils.metrics import max_driver_calls
+from tests.static_tests.conftest import MockedDriverWrapper
+from tests.static_tests.mocked_drivers import get_mocked_selenium_driver
+from tests.static_tests.integration.test_metrics import MetricsPage
+
+
+def run_marked_test(marker, test):
+    item = MagicMock(get_closest_marker=lambda name: marker)
+    hook = pytest_runtest_call(item)
+    next(hook)
+    outcome = Result.from_call(test)
+
+    with pytest.raises(StopIteration):
+        hook.send(outcome)
+
+    return outcome
+
+
+def test_max_driver_calls_within_budget(mocked_selenium_driver):
+    with max_driver_calls(1) as result:
+        MetricsPage().button.is_enabled()
+
+    assert result[0].count == 1
+    assert not mocked_selenium_driver.metrics.enabled
+
+
+def test_max_driver_calls_exceeded(mocked_selenium_driver):
+    with pytest.raises(DriverCallsBudgetException) as exc:
+        with max_driver_calls(1):
+            page = MetricsPage()
+            page.button.is_enabled()
+            page.button.is_enabled()
+
+    assert 'Actual: 2; Expected: 1' in str(exc.value)
+    assert 'Top elements: "button" (2)' in str(exc.value)
+    assert 'Top methods: "is_enabled" (2)' in str(exc.value)
+
+
+def test_max_driver_calls_counts_only_block(mocked_selenium_driver):
+    mocked_selenium_driver.metrics.enable()
+    MetricsPage().button.is_enabled()
+
+    with max_driver_calls(1) as result:
+        MetricsPage().button.is_enabled()
+
+    assert result[0].count == 1
+    assert mocked_selenium_driver.metrics.count == 2
+    assert mocked_selenium_driver.metrics.enabled
+
+
+def test_max_driver_calls_counts_new_sessions(mocked_selenium_driver):
+    with pytest.raises(DriverCallsBudgetException) as exc:
+        with max_driver_calls(1) as result:
+            new_driver_wrapper = get_mocked_selenium_driver(MockedDriverWrapper)
+            button = Element('.button', name='button', driver_wrapper=new_driver_wrapper)
+            button.is_enabled()
+            button.is_enabled()
+
+    assert 'Actual: 2; Expected: 1' in str(exc.value)
+    assert [metrics.count for metrics in result] == [0, 2]
+    assert not new_driver_wrapper.metrics.enabled
+    assert not mocked_selenium_driver.metrics.enabled
+
+
+def test_max_driver_calls_marker_passed(mocked_selenium_driver):
+    outcome = run_marked_test(pytest.mark.max_driver_calls(1).mark, MetricsPage().button.is_enabled)
+    assert outcome.excinfo is None
+
+
+def test_max_driver_calls_marker_failed(mocked_selenium_driver):
+    outcome = run_marked_test(pytest.mark.max_driver_calls(0).mark, MetricsPage().button.is_enabled)
+    assert isinstance(outcome.exception, DriverCallsBudgetException)
+
+
+def test_max_driver_calls_marker_test_failure_kept(mocked_selenium_driver):
+    def test():
+        MetricsPage().button.is_enabled()
+        raise AssertionError('test failure')
+
+    outcome = run_marked_test(pytest.mark.max_driver_calls(0).mark, test)
+    assert isinstance(outcome.exception, AssertionError)
+    assert not mocked_selenium_driver.metrics.enabled
+
+
+def test_without_marker(mocked_selenium_driver):
+    outcome = run_marked_test(None, MetricsPage().button.is_enabled)
+    assert outcome.excinfo is None
+    assert not mocked_selenium_driver.metrics.enabled
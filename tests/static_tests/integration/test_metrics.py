@@ -0,0 +1,143 @@
+import json
+from functools import partial
+from unittest.mock import MagicMock
+
+from playwright.sync_api import Page as PlaywrightPage
+
+from mops.base.driver_wrapper import DriverWrapperSessions
+from mops.base.element import Element
+from mops.base.page import Page
+from mops.mixins.objects.command_stats import CommandStats
+from mops.mixins.objects.driver import Driver
+from mops.selenium.core.core_driver import CoreDriver
+from mops.utils.metrics import MOPS_PATH, _get_playwright_metrics, _playwright_contexts_metrics, get_command_origin
+from tests.static_tests.conftest import MockedDriverWrapper
+
+
+class MetricsPage(Page):
+    def __init__(self):
+        super().__init__('.page', name='metrics page')
+
+    button = Element('.button', name='button')
+
+
+def test_metrics_disabled_by_default(mocked_selenium_driver):
+    assert not mocked_selenium_driver.metrics.enabled
+    mocked_selenium_driver.driver.execute('getTitle')
+    assert mocked_selenium_driver.metrics.count == 0
+
+
+def test_metrics_command_recorded(mocked_selenium_driver):
+    metrics = mocked_selenium_driver.metrics.enable()
+    mocked_selenium_driver.driver.execute('getTitle')
+    mocked_selenium_driver.driver.execute('getTitle')
+    stats = metrics.get_stats()
+    assert metrics.count == 2
+    assert stats['getTitle'].count == 2
+    assert stats['getTitle'].duration >= stats['getTitle'].max_duration
+
+
+def test_metrics_element_attribution(mocked_selenium_driver):
+    metrics = mocked_selenium_driver.metrics.enable()
+    page = MetricsPage()
+    page.button.is_enabled()
+    assert metrics.get_stats('element')['button'].count == 1
+    assert metrics.get_stats('page') == {}
+    assert set(metrics.get_stats('method')) == {'is_enabled'}
+    assert set(metrics.get_stats('command')) == {'findElement'}
+
+
+def test_metrics_page_attribution(mocked_selenium_driver):
+    mocked_selenium_driver.refresh = partial(CoreDriver.refresh, mocked_selenium_driver)
+    metrics = mocked_selenium_driver.metrics.enable()
+    MetricsPage().reload_page(wait_page_load=False)
+    assert metrics.get_stats('page')['metrics page'].count == 1
+    assert set(metrics.get_stats('method')) == {'reload_page'}
+    assert set(metrics.get_stats('command')) == {'refresh'}
+
+
+def test_metrics_disable(mocked_selenium_driver):
+    driver = mocked_selenium_driver.driver
+    metrics = mocked_selenium_driver.metrics.enable().disable()
+    assert 'execute' not in vars(driver)
+    driver.execute('getTitle')
+    assert metrics.count == 0
+
+
+def test_metrics_reset(mocked_selenium_driver):
+    metrics = mocked_selenium_driver.metrics.enable()
+    mocked_selenium_driver.driver.execute('getTitle')
+    assert metrics.reset().count == 0
+
+
+def test_metrics_dump(mocked_selenium_driver, tmp_path):
+    metrics = mocked_selenium_driver.metrics.enable()
+    MetricsPage().button.is_enabled()
+    path = tmp_path / 'metrics.json'
+    metrics.dump(str(path))
+    data = json.loads(path.read_text())
+    assert data['label'] == mocked_selenium_driver.label
+    assert data['count'] == 1
+    assert data['elements']['button']['count'] == 1
+    assert {record['command'] for record in data['records']} == {'findElement'}
+
+
+def test_metrics_playwright_classes_restored(mocked_play_driver):
+    original_evaluate = vars(PlaywrightPage)['evaluate']
+    metrics = mocked_play_driver.metrics.enable()
+    assert vars(PlaywrightPage)['evaluate'] is not original_evaluate
+    assert _get_playwright_metrics(mocked_play_driver.driver) is metrics
+
+    metrics.disable()
+    assert vars(PlaywrightPage)['evaluate'] is original_evaluate
+    assert _get_playwright_metrics(mocked_play_driver.driver) is None
+    assert len(_playwright_contexts_metrics) == 0
+
+
+def test_metrics_playwright_shared_context(mocked_play_driver):
+    page = PlaywrightPage(MagicMock())
+    page._impl_obj.context = mocked_play_driver.driver._impl_obj.context
+    second_driver_wrapper = MockedDriverWrapper(Driver(driver=page, instance=mocked_play_driver.instance))
+
+    try:
+        first_metrics = mocked_play_driver.metrics.enable()
+        second_metrics = second_driver_wrapper.metrics.enable()
+        assert len(_playwright_contexts_metrics) == 1
+        assert _get_playwright_metrics(mocked_play_driver.driver) is first_metrics
+        assert _get_playwright_metrics(page) is second_metrics
+
+        first_metrics.disable()
+        assert _get_playwright_metrics(page) is second_metrics
+    finally:
+        second_driver_wrapper.metrics.disable()
+        DriverWrapperSessions.remove_session(second_driver_wrapper)
+
+    assert len(_playwright_contexts_metrics) == 0
+
+
+def test_metrics_disabled_on_quit(mocked_play_driver):
+    mocked_play_driver._base_cls = MagicMock()
+    metrics = mocked_play_driver.metrics.enable()
+    mocked_play_driver.quit(silent=True)
+    assert not metrics.enabled
+    assert len(_playwright_contexts_metrics) == 0
+
+
+def test_command_origin_outside_mops_directory():
+    class Plugin:
+        def run(self):
+            return get_command_origin()
+
+    namespace = {'get_command_origin': get_command_origin}
+    exec(compile('def run(self):\n    return get_command_origin()', f'{MOPS_PATH}_plugin/plugin.py', 'exec'), namespace)
+    assert namespace['run'](Plugin()) == (None, None, None)
+
+
+def test_command_stats():
+    stats = CommandStats()
+    stats.add(1)
+    stats.add(3)
+    other = CommandStats()
+    other.add(5)
+    stats.merge(other)
+    assert (stats.count, stats.duration, stats.max_duration, stats.average_duration) == (3, 9, 5, 3)
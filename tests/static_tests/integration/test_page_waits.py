@@ -0,0 +1,129 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mops.base.element import Element
+from mops.base.page import Page
+from mops.exceptions import TimeoutException
+from mops.js_scripts import get_children_snapshot_js, get_page_state_js
+from mops.mixins.objects.polling_strategy import FixedPolling
+from mops.mixins.objects.snapshot import ElementSnapshot
+from mops.playwright.play_element import PlayElement
+
+
+class LoadingPage(Page):
+    def __init__(self):
+        super().__init__('.page', name='loading page')
+
+    url = 'https://example.com/loading'
+
+    header = Element('.header', name='header', wait=True)
+    footer = Element('.footer', name='footer', wait=True)
+    spinner = Element('.spinner', name='spinner', wait=False)
+    optional = Element('.optional', name='optional')
+
+
+class PlaywrightSelectorsPage(Page):
+    def __init__(self):
+        super().__init__('.page', name='playwright page')
+
+    url = 'https://example.com/loaded'
+
+    status = Element('.status:has-text("Loaded")', name='status', wait=True)
+
+
+visible, hidden, absent = {'present': True, 'displayed': True}, {'present': True, 'displayed': False}, {'present': False}
+
+
+@pytest.fixture
+def loading_page(mocked_selenium_driver):
+    mocked_selenium_driver.polling_strategy = FixedPolling(0.01)
+    mocked_selenium_driver.driver.execute_script = MagicMock()
+    return LoadingPage()
+
+
+def test_wait_page_loaded_single_call_per_iteration(loading_page, mocked_selenium_driver):
+    mocked_selenium_driver.driver.execute_script.side_effect = [
+        {'anchor': visible, 'header': absent, 'footer': visible, 'spinner': visible},
+        {'anchor': visible, 'header': visible, 'footer': visible, 'spinner': absent},
+    ]
+
+    assert loading_page.wait_page_loaded(timeout=1) == loading_page
+
+    assert mocked_selenium_driver.driver.execute_script.call_count == 2
+    script, chains, fields, attributes = mocked_selenium_driver.driver.execute_script.call_args.args
+    assert script == get_children_snapshot_js
+    assert list(chains) == ['anchor', 'header', 'footer', 'spinner']
+    assert fields == ['displayed']
+
+
+def test_wait_page_loaded_reports_unsatisfied_elements(loading_page, mocked_selenium_driver):
+    mocked_selenium_driver.driver.execute_script.return_value = {
+        'anchor': visible, 'header': hidden, 'footer': visible, 'spinner': visible,
+    }
+
+    with pytest.raises(TimeoutException) as exc:
+        loading_page.wait_page_loaded(timeout=0.1)
+
+    assert exc.value.msg == (
+        'Page "loading page" is not loaded after 0.1 seconds: "header" is not visible, "spinner" is still visible'
+    )
+
+
+def test_is_page_opened_single_call(loading_page, mocked_selenium_driver):
+    mocked_selenium_driver.driver.execute_script.return_value = {
+        'snapshots': {'anchor': visible, 'header': visible, 'footer': visible},
+        'url': 'https://example.com/loading',
+    }
+
+    assert loading_page.is_page_opened(with_elements=True, with_url=True)
+
+    mocked_selenium_driver.driver.execute_script.assert_called_once()
+    script, chains, fields, attributes = mocked_selenium_driver.driver.execute_script.call_args.args
+    assert script == get_page_state_js
+    assert list(chains) == ['anchor', 'header', 'footer']
+    assert fields == ['displayed']
+
+
+@pytest.mark.parametrize('snapshots, url', [
+    ({'anchor': visible, 'header': absent, 'footer': visible}, 'https://example.com/loading'),
+    ({'anchor': hidden, 'header': visible, 'footer': visible}, 'https://example.com/loading'),
+    ({'anchor': visible, 'header': visible, 'footer': visible}, 'https://example.com/other'),
+])
+def test_is_page_opened_negative(loading_page, mocked_selenium_driver, snapshots, url):
+    mocked_selenium_driver.driver.execute_script.return_value = {'snapshots': snapshots, 'url': url}
+
+    assert not loading_page.is_page_opened(with_elements=True, with_url=True)
+
+
+@pytest.fixture
+def playwright_selectors_page(mocked_play_driver):
+    mocked_play_driver.polling_strategy = FixedPolling(0.01)
+    page = PlaywrightSelectorsPage()
+    page.status.is_available = MagicMock(return_value=True)
+    return page
+
+
+def test_wait_page_loaded_playwright_only_selector(playwright_selectors_page, mocked_play_driver):
+    unresolvable = {'present': False, 'unresolvable': True}
+    mocked_play_driver.driver.evaluate = MagicMock(return_value={'anchor': visible, 'status': unresolvable})
+    snapshots = [ElementSnapshot(present=True, displayed=False), ElementSnapshot(present=True, displayed=True)]
+
+    with patch.object(PlayElement, 'snapshot', side_effect=snapshots) as snapshot:
+        assert playwright_selectors_page.wait_page_loaded(timeout=1) == playwright_selectors_page
+
+    assert snapshot.call_count == 2
+    assert mocked_play_driver.driver.evaluate.call_count == 2
+
+
+def test_is_page_opened_playwright_only_selector(playwright_selectors_page, mocked_play_driver):
+    mocked_play_driver.driver.evaluate = MagicMock(return_value={
+        'snapshots': {'anchor': visible, 'status': {'present': False, 'unresolvable': True}},
+        'url': 'https://example.com/loaded',
+    })
+
+    with patch.object(PlayElement, 'snapshot', return_value=ElementSnapshot(present=True, displayed=True)):
+        assert playwright_selectors_page.is_page_opened(with_elements=True, with_url=True)
+
+    with patch.object(PlayElement, 'snapshot', return_value=ElementSnapshot(present=True, displayed=False)):
+        assert not playwright_selectors_page.is_page_opened(with_elements=True, with_url=True)
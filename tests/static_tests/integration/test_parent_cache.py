@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from mops.base.element import Element
+from mops.base.group import Group
+from mops.selenium.core.core_driver import CoreDriver
+
+
+class InnerGroup(Group):
+    def __init__(self):
+        super().__init__('.inner', name='inner group')
+
+    child = Element('.child', name='child')
+
+
+class CachedSection(Group):
+    def __init__(self):
+        super().__init__('.section', name='section')
+
+    inner_group = InnerGroup()
+
+
+@pytest.fixture
+def cached_selenium_driver(mocked_selenium_driver):
+    mocked_selenium_driver.cache_parent_elements = True
+    yield mocked_selenium_driver
+
+
+def get_handles(driver_wrapper):
+    section_handle, inner_handle, child_handle = MagicMock(), MagicMock(), MagicMock()
+    driver_wrapper.driver.find_element = MagicMock(return_value=section_handle)
+    section_handle.find_element = MagicMock(return_value=inner_handle)
+    inner_handle.find_element = MagicMock(return_value=child_handle)
+    return section_handle, inner_handle, child_handle
+
+
+def test_parent_cache_disabled_by_default(mocked_selenium_driver):
+    section = CachedSection()
+    section_handle, inner_handle, child_handle = get_handles(mocked_selenium_driver)
+
+    assert section.inner_group.child._find_element() == child_handle
+    assert section.inner_group.child._find_element() == child_handle
+    assert mocked_selenium_driver.driver.find_element.call_count == 2
+    assert section_handle.find_element.call_count == 2
+
+
+def test_parent_cache_reuses_resolved_chain(cached_selenium_driver):
+    section = CachedSection()
+    section_handle, inner_handle, child_handle = get_handles(cached_selenium_driver)
+
+    for _ in range(3):
+        assert section.inner_group.child._find_element() == child_handle
+
+    assert cached_selenium_driver.driver.find_element.call_count == 1
+    assert section_handle.find_element.call_count == 1
+    assert inner_handle.find_element.call_count == 3
+
+
+def test_parent_cache_re_resolve_from_stale_level(cached_selenium_driver):
+    section = CachedSection()
+    section_handle, inner_handle, child_handle = get_handles(cached_selenium_driver)
+    section.inner_group.child._find_element()
+
+    new_inner_handle = MagicMock()
+    new_inner_handle.find_element = MagicMock(return_value=child_handle)
+    inner_handle.find_element.side_effect = StaleElementReferenceException('stale')
+    section_handle.find_element.return_value = new_inner_handle
+
+    assert section.inner_group.child._find_element() == child_handle
+    assert cached_selenium_driver.driver.find_element.call_count == 1, 'not stale level re-resolved'
+    assert section_handle.find_element.call_count == 2
+    assert section.inner_group._resolved_element == new_inner_handle
+
+
+def test_parent_cache_reset_after_frame_switch(cached_selenium_driver):
+    section = CachedSection()
+    section_handle, inner_handle, child_handle = get_handles(cached_selenium_driver)
+    section.inner_group.child._find_element()
+    cached_selenium_driver.driver._switch_to = MagicMock()
+    CoreDriver.switch_to_default_content(cached_selenium_driver)
+    section.inner_group.child._find_element()
+
+    assert cached_selenium_driver.driver.find_element.call_count == 2
@@ -0,0 +1,36 @@
+import pytest
+
+
+marked_test = """
+import pytest
+
+
+@pytest.mark.max_driver_calls(0)
+def test_marked(max_driver_calls):
+    with max_driver_calls(0) as result:
+        pass
+
+    assert result == []
+"""
+
+
+@pytest.mark.parametrize('args, conftest', [
+    (('-p', 'mops.pytest_plugin'), None),
+    ((), "pytest_plugins = ['mops.pytest_plugin']"),
+], ids=['command line option', 'pytest_plugins'])
+def test_pytest_plugin_enabled(pytester, args, conftest):
+    if conftest:
+        pytester.makeconftest(conftest)
+
+    pytester.makepyfile(marked_test)
+    result = pytester.runpytest('--strict-markers', *args)
+
+    result.assert_outcomes(passed=1)
+
+
+def test_pytest_plugin_not_loaded_automatically(pytester):
+    pytester.makepyfile(marked_test)
+    result = pytester.runpytest()
+
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(["*fixture 'max_driver_calls' not found*"])
@@ -0,0 +1,101 @@
+from typing import Type
+
+from unittest.mock import MagicMock
+
+from playwright.sync_api import Browser, Page as PlaywrightSourcePage
+from appium.webdriver.webdriver import WebDriver as AppiumDriver
+from selenium.webdriver.remote.webdriver import WebDriver as SeleniumDriver
+
+from mops.base.driver_wrapper import DriverWrapper, DriverWrapperSessions
+from mops.mixins.objects.driver import Driver
+from mops.playwright.play_driver import PlayDriver
+from mops.selenium.core.core_driver import CoreDriver
+
+
+ios_capabilities = {'platformName': 'ios', 'browserName': 'safari', 'automationName': 'safari'}
+android_capabilities = {'platformName': 'Android', 'browserName': 'chrome', 'automationName': 'UiAutomator2'}
+
+
+def mock_selenium_driver_class() -> Type[SeleniumDriver]:
+    """
+    Patch Selenium driver class, so it doesn't start the session and doesn't send any commands
+
+    :return: patched Selenium driver class
+    """
+    selenium_driver = SeleniumDriver
+    selenium_driver.__init__ = lambda *args, **kwargs: None
+    selenium_driver.session_id = None
+    selenium_driver.command_executor = MagicMock()
+    selenium_driver.error_handler = MagicMock()
+    selenium_driver.caps = {}
+    return selenium_driver
+
+
+def mock_appium_driver_class() -> Type[AppiumDriver]:
+    """
+    Patch Appium driver class, so it doesn't start the session and doesn't send any commands.
+    The `capabilities` should be set by the caller
+
+    :return: patched Appium driver class
+    """
+    appium_driver = AppiumDriver
+    appium_driver.__init__ = lambda *args, **kwargs: None
+    appium_driver.session_id = None
+    appium_driver.command_executor = MagicMock()
+    appium_driver.error_handler = MagicMock()
+    return appium_driver
+
+
+def get_mocked_selenium_driver(wrapper_class: Type[DriverWrapper] = DriverWrapper, **driver_kwargs) -> DriverWrapper:
+    """
+    Get driver wrapper of Selenium driver, that doesn't send any commands
+
+    :param wrapper_class: driver wrapper class to initialize
+    :param driver_kwargs: additional arguments of :class:`.Driver`
+    :return: DriverWrapper
+    """
+    return wrapper_class(Driver(driver=mock_selenium_driver_class()(), **driver_kwargs))
+
+
+def get_mocked_play_driver(wrapper_class: Type[DriverWrapper] = DriverWrapper, **driver_kwargs) -> DriverWrapper:
+    """
+    Get driver wrapper of Playwright page, that doesn't send any commands
+
+    :param wrapper_class: driver wrapper class to initialize
+    :param driver_kwargs: additional arguments of :class:`.Driver`
+    :return: DriverWrapper
+    """
+    return wrapper_class(
+        Driver(driver=PlaywrightSourcePage(MagicMock()), instance=Browser(MagicMock()), **driver_kwargs)
+    )
+
+
+def get_mocked_appium_driver(capabilities: dict, wrapper_class: Type[DriverWrapper] = DriverWrapper) -> DriverWrapper:
+    """
+    Get driver wrapper of Appium driver, that doesn't send any commands
+
+    :param capabilities: capabilities of the driver, e.g. :obj:`ios_capabilities`
+    :param wrapper_class: driver wrapper class to initialize
+    :return: DriverWrapper
+    """
+    appium_driver = mock_appium_driver_class()
+    appium_driver.capabilities = capabilities
+    return wrapper_class(Driver(driver=appium_driver()))
+
+
+def reset_sessions() -> None:
+    """
+    Remove all sessions and reset the statics of driver wrappers
+
+    :return: None
+    """
+    DriverWrapper.is_multiplatform = False
+    DriverWrapper.is_mobile = False
+    DriverWrapper.is_desktop = False
+    DriverWrapper.is_ios = False
+    DriverWrapper.is_android = False
+    DriverWrapper.is_selenium = False
+    DriverWrapper.is_playwright = False
+    PlayDriver.driver = None
+    CoreDriver.driver = None
+    DriverWrapperSessions.all_sessions = []
@@ -0,0 +1,80 @@
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from mops.utils.logs import Logging, LogLevel, logger, set_code_info_capture
+
+
+class LoggedObject(Logging):
+    driver_wrapper = SimpleNamespace(label='1_driver')
+    _get_code_info = MagicMock(return_value='[module.py][function:1]')
+
+
+@pytest.fixture
+def logged_object():
+    LoggedObject._get_code_info.reset_mock()
+    yield LoggedObject()
+    set_code_info_capture(True)
+
+
+def test_log_format_args(caplog, logged_object):
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        logged_object.log('Click into "%s"', 'button 100%')
+
+    assert caplog.messages == ['[1_driver][module.py][function:1] Click into "button 100%"']
+
+
+@pytest.mark.parametrize('message, expected', [
+    ('Debug message', 'Debug message'),
+    ('Progress 100%', 'Progress 100%'),
+    (lambda: 'Lazy message', 'Lazy message'),
+])
+def test_log_positional_level(caplog, logged_object, message, expected):
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        logged_object.log(message, LogLevel.DEBUG)
+
+    assert caplog.messages == []
+
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        logged_object.log(message, 'DEBUG')
+
+    assert caplog.messages == [f'[1_driver][module.py][function:1] {expected}']
+    assert caplog.records[0].levelno == logging.DEBUG
+
+
+def test_log_level_value_as_format_arg(caplog, logged_object):
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        logged_object.log('Set "%s" level', LogLevel.DEBUG)
+
+    assert caplog.messages == ['[1_driver][module.py][function:1] Set "debug" level']
+    assert caplog.records[0].levelno == logging.INFO
+
+
+def test_log_callable(caplog, logged_object):
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        logged_object.log(lambda: 'Lazy message')
+
+    assert caplog.messages == ['[1_driver][module.py][function:1] Lazy message']
+
+
+def test_log_skipped_for_disabled_level(caplog, logged_object):
+    message = MagicMock(return_value='Debug message')
+
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        logged_object.log(message, level=LogLevel.DEBUG)
+
+    message.assert_not_called()
+    logged_object._get_code_info.assert_not_called()
+    assert caplog.messages == []
+
+
+def test_log_without_code_info(caplog, logged_object):
+    set_code_info_capture(False)
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        logged_object.log('Message')
+
+    logged_object._get_code_info.assert_not_called()
+    assert caplog.messages == ['[1_driver] Message']
@@ -0,0 +1,137 @@
+import time
+from types import SimpleNamespace
+from typing import Optional, Union
+
+import pytest
+
+from mops.exceptions import TimeoutException
+from mops.mixins.objects.polling_strategy import (
+    PollingStrategy,
+    FixedPolling,
+    ExponentialPolling,
+    JitteredPolling,
+    DeadlineAwarePolling,
+)
+from mops.mixins.objects.wait_result import Result
+from mops.utils.internal_utils import wait_condition, get_polling_strategy
+from mops.utils.logs import autolog
+
+
+class RecordingPolling(PollingStrategy):
+
+    def __init__(self):
+        self.calls = []
+
+    def get_delay(self, iteration: int, remaining: float) -> float:
+        self.calls.append(iteration)
+        return 0
+
+
+class MockNamespace:
+
+    def __init__(self, call_count: int, is_mobile: bool = False, polling_strategy: PollingStrategy = None):
+        self.call_count = call_count
+        self.actual_call_count = 0
+        self.driver_wrapper = SimpleNamespace(is_appium=is_mobile, polling_strategy=polling_strategy)
+
+    def log(self, *args, **kwargs):
+        return autolog(*args, **kwargs)
+
+    @wait_condition
+    def wait_something(
+            self,
+            *,
+            timeout: Union[int, float] = 1,
+            silent: bool = False,
+            polling: Optional[PollingStrategy] = None,
+    ):
+        self.actual_call_count += 1
+        return Result(  # noqa
+            execution_result=self.actual_call_count > self.call_count,
+            log='wait something',
+            exc=TimeoutException('wait some condition failed!'),
+        )
+
+
+def test_fixed_polling():
+    assert [FixedPolling(0.2).get_delay(i, remaining=10) for i in range(1, 4)] == [0.2, 0.2, 0.2]
+
+
+def test_exponential_polling():
+    delays = [ExponentialPolling().get_delay(i, remaining=10) for i in range(1, 8)]
+    assert delays == [0.1, 0.2, 0.4, 0.8, 1.6, 1.6, 1.6]
+
+
+def test_jittered_polling():
+    delays = [JitteredPolling(FixedPolling(1), jitter=0.2).get_delay(1, remaining=10) for _ in range(50)]
+    assert all(0.8 <= delay <= 1.2 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.parametrize('create_polling', [
+    lambda: FixedPolling(-0.1),
+    lambda: ExponentialPolling(initial_delay=-0.1),
+    lambda: ExponentialPolling(factor=-2),
+    lambda: ExponentialPolling(max_delay=-1),
+    lambda: JitteredPolling(jitter=-0.1),
+    lambda: JitteredPolling(jitter=1.5),
+], ids=['fixed delay', 'initial delay', 'factor', 'max delay', 'negative jitter', 'jitter above 1'])
+def test_polling_invalid_values(create_polling):
+    with pytest.raises(ValueError):
+        create_polling()
+
+
+def test_jittered_polling_bounds():
+    assert JitteredPolling(FixedPolling(0), jitter=1).get_delay(1, remaining=10) == 0
+    assert 0 <= JitteredPolling(FixedPolling(1), jitter=1).get_delay(1, remaining=10) <= 2
+
+
+def test_deadline_aware_polling():
+    polling = DeadlineAwarePolling(FixedPolling(1))
+    assert polling.get_delay(1, remaining=10) == 1
+    assert polling.get_delay(1, remaining=0.3) == 0.3
+    assert polling.get_delay(1, remaining=-0.1) == 0
+
+
+def test_polling_strategy_priority():
+    driver_polling, element_polling, call_polling = FixedPolling(1), FixedPolling(2), FixedPolling(3)
+    namespace = MockNamespace(call_count=0, polling_strategy=driver_polling)
+
+    assert get_polling_strategy(namespace) == driver_polling
+    namespace.polling_strategy = element_polling
+    assert get_polling_strategy(namespace) is element_polling
+    assert get_polling_strategy(namespace, call_polling) is call_polling
+
+
+@pytest.mark.parametrize('is_mobile, expected', [(False, FixedPolling()), (True, ExponentialPolling())])
+def test_default_polling_strategy(is_mobile, expected):
+    assert get_polling_strategy(MockNamespace(call_count=0, is_mobile=is_mobile)) == expected
+
+
+def test_polling_per_call_and_iterations_count():
+    namespace = MockNamespace(call_count=3, polling_strategy=FixedPolling(10))
+    polling = RecordingPolling()
+
+    namespace.wait_something(polling=polling)
+
+    assert polling.calls == [1, 2, 3]
+    assert namespace.last_wait_iterations == 4
+
+
+def test_iterations_count_of_failed_wait():
+    namespace = MockNamespace(call_count=100)
+
+    with pytest.raises(TimeoutException):
+        namespace.wait_something(timeout=0.35, polling=FixedPolling(0.1))
+
+    assert namespace.last_wait_iterations in (4, 5)
+
+
+def test_deadline_aware_polling_final_sleep():
+    namespace = MockNamespace(call_count=100)
+    start_time = time.time()
+
+    with pytest.raises(TimeoutException):
+        namespace.wait_something(timeout=0.3, polling=DeadlineAwarePolling(FixedPolling(1)))
+
+    assert time.time() - start_time < 0.5, 'final sleep is not shrunk to the remaining time'
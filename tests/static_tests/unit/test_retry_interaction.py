@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+import pytest
+from mock.mock import MagicMock
+from selenium.common.exceptions import (
+    ElementClickInterceptedException as SeleniumElementClickInterceptedException,
+    StaleElementReferenceException as SeleniumStaleElementReferenceException,
+)
+
+from mops.exceptions import ElementNotInteractableException, NoSuchElementException
+from mops.mixins.objects.polling_strategy import FixedPolling
+from mops.mixins.objects.retry_policy import RetryPolicy, default_retry_policy
+from mops.utils.internal_utils import get_retry_policy, retry_interaction
+
+
+RETRY_ON = (SeleniumElementClickInterceptedException, )
+STALE_ON = (SeleniumStaleElementReferenceException, )
+
+
+def get_element(policy=None):
+    return SimpleNamespace(
+        name='button',
+        retry_policy=policy or RetryPolicy(backoff=FixedPolling(delay=0)),
+        driver_wrapper=SimpleNamespace(retry_policy=None),
+        get_element_info=lambda: 'Selector="button"',
+    )
+
+
+def test_retry_interaction_passed_after_retries():
+    action = MagicMock(side_effect=[SeleniumElementClickInterceptedException(), SeleniumElementClickInterceptedException(), 'ok'])
+    on_stale = MagicMock()
+    assert retry_interaction(get_element(), action, RETRY_ON, STALE_ON, on_stale) == 'ok'
+    assert action.call_count == 3
+    assert not on_stale.called
+
+
+def test_retry_interaction_stale_element_resolved():
+    action = MagicMock(side_effect=[SeleniumStaleElementReferenceException(), 'ok'])
+    on_stale = MagicMock()
+    retry_interaction(get_element(), action, RETRY_ON, STALE_ON, on_stale)
+    assert on_stale.call_count == 1
+    assert 0 < on_stale.call_args.args[0] <= default_retry_policy.timeout
+
+
+def test_retry_interaction_stale_element_not_resolved():
+    action = MagicMock(side_effect=SeleniumStaleElementReferenceException())
+    on_stale = MagicMock(side_effect=NoSuchElementException('Unable to locate the "button"'))
+
+    with pytest.raises(ElementNotInteractableException) as exc:
+        retry_interaction(get_element(), action, RETRY_ON, STALE_ON, on_stale)
+
+    assert action.call_count == 1
+    assert 'Original error: Unable to locate the "button"' in str(exc.value)
+
+
+def test_retry_interaction_max_attempts():
+    action = MagicMock(side_effect=SeleniumElementClickInterceptedException('overlay'))
+    element = get_element(RetryPolicy(max_attempts=3, backoff=FixedPolling(delay=0)))
+
+    with pytest.raises(ElementNotInteractableException) as exc:
+        retry_interaction(element, action, RETRY_ON)
+
+    assert action.call_count == 3
+    assert 'after 3 attempts' in str(exc.value)
+    assert 'Original error: overlay' in str(exc.value)
+
+
+def test_retry_interaction_deadline():
+    action = MagicMock(side_effect=SeleniumElementClickInterceptedException())
+    element = get_element(RetryPolicy(timeout=0.2, backoff=FixedPolling(delay=0.05)))
+
+    with pytest.raises(ElementNotInteractableException):
+        retry_interaction(element, action, RETRY_ON)
+
+    assert 2 <= action.call_count <= 6
+
+
+def test_retry_interaction_not_retried_exception():
+    action = MagicMock(side_effect=ValueError())
+
+    with pytest.raises(ValueError):
+        retry_interaction(get_element(), action, RETRY_ON)
+
+    assert action.call_count == 1
+
+
+def test_get_retry_policy_priority():
+    element = get_element()
+    call_policy = RetryPolicy()
+    assert get_retry_policy(element, call_policy) is call_policy
+    assert get_retry_policy(element) is element.retry_policy
+    element.retry_policy = None
+    assert get_retry_policy(element) is default_retry_policy
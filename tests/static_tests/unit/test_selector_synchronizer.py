@@ -3,7 +3,16 @@ from types import SimpleNamespace
 import pytest
 from selenium.webdriver.common.by import By
 
-from mops.utils.selector_synchronizer import set_selenium_selector, set_playwright_locator
+from mops.mixins.objects.compiled_locator import CompiledLocator
+from mops.utils.selector_synchronizer import (
+    set_selenium_selector,
+    set_playwright_locator,
+    set_appium_selector,
+    compile_locator,
+    get_js_locator,
+    SELENIUM_ENGINE,
+    PLAYWRIGHT_ENGINE,
+)
 
 
 @pytest.mark.parametrize(
@@ -52,3 +61,35 @@ def test_set_playwright_locator(locator_input, expected_locator):
     assert expected_locator == mock_obj.locator
     assert expected_locator == mock_obj.log_locator
     assert expected_locator.partition('=')[0] == mock_obj.locator_type
+
+
+def test_set_appium_selector_android_id():
+    mock_obj = SimpleNamespace(locator='com.android:id/button')
+    set_appium_selector(mock_obj)
+    assert mock_obj.locator == 'com.android:id/button'
+    assert mock_obj.locator_type == By.CSS_SELECTOR
+    assert mock_obj.log_locator == 'id=com.android:id/button'
+
+
+def test_compile_locator_cached():
+    compiled_locator = compile_locator('.cached', SELENIUM_ENGINE)
+    assert compiled_locator == CompiledLocator(By.CSS_SELECTOR, '.cached', 'css=.cached')
+    assert compile_locator('.cached', SELENIUM_ENGINE) is compiled_locator
+    assert compile_locator('.cached', PLAYWRIGHT_ENGINE) == CompiledLocator('css', 'css=.cached', 'css=.cached')
+
+
+@pytest.mark.parametrize(
+    "locator_input, expected_js_locator",
+    [
+        ("text=Hello", {'type': 'text', 'value': 'Hello', 'relative': True}),
+        ("Some text", {'type': 'text', 'value': 'Some text', 'relative': True}),
+        ('text="Hello"', None),
+        ("text='Hello'", None),
+        ("text=/hel+o/i", None),
+    ],
+    ids=['unquoted', 'auto-detected', 'double quoted', 'single quoted', 'regex'],
+)
+def test_get_js_locator_playwright_text(locator_input, expected_js_locator):
+    mock_obj = SimpleNamespace(locator=locator_input, driver_wrapper=SimpleNamespace(is_playwright=True))
+    set_playwright_locator(mock_obj)
+    assert get_js_locator(mock_obj) == expected_js_locator
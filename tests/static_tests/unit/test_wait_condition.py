@@ -1,6 +1,7 @@
 import time
 from types import SimpleNamespace
 from typing import Union
+from unittest.mock import MagicMock
 
 import pytest
 from mops.exceptions import TimeoutException
@@ -14,10 +15,11 @@ namespace_default_cals_count = 3
 
 class MockNamespace:
 
-    def __init__(self, log_msg: str, call_count: int, is_mobile: bool = False):
+    def __init__(self, log_msg: str, call_count: int, is_mobile: bool = False, log_args: tuple = ()):
         self.call_count = call_count
         self.actual_call_count = 0
         self.log_msg = log_msg
+        self.log_args = log_args
         self.driver_wrapper = SimpleNamespace()
         self.driver_wrapper.is_appium = is_mobile
 
@@ -38,6 +40,7 @@ class MockNamespace:
             execution_result=self.get_result(),
             log=self.log_msg,
             exc=TimeoutException('wait some condition failed!'),
+            log_args=self.log_args,
         )
 
 
@@ -80,6 +83,13 @@ def test_wait_condition_silent(caplog):
     assert caplog.messages == [], 'unexpected log messages found'
 
 
+def test_wait_condition_log_args_passed_for_lazy_formatting():
+    namespace = MockNamespace('wait "%s" condition', call_count=2, log_args=('some',))
+    namespace.log = MagicMock()
+    namespace.wait_something()
+    namespace.log.assert_called_once_with('wait "%s" condition', 'some')
+
+
 def test_wait_condition_non_named_arg():
     namespace = MockNamespace('wait some condition', call_count=1)
     try:
@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy
+import pytest
+
+from mops.mixins.objects.comparison_engine import PixelDiffEngine, PerceptualHashEngine, SSIMEngine
+from mops.visual_comparison import VisualComparison
+
+DIFF_COLOR = (0, 255, 0)
+
+
+@pytest.fixture
+def line_images():
+    reference = numpy.full((20, 20, 3), 255, dtype='uint8')
+    reference[:, 10] = 0
+    actual = reference.copy()
+    actual[:, 11] = 128  # anti-aliased edge of the line
+    return reference, actual
+
+
+def get_blocks_image():
+    blocks = numpy.random.default_rng(0).integers(0, 256, (8, 8, 3), dtype='uint8')
+    return blocks.repeat(8, axis=0).repeat(8, axis=1)
+
+
+@pytest.mark.parametrize('engine', [SSIMEngine(), PixelDiffEngine(), PerceptualHashEngine()])
+def test_engine_identical_images(engine):
+    reference = get_blocks_image()
+    diff, percent_diff = engine.get_difference(reference, reference.copy(), 0, DIFF_COLOR)
+    assert percent_diff == 0
+
+
+def test_pixel_diff_engine_difference():
+    reference = numpy.full((20, 10, 3), 255, dtype='uint8')
+    actual = reference.copy()
+    actual[5:10, 2:6] = (255, 0, 0)
+
+    diff, percent_diff = PixelDiffEngine().get_difference(reference, actual, 0, DIFF_COLOR)
+
+    assert percent_diff == 10
+    assert (diff[5:10, 2:6] == DIFF_COLOR).all()
+    assert (diff[:5] == 255).all()
+
+
+def test_pixel_diff_engine_color_threshold():
+    reference = numpy.full((10, 10, 3), 200, dtype='uint8')
+    actual = reference.copy()
+    actual[5, 5] = 205
+
+    assert PixelDiffEngine().get_difference(reference, actual, 0, DIFF_COLOR)[1] == 0
+    assert PixelDiffEngine(threshold=0.01).get_difference(reference, actual, 0, DIFF_COLOR)[1] == 1
+
+
+def test_pixel_diff_engine_ignores_anti_aliasing(line_images):
+    reference, actual = line_images
+    diff, percent_diff = PixelDiffEngine().get_difference(reference, actual, 0, DIFF_COLOR)
+    assert percent_diff == 0
+
+
+def test_pixel_diff_engine_includes_anti_aliasing(line_images):
+    reference, actual = line_images
+    diff, percent_diff = PixelDiffEngine(include_anti_aliasing=True).get_difference(reference, actual, 0, DIFF_COLOR)
+    assert percent_diff == 5
+    assert (diff[:, 11] == DIFF_COLOR).all()
+
+
+def test_pixel_diff_engine_not_anti_aliased_block(line_images):
+    reference, actual = line_images
+    actual[5:10, 11:16] = 0  # solid block isn't an edge
+    diff, percent_diff = PixelDiffEngine().get_difference(reference, actual, 0, DIFF_COLOR)
+    assert percent_diff > 0
+    assert (diff[6:9, 12:15] == DIFF_COLOR).all()
+
+
+def test_perceptual_hash_engine_ignores_noise():
+    reference = get_blocks_image()
+    actual = reference.copy()
+    actual[30, 30] = 0
+    diff, percent_diff = PerceptualHashEngine().get_difference(reference, actual, 0, DIFF_COLOR)
+    assert percent_diff == 0
+    assert diff is actual
+
+
+def test_perceptual_hash_engine_difference():
+    reference = get_blocks_image()
+    actual = reference[::-1, ::-1].copy()
+    diff, percent_diff = PerceptualHashEngine().get_difference(reference, actual, 0, DIFF_COLOR)
+    assert percent_diff > 0
+    assert (diff[0, 0] == DIFF_COLOR).all()
+
+
+def test_perceptual_hash_size():
+    assert PerceptualHashEngine(hash_size=16).get_hash(get_blocks_image()).shape == (16, 16)
+
+
+def test_comparison_engine_selection():
+    visual_comparison = VisualComparison(SimpleNamespace(execute_script=MagicMock()), MagicMock())
+    default_engine, engine = MagicMock(), MagicMock()
+    engine.get_difference.return_value = 'result'
+    visual_comparison.comparison_engine = default_engine
+    reference, actual = get_blocks_image(), get_blocks_image()
+
+    assert visual_comparison._get_difference(reference, actual, 1, engine) == 'result'
+    engine.get_difference.assert_called_once_with(reference, actual, 1, visual_comparison.diff_color_scheme)
+    default_engine.get_difference.assert_not_called()
+
+    visual_comparison._get_difference(reference, actual, 1)
+    default_engine.get_difference.assert_called_once()
+
+
+def test_default_comparison_engine():
+    assert isinstance(VisualComparison.comparison_engine, SSIMEngine)
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+import numpy
+import pytest
+
+from mops.mixins.objects import comparison_engine as comparison_engine_module
+from mops.mixins.objects.comparison_engine import SSIMEngine
+
+DIFF_COLOR = (0, 255, 0)
+
+
+@pytest.fixture
+def ssim(monkeypatch):
+    ssim = MagicMock(wraps=comparison_engine_module.structural_similarity)
+    monkeypatch.setattr(comparison_engine_module, 'structural_similarity', ssim)
+    return ssim
+
+
+def get_image(seed=0, size=(60, 80)):
+    return numpy.random.default_rng(seed).integers(0, 256, (*size, 3), dtype='uint8')
+
+
+def test_difference_identical_images(ssim):
+    reference = get_image()
+    diff, percent_diff = SSIMEngine().get_difference(reference, reference.copy(), 0, DIFF_COLOR)
+    assert percent_diff == 0
+    ssim.assert_not_called()
+
+
+def test_difference_same_grayscale(ssim):
+    reference = numpy.full((30, 40, 3), 100, dtype='uint8')
+    actual = reference.copy()
+    actual[5, 5] = (101, 100, 100)  # blue channel has the lowest weight in grayscale conversion
+    diff, percent_diff = SSIMEngine().get_difference(reference, actual, 0, DIFF_COLOR)
+    assert percent_diff == 0
+    ssim.assert_not_called()
+
+
+def test_difference_within_bound(ssim):
+    reference = get_image()
+    actual = reference.copy()
+    actual[30, 40] = 255 - actual[30, 40]
+    diff, percent_diff = SSIMEngine().get_difference(reference, actual, 5, DIFF_COLOR)
+    assert 0 < percent_diff <= 5
+    ssim.assert_not_called()
+
+
+def test_difference_calculated_by_ssim(ssim):
+    reference = get_image()
+    actual = reference.copy()
+    actual[10:40, 10:40] = 0
+    diff, percent_diff = SSIMEngine().get_difference(reference, actual, 0.1, DIFF_COLOR)
+    assert percent_diff > 0.1
+    assert diff.shape == reference.shape
+    ssim.assert_called_once()
+
+
+def test_difference_small_images(ssim):
+    reference = get_image(size=(5, 5))
+    actual = reference.copy()
+    actual[2, 2] = 255 - actual[2, 2]
+    with pytest.raises(ValueError):
+        SSIMEngine().get_difference(reference, actual, 100, DIFF_COLOR)
+    ssim.assert_called_once()
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_difference_bound_not_lower_than_ssim(seed):
+    rng = numpy.random.default_rng(seed)
+    reference = get_image(seed)[..., 0]
+    actual = reference.copy()
+    for y, x in rng.integers(0, 60, (rng.integers(1, 20), 2)):
+        actual[y, x] = rng.integers(0, 256)
+
+    score = comparison_engine_module.structural_similarity(reference, actual)
+    affected_mask = SSIMEngine._get_affected_mask(reference, actual)
+    assert SSIMEngine._get_difference_bound(affected_mask) >= 100 - score * 100
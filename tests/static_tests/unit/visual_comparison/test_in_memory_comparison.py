@@ -0,0 +1,93 @@
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+
+from mops import visual_comparison as visual_comparison_module
+from mops.mixins.objects.comparison_engine import PixelDiffEngine
+from mops.visual_comparison import VisualComparison
+
+
+@pytest.fixture
+def visual_comparison(tmp_path, monkeypatch):
+    default_path = VisualComparison.visual_regression_path
+    VisualComparison.visual_regression_path = str(tmp_path)
+    monkeypatch.setattr(visual_comparison_module.time, 'sleep', MagicMock())
+    element = MagicMock()
+    element.save_screenshot.side_effect = lambda file_name, screenshot_base: screenshot_base.save(file_name)
+    instance = VisualComparison(SimpleNamespace(execute_script=MagicMock()), element)
+    yield instance
+    VisualComparison.visual_regression_path = default_path
+
+
+def assert_screenshot(visual_comparison, image, threshold=None, engine=None):
+    visual_comparison.element_wrapper.screenshot_image.return_value = image
+    visual_comparison.assert_screenshot('screen', '', '', threshold, None, False, [], False, None, engine)
+
+
+def get_files(visual_comparison):
+    return {
+        directory: sorted(os.listdir(getattr(visual_comparison, f'{directory}_directory')))
+        for directory in ('reference', 'output', 'diff')
+    }
+
+
+def test_in_memory_comparison_passed(visual_comparison, monkeypatch):
+    image = Image.new('RGBA', (40, 30), 'red')
+    image.save(f'{visual_comparison.reference_directory}screen.png')
+    imread = MagicMock(wraps=visual_comparison_module.cv2.imread)
+    monkeypatch.setattr(visual_comparison_module.cv2, 'imread', imread)
+
+    assert_screenshot(visual_comparison, image, threshold=0.1)
+
+    assert imread.call_count == 1
+    assert get_files(visual_comparison) == {'reference': ['screen.png'], 'output': [], 'diff': []}
+    visual_comparison.element_wrapper.save_screenshot.assert_not_called()
+
+
+def test_in_memory_comparison_failed(visual_comparison):
+    Image.new('RGB', (40, 30), 'red').save(f'{visual_comparison.reference_directory}screen.png')
+    actual = Image.new('RGB', (40, 30), 'red')
+    actual.paste((0, 0, 255), (10, 10, 30, 20))
+
+    with pytest.raises(AssertionError, match='Visual mismatch found'):
+        assert_screenshot(visual_comparison, actual, threshold=0.1)
+
+    assert get_files(visual_comparison) == {'reference': ['screen.png'], 'output': ['screen.png'], 'diff': ['diff_screen.png']}
+
+
+def test_in_memory_comparison_different_sizes(visual_comparison):
+    Image.new('RGB', (40, 30), 'red').save(f'{visual_comparison.reference_directory}screen.png')
+
+    with pytest.raises(AssertionError, match='Image size'):
+        assert_screenshot(visual_comparison, Image.new('RGB', (30, 30), 'red'), threshold=0.1)
+
+    assert get_files(visual_comparison)['output'] == ['screen.png']
+
+
+def test_in_memory_comparison_with_engine(visual_comparison):
+    Image.new('RGB', (40, 30), 'red').save(f'{visual_comparison.reference_directory}screen.png')
+    actual = Image.new('RGB', (40, 30), 'red')
+    actual.paste((0, 0, 255), (0, 0, 4, 3))
+    engine = MagicMock(wraps=PixelDiffEngine())
+
+    with pytest.raises(AssertionError, match='Threshold is: 1.0;'):
+        assert_screenshot(visual_comparison, actual, threshold=0.5, engine=engine)
+
+    engine.get_difference.assert_called_once()
+
+
+def test_in_memory_comparison_reference_generated(visual_comparison):
+    with pytest.raises(AssertionError, match='not found'):
+        assert_screenshot(visual_comparison, Image.new('RGB', (40, 30), 'red'))
+
+    assert get_files(visual_comparison) == {'reference': ['screen.png'], 'output': [], 'diff': []}
+
+
+def test_to_cv2_image_same_as_imread(tmp_path):
+    image = Image.new('RGBA', (4, 4), (10, 20, 30, 128))
+    image.save(tmp_path / 'image.png')
+    expected = visual_comparison_module.cv2.imread(str(tmp_path / 'image.png'))
+    assert (VisualComparison._to_cv2_image(image) == expected).all()
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+
+from mops.visual_comparison import VisualComparison
+
+
+@pytest.fixture
+def visual_comparison(tmp_path):
+    default_path = VisualComparison.visual_regression_path
+    VisualComparison.visual_regression_path = str(tmp_path)
+    driver_wrapper = SimpleNamespace(is_playwright=False, is_appium=False, driver=MagicMock())
+    instance = VisualComparison(driver_wrapper, None)
+    instance.stable_screenshot_timeout = 1
+    yield instance
+    VisualComparison.visual_regression_path = default_path
+
+
+def get_images(*colors):
+    return [Image.new('RGB', (10, 10), color) for color in colors]
+
+
+def test_stable_screenshot_consecutive_equal(visual_comparison):
+    desired_obj = MagicMock()
+    desired_obj.screenshot_image.side_effect = get_images('red', 'blue', 'green', 'green', 'black')
+    image = visual_comparison._get_stable_screenshot_image(desired_obj)
+    assert desired_obj.screenshot_image.call_count == 4
+    assert image.getpixel((0, 0)) == (0, 128, 0)
+
+
+def test_stable_screenshot_timeout(visual_comparison):
+    visual_comparison.stable_screenshot_timeout = 0.1
+    desired_obj = MagicMock()
+    desired_obj.screenshot_image.side_effect = lambda: Image.effect_noise((10, 10), 100)
+    image = visual_comparison._get_stable_screenshot_image(desired_obj)
+    assert image.size == (10, 10)
+    assert desired_obj.screenshot_image.call_count >= 2
+
+
+def test_wait_for_animations_disabled(visual_comparison):
+    visual_comparison._wait_animations_finished(1)
+    visual_comparison.driver_wrapper.driver.execute_async_script.assert_not_called()
+
+
+def test_wait_for_animations_selenium(visual_comparison):
+    visual_comparison.wait_for_animations = True
+    desired_obj = MagicMock()
+    desired_obj.screenshot_image.side_effect = get_images('red', 'red')
+    visual_comparison._get_stable_screenshot_image(desired_obj)
+    assert visual_comparison.driver_wrapper.driver.execute_async_script.call_count == 2
+
+
+def test_wait_for_animations_playwright(visual_comparison):
+    visual_comparison.wait_for_animations = True
+    visual_comparison.driver_wrapper.is_playwright = True
+    visual_comparison._wait_animations_finished(0.5)
+    assert visual_comparison.driver_wrapper.driver.evaluate.call_args.args[1] == 500
+
+
+def test_stable_screenshot_skips_default_delay(visual_comparison, monkeypatch):
+    sleep = MagicMock()
+    monkeypatch.setattr('mops.visual_comparison.time.sleep', sleep)
+    visual_comparison.stable_screenshot = True
+    visual_comparison._save_screenshot = MagicMock()
+    visual_comparison.hard_visual_reference_generation = True
+    visual_comparison.assert_screenshot('name', '', '', None, None, False, [], False, None)
+    assert visual_comparison._save_screenshot.call_args.kwargs['delay'] == 0
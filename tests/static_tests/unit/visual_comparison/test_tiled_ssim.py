@@ -0,0 +1,68 @@
+from unittest.mock import MagicMock
+
+import numpy
+import pytest
+
+from mops.mixins.objects import comparison_engine as comparison_engine_module
+from mops.mixins.objects.comparison_engine import SSIMEngine
+
+DIFF_COLOR = (0, 255, 0)
+
+
+@pytest.fixture
+def engine():
+    return SSIMEngine(tile_size=16)
+
+
+def get_images(size, changes, seed=0):
+    rng = numpy.random.default_rng(seed)
+    reference = rng.integers(0, 256, size, dtype='uint8')
+    actual = reference.copy()
+    for top, left in changes:
+        actual[top:top + 3, left:left + 3] = rng.integers(0, 256, (3, 3))
+    return reference, actual
+
+
+@pytest.mark.parametrize('size, changes', [
+    ((50, 70), [(0, 0)]),
+    ((50, 70), [(20, 30), (47, 67)]),
+    ((33, 17), [(14, 14), (30, 0)]),
+    ((64, 64), [(15, 15), (40, 2)]),
+    ((7, 40), [(2, 35)]),
+])
+def test_tiled_ssim_same_as_whole(engine, size, changes):
+    reference, actual = get_images(size, changes)
+    affected_mask = engine._get_affected_mask(reference, actual)
+
+    score, diff = engine._get_tiled_ssim(reference, actual, affected_mask)
+    expected_score, expected_diff = comparison_engine_module.structural_similarity(reference, actual, full=True)
+
+    assert score == pytest.approx(expected_score, abs=1e-9)
+    assert numpy.abs(diff.astype(int) - (expected_diff * 255).astype('uint8')).max() <= 1
+
+
+def test_tiled_ssim_skips_unaffected_tiles(engine, monkeypatch):
+    ssim = MagicMock(wraps=comparison_engine_module.structural_similarity)
+    monkeypatch.setattr(comparison_engine_module, 'structural_similarity', ssim)
+    reference, actual = get_images((64, 64), [(40, 40)])
+
+    engine._get_tiled_ssim(reference, actual, engine._get_affected_mask(reference, actual))
+
+    assert ssim.call_count == 1
+    region = ssim.call_args.args[0]
+    assert region.shape == (22, 22)
+
+
+def test_tiled_ssim_small_images(engine):
+    reference, actual = get_images((5, 40), [(1, 1)])
+    with pytest.raises(ValueError):
+        engine._get_tiled_ssim(reference, actual, engine._get_affected_mask(reference, actual))
+
+
+def test_difference_with_tiles_same_as_whole(engine):
+    reference, actual = get_images((60, 80, 3), [(10, 10), (50, 70)])
+    diff, percent_diff = engine.get_difference(reference, actual, 0, DIFF_COLOR)
+    expected_diff, expected_percent_diff = SSIMEngine(tile_size=1000).get_difference(reference, actual, 0, DIFF_COLOR)
+
+    assert percent_diff == pytest.approx(expected_percent_diff, abs=1e-6)
+    assert numpy.array_equal(diff, expected_diff)
@@ -113,6 +113,15 @@ def test_element_execute_script(forms_page, driver_wrapper):
     forms_page.controls_form.german_slider.execute_script('arguments[0].textContent = arguments[1];', new_text)
     assert forms_page.controls_form.german_slider.text == new_text
 
+
+@pytest.mark.parametrize('target', ['arguments[0]', 'arguments[0].parentElement'], ids=['element', 'parent'])
+def test_element_snapshot_transparent_not_displayed(forms_page, target):
+    slider = forms_page.controls_form.german_slider
+    assert slider.snapshot(fields=['displayed']).displayed
+    slider.execute_script(f'{target}.style.opacity = "0";')
+    assert not slider.snapshot(fields=['displayed']).displayed
+
+
 def test_element_locator_check(mouse_event_page, driver_wrapper):
     # Let's keep Elements here, for encapsulation purposes
     # Reformat test if any trouble occur